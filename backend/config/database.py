@@ -1,13 +1,93 @@
+import threading
+import time
 from sqlalchemy.engine.create import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm.decl_api import declarative_base
 from sqlalchemy.orm.session import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from typing import Any
 from .settings import settings
 
 DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+class PoolWaitStats:
+    """Time spent waiting for a pooled connection, shared by all workers"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, waited: float):
+        """A successful checkout"""
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def record_timeout(self, waited: float):
+        """A checkout that gave up after ``pool_timeout``"""
+        with self._lock:
+            self.timeouts += 1
+            self.max_wait = max(self.max_wait, waited)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3)
+            }
+
+pool_wait_stats = PoolWaitStats()
+async_pool_wait_stats = PoolWaitStats()
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection"""
+
+    def _wait_stats(self) -> PoolWaitStats:
+        return pool_wait_stats
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            # Other errors (e.g. the database refusing the connection) are not pool waits
+            self._wait_stats().record_timeout(time.perf_counter() - started)
+            raise
+        self._wait_stats().record(time.perf_counter() - started)
+        return connection
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """The async engine's pool, with its own wait statistics"""
+
+    def _wait_stats(self) -> PoolWaitStats:
+        return async_pool_wait_stats
+
+def engine_options(url: str, async_engine: bool = False) -> dict:
+    """Engine arguments. The sync and async engines each get their own pool
+    budget; a process can open both budgets' connections at once"""
+    options: dict = {"echo": settings.DB_ECHO, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if not url.startswith("sqlite"):
+        # SQLite keeps its own single-connection pools
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool if async_engine else InstrumentedQueuePool,
+            pool_size=settings.DB_ASYNC_POOL_SIZE if async_engine else settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_ASYNC_MAX_OVERFLOW if async_engine else settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return options
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+# The flush on commit issues INSERT ... RETURNING for generated keys, and
+# expire_on_commit=False keeps those values loaded, so repositories return
+# written objects without a refresh SELECT
+SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
 
 # Create the declarative base with Any type to avoid Pylance strictness
 Base: Any = declarative_base()
@@ -18,3 +98,52 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def async_database_url(url: str) -> str:
+    """Same database, async driver: asyncpg for PostgreSQL, aiosqlite for SQLite"""
+    scheme, rest = url.split("://", 1)
+    if scheme in ("postgresql", "postgresql+psycopg2", "postgres"):
+        return f"postgresql+asyncpg://{rest}"
+    if scheme == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    return url
+
+_async_engine: Any = None
+_async_sessionmaker: Any = None
+
+def get_async_sessionmaker():
+    # Built on first use so the async drivers stay optional for sync-only deployments
+    global _async_engine, _async_sessionmaker
+    if _async_sessionmaker is None:
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        _async_engine = create_async_engine(
+            async_database_url(DATABASE_URL), **engine_options(DATABASE_URL, async_engine=True)
+        )
+        _async_sessionmaker = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_sessionmaker
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+def _pool_stats(pool, wait_stats: PoolWaitStats, max_overflow: int) -> dict:
+    stats: dict = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=max_overflow,
+            timeout=settings.DB_POOL_TIMEOUT,
+        )
+    stats.update(wait_stats.snapshot())
+    return stats
+
+def get_pool_stats() -> dict:
+    """The sync pool at the top level and, once the async engine exists, its
+    pool under "async" """
+    stats = _pool_stats(engine.pool, pool_wait_stats, settings.DB_MAX_OVERFLOW)
+    if _async_engine is not None:
+        stats["async"] = _pool_stats(_async_engine.pool, async_pool_wait_stats, settings.DB_ASYNC_MAX_OVERFLOW)
+    return stats
@@ -0,0 +1,134 @@
+"""Schema upgrades for databases created before a model change.
+
+``Base.metadata.create_all`` only creates missing tables, so indexes added
+to existing tables never reach older databases. ``ensure_indexes`` creates
+every index declared on the models that is not there yet, and rebuilds one
+whose uniqueness changed (e.g. ``ix_USER_name`` becoming unique). It runs at
+startup and can also be run by hand:
+
+    python -m backend.config.migrations
+
+``backfill_health_summary`` and ``backfill_history_rollups`` fill
+pet_health_summary and history_rollup the first time they appear next to
+existing history. To recompute them from scratch:
+
+    python -m backend.config.migrations --rebuild-health-summary --rebuild-rollups
+
+Everything runs through ``upgrade_database``, which holds ``migration_lock``:
+when several workers start at once only one creates indexes and backfills,
+the others wait and then find nothing left to do.
+"""
+import argparse
+from contextlib import contextmanager
+from sqlalchemy import Column, Index, MetaData, Table, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.session import Session
+from typing import Iterator, List, Tuple
+from .database import Base, engine as default_engine
+from .. import models  # noqa: F401  (registers every table on Base.metadata)
+from ..models.relationships import Pet_history, Pet_health_summary, Pet_history_rollup
+from ..repositories.report_repository import ReportRepository
+from ..repositories.rollup_repository import RollupRepository
+
+def ensure_indexes(engine: Engine) -> List[str]:
+    """Create the model indexes missing from the database, or whose uniqueness
+    differs from the model, returning their names"""
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {index["name"]: index for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            found = existing.get(index.name)
+            if found is not None and bool(found["unique"]) == bool(index.unique):
+                continue
+            try:
+                with engine.begin() as conn:
+                    if found is not None:
+                        # Same name, created by a model with different uniqueness
+                        index.drop(bind=conn)
+                    index.create(bind=conn)
+                created.append(index.name)
+            except Exception as e:
+                # Typically a unique index over rows that already collide
+                print(f"⚠️  Could not create index {index.name}: {e}")
+                if found is not None:
+                    _restore_index(engine, table, found)
+    return created
+
+def _restore_index(engine: Engine, table, found: dict):
+    """Put back an index dropped for a rebuild that failed. DDL is transactional
+    on PostgreSQL, but the SQLite driver commits the DROP on its own"""
+    if any(index["name"] == found["name"] for index in inspect(engine).get_indexes(table.name)):
+        return
+    # Built on a throwaway Table so the model's own metadata is left alone
+    detached = Table(table.name, MetaData(), *(Column(column) for column in found["column_names"]),
+                     schema=table.schema)
+    Index(found["name"], *detached.c, unique=bool(found["unique"])).create(bind=engine)
+
+def backfill_health_summary(engine: Engine, force: bool = False) -> int:
+    """Build pet_health_summary from history_register when it is empty but
+    history exists (or always with ``force``), returning the pets summarised"""
+    with Session(bind=engine) as db:
+        if not force:
+            has_summary = db.query(Pet_health_summary.pet_id).first() is not None
+            has_history = db.query(Pet_history.hr_id).first() is not None
+            if has_summary or not has_history:
+                return 0
+        return ReportRepository.rebuild_health_summary(db)
+
+def backfill_history_rollups(engine: Engine, force: bool = False) -> int:
+    """Build history_rollup from history_register when it is empty but history
+    exists (or always with ``force``), returning the rollup rows written"""
+    with Session(bind=engine) as db:
+        if not force:
+            has_rollups = db.query(Pet_history_rollup.pet_id).first() is not None
+            has_history = db.query(Pet_history.hr_id).first() is not None
+            if has_rollups or not has_history:
+                return 0
+        return RollupRepository.rebuild(db)
+
+# Session advisory lock key shared by every process migrating the same database
+MIGRATION_LOCK_ID = 7_104_257
+
+@contextmanager
+def migration_lock(engine: Engine) -> Iterator[None]:
+    """Hold a PostgreSQL advisory lock while upgrading. Other databases run
+    unlocked: SQLite serves a single process"""
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+
+def upgrade_database(engine: Engine, rebuild_health_summary: bool = False,
+                     rebuild_rollups: bool = False) -> Tuple[List[str], int, int]:
+    """Create missing tables and indexes and run the backfills, once across
+    concurrent processes. Returns the indexes created, the pets summarised and
+    the rollup rows written"""
+    with migration_lock(engine):
+        Base.metadata.create_all(bind=engine)
+        names = ensure_indexes(engine)
+        pets = backfill_health_summary(engine, force=rebuild_health_summary)
+        rollups = backfill_history_rollups(engine, force=rebuild_rollups)
+    return names, pets, rollups
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rebuild-health-summary", action="store_true",
+                        help="recompute pet_health_summary from history_register")
+    parser.add_argument("--rebuild-rollups", action="store_true",
+                        help="recompute history_rollup from history_register")
+    args = parser.parse_args()
+    names, pets, rollups = upgrade_database(
+        default_engine, rebuild_health_summary=args.rebuild_health_summary, rebuild_rollups=args.rebuild_rollups
+    )
+    print(f"Created {len(names)} index(es): {', '.join(names) if names else '-'}")
+    print(f"Summarised health history for {pets} pet(s)")
+    print(f"Wrote {rollups} history rollup row(s)")
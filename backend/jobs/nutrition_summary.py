@@ -0,0 +1,40 @@
+"""Nutrition summary for every pet in the database, written as CSV.
+
+Reads the pet table in chunks of ``--chunk-size`` pets (one aggregate query
+per chunk), so memory use does not depend on the number of pets:
+
+    python -m backend.jobs.nutrition_summary [--output nutrition.csv] [--chunk-size 1000]
+"""
+import argparse
+import csv
+import sys
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.session import Session
+from typing import TextIO
+from ..config.database import engine as default_engine
+from ..services.nutrition_service import NutritionService
+
+COLUMNS = ("id", "name", "weight", "daily_calories", "resting_energy", "intake_ratio", "status")
+
+def run(engine: Engine, output: TextIO, chunk_size: int = 1000) -> int:
+    """Write the summary of every pet to ``output``, returning the pets written"""
+    writer = csv.DictWriter(output, fieldnames=COLUMNS)
+    writer.writeheader()
+    written = 0
+    with Session(bind=engine) as db:
+        for chunk in NutritionService.iter_nutrition(db, chunk_size):
+            writer.writerows(chunk)
+            written += len(chunk)
+    return written
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="CSV file to write (default: stdout)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="pets per query (default: 1000)")
+    args = parser.parse_args()
+    if args.output:
+        with open(args.output, "w", newline="") as output:
+            pets = run(default_engine, output, args.chunk_size)
+    else:
+        pets = run(default_engine, sys.stdout, args.chunk_size)
+    print(f"Summarised nutrition for {pets} pet(s)", file=sys.stderr)
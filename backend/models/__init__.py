@@ -2,12 +2,12 @@ from .user import User
 from .pet import Pet, Breed, Species
 from .medical import Medical_condition, Vaccine
 from .activity import Activity, Feeding
-from .relationships import Pet_medical_condition, Pet_vaccine, Pet_activity, Pet_feeding, Pet_history
+from .relationships import Pet_medical_condition, Pet_vaccine, Pet_activity, Pet_feeding, Pet_history, Pet_health_summary, Pet_history_rollup
 
 __all__ = [
     "User",
     "Pet", "Breed", "Species",
     "Medical_condition", "Vaccine",
     "Activity", "Feeding",
-    "Pet_medical_condition", "Pet_vaccine", "Pet_activity", "Pet_feeding", "Pet_history"
+    "Pet_medical_condition", "Pet_vaccine", "Pet_activity", "Pet_feeding", "Pet_history", "Pet_health_summary", "Pet_history_rollup"
 ]
\ No newline at end of file
@@ -13,7 +13,7 @@ class Pet(Base):
     date_of_birth = Column(Date) # Assuming Date is imported from datetime
     breed_id = Column(Integer)  # Foreign key to Breed table
     species_id = Column(Integer)  # Foreign key to species table
-    user_id = Column(Integer)  # Foreign key to User table
+    user_id = Column(Integer, index=True)  # Foreign key to User table
 
     @staticmethod
     def calculate_age(birthdate: date) -> int:
@@ -25,7 +25,7 @@ class Breed(Base):
     __tablename__ = "breed"
 
     breed_id = Column(Integer, primary_key=True, index=True)
-    species_id = Column(Integer)  # Foreign key to species table
+    species_id = Column(Integer, index=True)  # Foreign key to species table
     name = Column(String)
 
 class Species(Base):
@@ -1,5 +1,5 @@
-from sqlalchemy.sql.schema import Column, ForeignKey
-from sqlalchemy.sql.sqltypes import Integer, Date, Numeric
+from sqlalchemy.sql.schema import Column, ForeignKey, Index
+from sqlalchemy.sql.sqltypes import Integer, Date, Numeric, String
 from ..config.database import Base
 
 class Pet_medical_condition(Base):
@@ -35,3 +35,33 @@ class Pet_history(Base):
     pet_id = Column(Integer, ForeignKey("pet.pet_id"))
     date = Column(Date)  # Date of the history record
     body_metric = Column(Numeric(2, 1))  # Body metric value (e.g., weight, BMI, etc.)
+
+class Pet_health_summary(Base):
+    """Latest history_register values per pet, kept in step with every insert
+    by ReportRepository.create_pet_history"""
+    __tablename__ = "pet_health_summary"
+
+    pet_id = Column(Integer, ForeignKey("pet.pet_id"), primary_key=True)
+    latest_hr_id = Column(Integer)  # history_register row the latest values come from
+    latest_date = Column(Date)
+    latest_metric = Column(Numeric(2, 1))
+    previous_date = Column(Date)
+    previous_metric = Column(Numeric(2, 1))
+    delta = Column(Numeric(3, 1))  # latest_metric - previous_metric
+    record_count = Column(Integer, nullable=False, default=0)
+
+class Pet_history_rollup(Base):
+    """body_metric aggregates per pet per day, week (starting Monday) or month,
+    maintained on every history insert by RollupRepository"""
+    __tablename__ = "history_rollup"
+
+    pet_id = Column(Integer, ForeignKey("pet.pet_id"), primary_key=True)
+    period = Column(String(5), primary_key=True)  # "day", "week" or "month"
+    period_start = Column(Date, primary_key=True)
+    record_count = Column(Integer, nullable=False)
+    total = Column(Numeric(12, 1), nullable=False)  # sum of body_metric
+    min_metric = Column(Numeric(2, 1), nullable=False)
+    max_metric = Column(Numeric(2, 1), nullable=False)
+
+# Latest-record and time-range lookups per pet
+Index("ix_history_register_pet_id_date", Pet_history.pet_id, Pet_history.date.desc())
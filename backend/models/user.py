@@ -6,9 +6,9 @@ class User(Base):
     __tablename__ = "USER"
 
     user_id = Column(Integer, primary_key=True, index=True)
-    name = Column(String)
-    email = Column(String)
-    phone_number = Column(String)
+    name = Column(String, unique=True, index=True)
+    email = Column(String, unique=True, index=True)
+    phone_number = Column(String, unique=True, index=True)
     password_hash = Column(String)
 
     def password_to_hash(self, password: str):
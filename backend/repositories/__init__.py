@@ -3,11 +3,25 @@ from .pet_repository import PetRepository
 from .medical_repository import MedicalRepository
 from .activity_repository import ActivityRepository
 from .report_repository import ReportRepository
+from .rollup_repository import RollupRepository
+from .async_repositories import (
+    AsyncUserRepository,
+    AsyncPetRepository,
+    AsyncMedicalRepository,
+    AsyncActivityRepository,
+    AsyncReportRepository
+)
 
 __all__ = [
     "UserRepository",
     "PetRepository",
     "MedicalRepository", 
     "ActivityRepository",
-    "ReportRepository"
+    "ReportRepository",
+    "RollupRepository",
+    "AsyncUserRepository",
+    "AsyncPetRepository",
+    "AsyncMedicalRepository",
+    "AsyncActivityRepository",
+    "AsyncReportRepository"
 ]
\ No newline at end of file
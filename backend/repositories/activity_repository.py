@@ -1,6 +1,11 @@
 from sqlalchemy.orm.session import Session
+from sqlalchemy import func, select
+from typing import Any, Collection, Dict, List, Optional, Set, Tuple
+from .lookup import get_by_pk
+from .upsert import upsert_insert
 from ..models.activity import Activity, Feeding
 from ..models.relationships import Pet_activity, Pet_feeding
+from ..models.pet import Pet
 
 class ActivityRepository:
 
@@ -14,7 +19,41 @@ class ActivityRepository:
     
     @staticmethod
     def get_activity_by_id(db: Session, activity_id: int):
-        return db.query(Activity).filter(Activity.activity_id == activity_id).first()
+        return get_by_pk(db, Activity, activity_id)
+    
+    @staticmethod
+    def pet_and_activity_exist(db: Session, pet_id: int, activity_id: int) -> Tuple[bool, bool]:
+        """Check the pet and the activity together with one SELECT EXISTS(...), EXISTS(...)"""
+        row = db.query(
+            select(Pet.pet_id).where(Pet.pet_id == pet_id).exists(),
+            select(Activity.activity_id).where(Activity.activity_id == activity_id).exists()
+        ).one()
+        return bool(row[0]), bool(row[1])
+    
+    @staticmethod
+    def pet_and_feeding_exist(db: Session, pet_id: int, feeding_id: int) -> Tuple[bool, bool]:
+        """Check the pet and the feeding together with one SELECT EXISTS(...), EXISTS(...)"""
+        row = db.query(
+            select(Pet.pet_id).where(Pet.pet_id == pet_id).exists(),
+            select(Feeding.feeding_id).where(Feeding.feeding_id == feeding_id).exists()
+        ).one()
+        return bool(row[0]), bool(row[1])
+    
+    @staticmethod
+    def existing_activity_ids(db: Session, activity_ids: Collection[int]) -> Set[int]:
+        """The subset of ``activity_ids`` that exist, checked with one query"""
+        if not activity_ids:
+            return set()
+        query = db.query(Activity.activity_id).filter(Activity.activity_id.in_(activity_ids))
+        return {activity_id for (activity_id,) in query}
+    
+    @staticmethod
+    def existing_feeding_ids(db: Session, feeding_ids: Collection[int]) -> Set[int]:
+        """The subset of ``feeding_ids`` that exist, checked with one query"""
+        if not feeding_ids:
+            return set()
+        query = db.query(Feeding.feeding_id).filter(Feeding.feeding_id.in_(feeding_ids))
+        return {feeding_id for (feeding_id,) in query}
     
     @staticmethod
     def get_activities_by_pet(db: Session, pet_id: int):
@@ -27,7 +66,7 @@ class ActivityRepository:
     
     @staticmethod
     def get_feeding_by_id(db: Session, feeding_id: int):
-        return db.query(Feeding).filter(Feeding.feeding_id == feeding_id).first()
+        return get_by_pk(db, Feeding, feeding_id)
 
     @staticmethod
     def get_feedings_by_pet(db: Session, pet_id: int):
@@ -38,16 +77,73 @@ class ActivityRepository:
             .all()
         )
     
+    @staticmethod
+    def get_daily_calories(db: Session, user_id: Optional[int] = None, after_pet_id: Optional[int] = None,
+                           limit: Optional[int] = None):
+        """(pet_id, name, weight, daily_calories) per pet, summing calories x daily
+        meals over its feedings in one aggregate join (0 for pets without feedings).
+        Filtered to one user's pets when ``user_id`` is given; ordered by pet_id and
+        paged with ``after_pet_id``/``limit`` so the whole table can be read in chunks"""
+        daily_calories = func.coalesce(func.sum(Feeding.calories * Pet_feeding.daily_meal_frequency), 0)
+        query = (
+            db.query(Pet.pet_id, Pet.name, Pet.weight, daily_calories.label("daily_calories"))
+            .outerjoin(Pet_feeding, Pet_feeding.pet_id == Pet.pet_id)
+            .outerjoin(Feeding, Feeding.feeding_id == Pet_feeding.feeding_id)
+        )
+        if user_id is not None:
+            query = query.filter(Pet.user_id == user_id)
+        if after_pet_id is not None:
+            query = query.filter(Pet.pet_id > after_pet_id)
+        query = query.group_by(Pet.pet_id, Pet.name, Pet.weight).order_by(Pet.pet_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+    
     @staticmethod
     def create_pet_activity(db: Session, pet_activity: Pet_activity):
-        db.add(pet_activity)
-        db.commit()
-        db.refresh(pet_activity)
+        """Insert the pet activity, or update its frequency if the pair exists,
+        as one idempotent statement"""
+        ActivityRepository.upsert_pet_activities(db, [{
+            "pet_id": pet_activity.pet_id,
+            "activity_id": pet_activity.activity_id,
+            "weekly_frequency_activity": pet_activity.weekly_frequency_activity
+        }])
         return True
     
     @staticmethod
     def create_pet_feeding(db: Session, pet_feeding: Pet_feeding):
-        db.add(pet_feeding)
-        db.commit()
-        db.refresh(pet_feeding)
+        """Insert the pet feeding, or update its frequency if the pair exists,
+        as one idempotent statement"""
+        ActivityRepository.upsert_pet_feedings(db, [{
+            "pet_id": pet_feeding.pet_id,
+            "feeding_id": pet_feeding.feeding_id,
+            "daily_meal_frequency": pet_feeding.daily_meal_frequency
+        }])
         return True
+    
+    @staticmethod
+    def upsert_pet_activities(db: Session, rows: List[Dict[str, Any]]) -> int:
+        """Insert or update (pet_id, activity_id) frequencies with one executemany
+        INSERT ... ON CONFLICT DO UPDATE, committed together. Rows must not repeat a key"""
+        return ActivityRepository._upsert(db, Pet_activity.__table__, ["pet_id", "activity_id"],
+                                          "weekly_frequency_activity", rows)
+    
+    @staticmethod
+    def upsert_pet_feedings(db: Session, rows: List[Dict[str, Any]]) -> int:
+        """Same as upsert_pet_activities for (pet_id, feeding_id) daily meal frequencies"""
+        return ActivityRepository._upsert(db, Pet_feeding.__table__, ["pet_id", "feeding_id"],
+                                          "daily_meal_frequency", rows)
+    
+    @staticmethod
+    def _upsert(db: Session, table, keys: List[str], value: str, rows: List[Dict[str, Any]]) -> int:
+        if not rows:
+            return 0
+        try:
+            stmt = upsert_insert(db, table)
+            stmt = stmt.on_conflict_do_update(index_elements=keys, set_={value: stmt.excluded[value]})
+            db.execute(stmt, rows)
+            db.commit()
+            return len(rows)
+        except Exception:
+            db.rollback()
+            raise
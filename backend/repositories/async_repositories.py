@@ -0,0 +1,137 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Collection, Dict, List
+from .user_repository import UserRepository
+from .pet_repository import PetRepository
+from .medical_repository import MedicalRepository
+from .activity_repository import ActivityRepository
+from .report_repository import ReportRepository
+from ..models.user import User
+from ..models.pet import Pet
+from ..models.relationships import Pet_activity, Pet_feeding, Pet_history
+
+# Async variants of the repositories for routers that use get_async_db.
+# Each method runs the sync repository query through AsyncSession.run_sync,
+# so both paths share one implementation while the I/O goes through the
+# async driver (asyncpg / aiosqlite) without tying up a worker thread.
+
+class AsyncUserRepository:
+
+    @staticmethod
+    async def get_by_name(db: AsyncSession, name: str):
+        return await db.run_sync(UserRepository.get_by_name, name)
+
+    @staticmethod
+    async def get_by_email(db: AsyncSession, email: str):
+        return await db.run_sync(UserRepository.get_by_email, email)
+
+    @staticmethod
+    async def get_by_phone(db: AsyncSession, phone: str):
+        return await db.run_sync(UserRepository.get_by_phone, phone)
+
+    @staticmethod
+    async def create_user(db: AsyncSession, user: User):
+        return await db.run_sync(UserRepository.create_user, user)
+
+    @staticmethod
+    async def get_user_by_id(db: AsyncSession, user_id: int):
+        return await db.run_sync(UserRepository.get_user_by_id, user_id)
+
+class AsyncPetRepository:
+
+    @staticmethod
+    async def create(db: AsyncSession, pet: Pet):
+        return await db.run_sync(PetRepository.create, pet)
+
+    @staticmethod
+    async def get_user_pets(db: AsyncSession, user_id: int):
+        return await db.run_sync(PetRepository.get_user_pets, user_id)
+
+    @staticmethod
+    async def get_user_pets_with_names(db: AsyncSession, user_id: int):
+        return await db.run_sync(PetRepository.get_user_pets_with_names, user_id)
+
+    @staticmethod
+    async def get_pet_by_name_user(db: AsyncSession, name: str, user_id: int):
+        return await db.run_sync(PetRepository.get_pet_by_name_user, name, user_id)
+
+    @staticmethod
+    async def get_pet_by_id(db: AsyncSession, pet_id: int):
+        return await db.run_sync(PetRepository.get_pet_by_id, pet_id)
+
+    @staticmethod
+    async def existing_pet_ids(db: AsyncSession, pet_ids: Collection[int]):
+        return await db.run_sync(PetRepository.existing_pet_ids, pet_ids)
+
+class AsyncMedicalRepository:
+
+    @staticmethod
+    async def get_medical_conditions(db: AsyncSession):
+        return await db.run_sync(MedicalRepository.get_medical_conditions)
+
+    @staticmethod
+    async def get_vaccines(db: AsyncSession):
+        return await db.run_sync(MedicalRepository.get_vaccines)
+
+    @staticmethod
+    async def get_species(db: AsyncSession):
+        return await db.run_sync(MedicalRepository.get_species)
+
+    @staticmethod
+    async def get_breeds_by_species(db: AsyncSession, species_id: int):
+        return await db.run_sync(MedicalRepository.get_breeds_by_species, species_id)
+
+    @staticmethod
+    async def get_conditions_for_pets(db: AsyncSession, pet_ids: List[int]):
+        return await db.run_sync(MedicalRepository.get_conditions_for_pets, pet_ids)
+
+    @staticmethod
+    async def get_vaccines_for_pets(db: AsyncSession, pet_ids: List[int]):
+        return await db.run_sync(MedicalRepository.get_vaccines_for_pets, pet_ids)
+
+class AsyncActivityRepository:
+
+    @staticmethod
+    async def get_activities(db: AsyncSession):
+        return await db.run_sync(ActivityRepository.get_activities)
+
+    @staticmethod
+    async def get_feedings(db: AsyncSession):
+        return await db.run_sync(ActivityRepository.get_feedings)
+
+    @staticmethod
+    async def get_activity_by_id(db: AsyncSession, activity_id: int):
+        return await db.run_sync(ActivityRepository.get_activity_by_id, activity_id)
+
+    @staticmethod
+    async def get_feeding_by_id(db: AsyncSession, feeding_id: int):
+        return await db.run_sync(ActivityRepository.get_feeding_by_id, feeding_id)
+
+    @staticmethod
+    async def get_activities_by_pet(db: AsyncSession, pet_id: int):
+        return await db.run_sync(ActivityRepository.get_activities_by_pet, pet_id)
+
+    @staticmethod
+    async def get_feedings_by_pet(db: AsyncSession, pet_id: int):
+        return await db.run_sync(ActivityRepository.get_feedings_by_pet, pet_id)
+
+    @staticmethod
+    async def create_pet_activity(db: AsyncSession, pet_activity: Pet_activity):
+        return await db.run_sync(ActivityRepository.create_pet_activity, pet_activity)
+
+    @staticmethod
+    async def create_pet_feeding(db: AsyncSession, pet_feeding: Pet_feeding):
+        return await db.run_sync(ActivityRepository.create_pet_feeding, pet_feeding)
+
+class AsyncReportRepository:
+
+    @staticmethod
+    async def create_pet_history(db: AsyncSession, pet_history: Pet_history):
+        return await db.run_sync(ReportRepository.create_pet_history, pet_history)
+
+    @staticmethod
+    async def get_pet_reports_for_user(db: AsyncSession, user_id: int):
+        return await db.run_sync(ReportRepository.get_pet_reports_for_user, user_id)
+
+    @staticmethod
+    async def bulk_create_pet_history(db: AsyncSession, rows: List[Dict[str, Any]]):
+        return await db.run_sync(ReportRepository.bulk_create_pet_history, rows)
@@ -0,0 +1,24 @@
+from sqlalchemy import event
+from sqlalchemy.orm.session import Session
+from typing import Any, Optional
+
+# Primary-key lookups scoped to the request's session. Hits come from the
+# session identity map (Session.get skips the SELECT for rows it already
+# holds) and misses are remembered until the next flush or rollback, so
+# repeated existence checks within one request cost at most one query.
+
+_MISSES_KEY = "pk_lookup_misses"
+
+def get_by_pk(db: Session, model: Any, pk: Any) -> Optional[Any]:
+    misses = db.info.setdefault(_MISSES_KEY, set())
+    if (model, pk) in misses:
+        return None
+    instance = db.get(model, pk)
+    if instance is None:
+        misses.add((model, pk))
+    return instance
+
+@event.listens_for(Session, "after_flush")
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_misses(session: Session, *args):
+    session.info.pop(_MISSES_KEY, None)
@@ -1,4 +1,6 @@
 from sqlalchemy.orm.session import Session
+from typing import Collection, List, Dict, Set
+from .lookup import get_by_pk
 from ..models.medical import Medical_condition, Vaccine
 from ..models.relationships import Pet_medical_condition, Pet_vaccine
 
@@ -14,12 +16,26 @@ class MedicalRepository:
     
     @staticmethod
     def get_condition_by_id(db: Session, condition_id: int):
-        return db.query(Medical_condition).filter(Medical_condition.mc_id == condition_id).first()
+        return get_by_pk(db, Medical_condition, condition_id)
     
     @staticmethod
     def get_vaccine_by_id(db: Session, vaccine_id: int):
-        return db.query(Vaccine).filter(Vaccine.vaccine_id == vaccine_id).first()
+        return get_by_pk(db, Vaccine, vaccine_id)
     
+    @staticmethod
+    def existing_condition_ids(db: Session, condition_ids: Collection[int]) -> Set[int]:
+        """The subset of ``condition_ids`` that exist, checked with one query"""
+        if not condition_ids:
+            return set()
+        return {mc_id for (mc_id,) in db.query(Medical_condition.mc_id).filter(Medical_condition.mc_id.in_(condition_ids))}
+
+    @staticmethod
+    def existing_vaccine_ids(db: Session, vaccine_ids: Collection[int]) -> Set[int]:
+        """The subset of ``vaccine_ids`` that exist, checked with one query"""
+        if not vaccine_ids:
+            return set()
+        return {vaccine_id for (vaccine_id,) in db.query(Vaccine.vaccine_id).filter(Vaccine.vaccine_id.in_(vaccine_ids))}
+
     @staticmethod
     def get_conditions_by_pet(db: Session, pet_id: int):
         return db.query(Medical_condition).join(Pet_medical_condition).filter(Pet_medical_condition.pet_id == pet_id).all()
@@ -28,11 +44,48 @@ class MedicalRepository:
     def get_vaccines_by_pet(db: Session, pet_id: int):
         return db.query(Vaccine).join(Pet_vaccine).filter(Pet_vaccine.pet_id == pet_id).all()
     
+    @staticmethod
+    def get_conditions_for_pets(db: Session, pet_ids: List[int]) -> Dict[int, List[str]]:
+        """Condition names grouped by pet id, loaded in a single query"""
+        grouped: Dict[int, List[str]] = {pet_id: [] for pet_id in pet_ids}
+        if not pet_ids:
+            return grouped
+        rows = (
+            db.query(Pet_medical_condition.pet_id, Medical_condition.name)
+            .join(Medical_condition, Medical_condition.mc_id == Pet_medical_condition.mc_id)
+            .filter(Pet_medical_condition.pet_id.in_(pet_ids))
+            .all()
+        )
+        for pet_id, name in rows:
+            grouped[pet_id].append(name)
+        return grouped
+    
+    @staticmethod
+    def get_vaccines_for_pets(db: Session, pet_ids: List[int]) -> Dict[int, List[str]]:
+        """Vaccine names grouped by pet id, loaded in a single query"""
+        grouped: Dict[int, List[str]] = {pet_id: [] for pet_id in pet_ids}
+        if not pet_ids:
+            return grouped
+        rows = (
+            db.query(Pet_vaccine.pet_id, Vaccine.name)
+            .join(Vaccine, Vaccine.vaccine_id == Pet_vaccine.vaccine_id)
+            .filter(Pet_vaccine.pet_id.in_(pet_ids))
+            .all()
+        )
+        for pet_id, name in rows:
+            grouped[pet_id].append(name)
+        return grouped
+    
     @staticmethod
     def get_species(db: Session):
         from ..models.pet import Species
         return db.query(Species).all()
     
+    @staticmethod
+    def get_breeds(db: Session):
+        from ..models.pet import Breed
+        return db.query(Breed).order_by(Breed.species_id, Breed.breed_id).all()
+    
     @staticmethod
     def get_breeds_by_species(db: Session, species_id: int):
         from ..models.pet import Breed
@@ -41,23 +94,21 @@ class MedicalRepository:
     @staticmethod
     def get_species_by_id(db: Session, species_id: int):
         from ..models.pet import Species
-        return db.query(Species).filter(Species.species_id == species_id).first()
+        return get_by_pk(db, Species, species_id)
     
     @staticmethod
     def get_breed_by_id(db: Session, breed_id: int):
         from ..models.pet import Breed
-        return db.query(Breed).filter(Breed.breed_id == breed_id).first()
+        return get_by_pk(db, Breed, breed_id)
     
     @staticmethod
     def create_pet_medical_condition(db: Session, pet_condition: Pet_medical_condition):
         db.add(pet_condition)
         db.commit()
-        db.refresh(pet_condition)
         return True
     
     @staticmethod
     def create_pet_vaccine(db: Session, pet_vaccine: Pet_vaccine):
         db.add(pet_vaccine)
         db.commit()
-        db.refresh(pet_vaccine)
         return True
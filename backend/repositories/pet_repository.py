@@ -1,5 +1,9 @@
 from sqlalchemy.orm.session import Session
+from sqlalchemy import insert
+from typing import Collection, List, Optional, Set
+from .lookup import get_by_pk
 from ..models.pet import Pet, Breed, Species
+from ..models.relationships import Pet_medical_condition, Pet_vaccine, Pet_health_summary
 
 class PetRepository:
 
@@ -7,12 +11,92 @@ class PetRepository:
     def create(db: Session, pet: Pet):
         db.add(pet)
         db.commit()
-        db.refresh(pet)
         return pet
     
     @staticmethod
-    def get_user_pets(db: Session, user_id: int):
-        return db.query(Pet).filter(Pet.user_id == user_id).all()
+    def create_with_links(db: Session, pet: Pet, condition_ids: List[int], vaccine_ids: List[int]):
+        """Insert a pet and its condition/vaccine links in a single transaction"""
+        try:
+            db.add(pet)
+            db.flush()  # INSERT ... RETURNING pet_id
+            if condition_ids:
+                db.execute(
+                    insert(Pet_medical_condition),
+                    [{"pet_id": pet.pet_id, "mc_id": mc_id} for mc_id in condition_ids]
+                )
+            if vaccine_ids:
+                db.execute(
+                    insert(Pet_vaccine),
+                    [{"pet_id": pet.pet_id, "vaccine_id": vaccine_id} for vaccine_id in vaccine_ids]
+                )
+            db.commit()
+            return pet
+        except Exception:
+            db.rollback()
+            raise
+    
+    @staticmethod
+    def get_user_pets(db: Session, user_id: int, after_id: Optional[int] = None, limit: Optional[int] = None):
+        query = db.query(Pet).filter(Pet.user_id == user_id)
+        if after_id is not None or limit is not None:
+            query = PetRepository._keyset(query, after_id, limit)
+        return query.all()
+    
+    @staticmethod
+    def get_user_pets_with_names(db: Session, user_id: int, after_id: Optional[int] = None, limit: Optional[int] = None):
+        """User pets together with their species and breed names in one query"""
+        query = (
+            db.query(Pet, Species.name.label("species_name"), Breed.name.label("breed_name"))
+            .outerjoin(Species, Species.species_id == Pet.species_id)
+            .outerjoin(Breed, Breed.breed_id == Pet.breed_id)
+            .filter(Pet.user_id == user_id)
+        )
+        return PetRepository._keyset(query, after_id, limit).all()
+    
+    @staticmethod
+    def _keyset(query, after_id: Optional[int], limit: Optional[int]):
+        """Seek past ``after_id`` on pet_id instead of OFFSET, so deep pages
+        cost the same as the first one"""
+        if after_id is not None:
+            query = query.filter(Pet.pet_id > after_id)
+        query = query.order_by(Pet.pet_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+    
+    @staticmethod
+    def get_user_pet_measures(db: Session, user_id: int):
+        """(pet_id, name, species_id, weight, height) of every pet of the user, without loading entities"""
+        return (
+            db.query(Pet.pet_id, Pet.name, Pet.species_id, Pet.weight, Pet.height)
+            .filter(Pet.user_id == user_id)
+            .order_by(Pet.pet_id)
+            .all()
+        )
+    
+    @staticmethod
+    def get_pet_with_summary(db: Session, pet_id: int):
+        """A pet with its species/breed names and health summary columns in one
+        query (summary columns are None when it has no history), or None"""
+        summary = Pet_health_summary
+        return (
+            db.query(
+                Pet,
+                Species.name.label("species_name"),
+                Breed.name.label("breed_name"),
+                summary.latest_hr_id,
+                summary.latest_date,
+                summary.latest_metric,
+                summary.previous_metric,
+                summary.delta,
+                summary.record_count
+            )
+            .outerjoin(Species, Species.species_id == Pet.species_id)
+            .outerjoin(Breed, Breed.breed_id == Pet.breed_id)
+            .outerjoin(summary, summary.pet_id == Pet.pet_id)
+            .filter(Pet.pet_id == pet_id)
+            .first()
+        )
     
     @staticmethod
     def get_pet_by_name_user(db: Session, name: str, user_id: int):
@@ -25,7 +109,7 @@ class PetRepository:
     
     @staticmethod
     def get_species_by_id(db: Session, species_id: int):
-        return db.query(Species).filter(Species.species_id == species_id).first()
+        return get_by_pk(db, Species, species_id)
     
     @staticmethod
     def get_breeds_by_species(db: Session, species_id: int):
@@ -33,15 +117,21 @@ class PetRepository:
     
     @staticmethod
     def get_breed_by_id(db: Session, breed_id: int):
-        return db.query(Breed).filter(Breed.breed_id == breed_id).first()
+        return get_by_pk(db, Breed, breed_id)
     
     @staticmethod
     def create_pet(db: Session, pet: Pet):
         db.add(pet)
         db.commit()
-        db.refresh(pet)
         return pet
     
     @staticmethod
     def get_pet_by_id(db: Session, pet_id: int):
-        return db.query(Pet).filter(Pet.pet_id == pet_id).first()
+        return get_by_pk(db, Pet, pet_id)
+    
+    @staticmethod
+    def existing_pet_ids(db: Session, pet_ids: Collection[int]) -> Set[int]:
+        """The subset of ``pet_ids`` that exist, checked with one query"""
+        if not pet_ids:
+            return set()
+        return {pet_id for (pet_id,) in db.query(Pet.pet_id).filter(Pet.pet_id.in_(pet_ids))}
@@ -1,9 +1,13 @@
 from sqlalchemy.orm.session import Session
-from typing import List, Dict, Any
-from ..models.relationships import Pet_history
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from datetime import date
+from decimal import Decimal
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from ..models.relationships import Pet_history, Pet_health_summary
 from ..models.pet import Pet, Breed, Species
-from ..models.medical import Medical_condition
-from ..models.relationships import Pet_medical_condition
+from .medical_repository import MedicalRepository
+from .rollup_repository import RollupRepository
 
 class ReportRepository:
 
@@ -11,69 +15,294 @@ class ReportRepository:
     def create_pet_history(db: Session, pet_history: Pet_history) -> Pet_history:
         try:
             db.add(pet_history)
+            db.flush()  # INSERT ... RETURNING hr_id
+            ReportRepository._merge_into_health_summary(db, [
+                (pet_history.hr_id, pet_history.pet_id, pet_history.date, pet_history.body_metric)
+            ])
+            RollupRepository.apply(db, RollupRepository.aggregate(
+                [(pet_history.pet_id, pet_history.date, pet_history.body_metric)]
+            ))
             db.commit()
-            db.refresh(pet_history)
             return pet_history
         except Exception as e:
             db.rollback()
             raise e
-    
+
+    @staticmethod
+    def _pet_history_range(query, pet_id: int, date_from: Optional[date], date_to: Optional[date]):
+        # Served by ix_history_register_pet_id_date
+        query = query.filter(
+            Pet_history.pet_id == pet_id,
+            Pet_history.date.isnot(None),
+            Pet_history.body_metric.isnot(None)
+        )
+        if date_from is not None:
+            query = query.filter(Pet_history.date >= date_from)
+        if date_to is not None:
+            query = query.filter(Pet_history.date <= date_to)
+        return query
+
+    @staticmethod
+    def count_pet_history(db: Session, pet_id: int, date_from: Optional[date] = None,
+                          date_to: Optional[date] = None) -> int:
+        query = db.query(func.count(Pet_history.hr_id))
+        return ReportRepository._pet_history_range(query, pet_id, date_from, date_to).scalar() or 0
+
+    @staticmethod
+    def iter_pet_history(db: Session, pet_id: int, date_from: Optional[date] = None,
+                         date_to: Optional[date] = None, batch_size: int = 1000) -> Iterator[Tuple[date, Any]]:
+        """(date, body_metric) rows of a pet oldest first, fetched ``batch_size`` at a time"""
+        query = db.query(Pet_history.date, Pet_history.body_metric)
+        query = (
+            ReportRepository._pet_history_range(query, pet_id, date_from, date_to)
+            .order_by(Pet_history.date, Pet_history.hr_id)
+            .execution_options(yield_per=batch_size)
+        )
+        for row in query:
+            yield row.date, row.body_metric
+
+    @staticmethod
+    def iter_user_history(db: Session, user_id: int, batch_size: int = 1000) -> Iterator[Any]:
+        """Every history_register row of a user's pets with pet, species and
+        breed names, ordered by pet and date. Rows come off a server-side cursor
+        ``batch_size`` at a time, so memory does not grow with the history"""
+        query = (
+            db.query(
+                Pet.pet_id,
+                Pet.name.label("pet_name"),
+                Species.name.label("species_name"),
+                Breed.name.label("breed_name"),
+                Pet_history.hr_id,
+                Pet_history.date,
+                Pet_history.body_metric
+            )
+            .join(Pet_history, Pet_history.pet_id == Pet.pet_id)
+            .outerjoin(Species, Species.species_id == Pet.species_id)
+            .outerjoin(Breed, Breed.breed_id == Pet.breed_id)
+            .filter(Pet.user_id == user_id)
+            .order_by(Pet.pet_id, Pet_history.date, Pet_history.hr_id)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        yield from query
+
+    @staticmethod
+    def _ranked_history():
+        """history_register rows ranked newest first per pet (rank 1 is the
+        latest record) with the pet's record count on every row"""
+        return select(
+            Pet_history.hr_id.label("hr_id"),
+            Pet_history.pet_id.label("pet_id"),
+            Pet_history.date.label("date"),
+            Pet_history.body_metric.label("body_metric"),
+            func.row_number().over(
+                partition_by=Pet_history.pet_id,
+                order_by=(Pet_history.date.desc(), Pet_history.hr_id.desc())
+            ).label("rank"),
+            func.count().over(partition_by=Pet_history.pet_id).label("record_count")
+        ).where(Pet_history.date.isnot(None))
+
+    @staticmethod
+    def rebuild_health_summary(db: Session) -> int:
+        """Recompute pet_health_summary from history_register (backfill/repair),
+        returning the number of pets summarised"""
+        try:
+            ReportRepository._refresh_health_summary(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return db.query(func.count(Pet_health_summary.pet_id)).scalar() or 0
+
+    @staticmethod
+    def _refresh_health_summary(db: Session):
+        """Replace every summary row with values recomputed from history_register,
+        without committing"""
+        ranked = ReportRepository._ranked_history()
+        latest = ranked.subquery("latest")
+        previous = ranked.subquery("previous")
+        rows = select(
+            latest.c.pet_id,
+            latest.c.hr_id,
+            latest.c.date,
+            latest.c.body_metric,
+            previous.c.date,
+            previous.c.body_metric,
+            latest.c.body_metric - previous.c.body_metric,
+            latest.c.record_count
+        ).select_from(
+            latest.outerjoin(previous, (previous.c.pet_id == latest.c.pet_id) & (previous.c.rank == 2))
+        ).where(latest.c.rank == 1)
+
+        summary = Pet_health_summary
+        db.execute(delete(summary))
+        db.execute(insert(summary).from_select([
+            summary.pet_id, summary.latest_hr_id, summary.latest_date, summary.latest_metric,
+            summary.previous_date, summary.previous_metric, summary.delta, summary.record_count
+        ], rows))
+
     @staticmethod
-    def get_pet_reports_for_user(db: Session, user_id: int) -> List[Dict[str, Any]]:
-        """FUNCIÓN COMPLETA COPIADA DEL ORIGINAL - CRÍTICA PARA REPORTES"""
+    def bulk_create_pet_history(db: Session, rows: List[Dict[str, Any]]) -> int:
+        """Insert many history rows and fold them into pet_health_summary and the
+        rollups in one transaction, returning how many were inserted. The rows go out as
+        batched multi-row INSERT ... RETURNING (executemany)"""
+        if not rows:
+            return 0
+        try:
+            # Core insert on the table skips the ORM bulk bookkeeping. Unordered
+            # RETURNING keeps the batching; asking for input order makes some
+            # drivers fall back to one INSERT per row
+            history = Pet_history.__table__
+            inserted = db.execute(
+                insert(history).returning(
+                    history.c.hr_id, history.c.pet_id, history.c.date, history.c.body_metric
+                ),
+                rows
+            ).all()
+            ReportRepository._merge_into_health_summary(db, inserted)
+            RollupRepository.apply(db, RollupRepository.aggregate(
+                (pet_id, day, metric) for _, pet_id, day, metric in inserted
+            ))
+            db.commit()
+            return len(inserted)
+        except Exception:
+            db.rollback()
+            raise
+
+    @staticmethod
+    def _as_stored(metric):
+        """body_metric as the Numeric column returns it, so deltas match a rebuild"""
+        if metric is None or isinstance(metric, Decimal):
+            return metric
+        return Decimal(str(metric)).quantize(Decimal(1).scaleb(-Pet_history.body_metric.type.scale))
+
+    @staticmethod
+    def _current_summaries(db: Session, pet_ids) -> Dict[int, Any]:
+        """Summary rows of ``pet_ids`` by pet, locked until the transaction ends"""
+        summary = Pet_health_summary
+        return {
+            row.pet_id: row for row in db.query(
+                summary.pet_id, summary.latest_hr_id, summary.latest_date, summary.latest_metric,
+                summary.previous_date, summary.previous_metric, summary.record_count
+            ).filter(summary.pet_id.in_(pet_ids)).with_for_update()
+        }
+
+    @staticmethod
+    def _merge_into_health_summary(db: Session, inserted: List[Any], retry: bool = True):
+        """Fold freshly inserted (hr_id, pet_id, date, body_metric) rows into the
+        summary. A pet's new latest and previous records are among its old ones
+        and the new rows, so only the batch and the summary rows are read"""
+        candidates: Dict[int, List[Tuple[date, int, Any]]] = {}
+        for hr_id, pet_id, day, metric in inserted:
+            if day is not None:
+                candidates.setdefault(pet_id, []).append((day, hr_id, ReportRepository._as_stored(metric)))
+        if not candidates:
+            return
+
+        summary = Pet_health_summary
+        current = ReportRepository._current_summaries(db, candidates)
+
+        updates, inserts = [], []
+        for pet_id, records in candidates.items():
+            record_count = len(records)
+            old = current.get(pet_id)
+            if old is not None:
+                record_count += old.record_count
+                records.append((old.latest_date, old.latest_hr_id, old.latest_metric))
+                if old.previous_date is not None:
+                    # Older than every new row, which only matters on equal dates
+                    records.append((old.previous_date, -1, old.previous_metric))
+            records.sort(key=lambda record: (record[0], record[1]), reverse=True)
+            latest_date, latest_hr_id, latest_metric = records[0]
+            previous_date, _, previous_metric = records[1] if len(records) > 1 else (None, None, None)
+            values = {
+                "pet_id": pet_id,
+                "latest_hr_id": latest_hr_id,
+                "latest_date": latest_date,
+                "latest_metric": latest_metric,
+                "previous_date": previous_date,
+                "previous_metric": previous_metric,
+                "delta": None if latest_metric is None or previous_metric is None else latest_metric - previous_metric,
+                "record_count": record_count
+            }
+            (updates if old is not None else inserts).append(values)
+
+        if updates:
+            db.execute(update(summary), updates)  # executemany UPDATE by primary key
+        if not inserts:
+            return
+
+        # First records of these pets. The savepoint lets a concurrent first
+        # insert win the race; one more pass then folds into its rows.
+        try:
+            with db.begin_nested():
+                db.execute(insert(summary), inserts)
+        except IntegrityError:
+            if not retry:
+                raise
+            new_pets = {values["pet_id"] for values in inserts}
+            ReportRepository._merge_into_health_summary(
+                db, [row for row in inserted if row[1] in new_pets], retry=False
+            )
+
+    @staticmethod
+    def get_pet_reports_for_user(db: Session, user_id: int, after_pet_id: Optional[int] = None,
+                                 limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Latest health summary per pet of a user, read from pet_health_summary
+        by primary key (plus one batched conditions query). Pages are keyed on
+        pet_id: pass the last ``pet_id`` seen as ``after_pet_id``"""
         if not db or user_id is None:
             return []
             
         try:
-            pets = db.query(Pet).filter(Pet.user_id == user_id).all()  # type: ignore
-
-            reports = []
-            for pet in pets:
-                # Get species and breed info
-                species = db.query(Species).filter(Species.species_id == pet.species_id).first()  # type: ignore
-                breed = db.query(Breed).filter(Breed.breed_id == pet.breed_id).first()  # type: ignore
-
-                # Get last history record
-                last_history = (
-                    db.query(Pet_history)  # type: ignore
-                    .filter(Pet_history.pet_id == pet.pet_id)
-                    .order_by(Pet_history.date.desc())
-                    .first()
+            summary = Pet_health_summary
+            query = (
+                db.query(  # type: ignore
+                    Pet.pet_id,
+                    Pet.name,
+                    Pet.weight,
+                    Pet.height,
+                    Species.name.label("species_name"),
+                    Breed.name.label("breed_name"),
+                    summary.latest_hr_id,
+                    summary.latest_date,
+                    summary.latest_metric,
+                    summary.previous_metric,
+                    summary.delta,
+                    summary.record_count
                 )
+                .join(summary, summary.pet_id == Pet.pet_id)
+                .outerjoin(Species, Species.species_id == Pet.species_id)
+                .outerjoin(Breed, Breed.breed_id == Pet.breed_id)
+                .filter(Pet.user_id == user_id)
+            )
+            if after_pet_id is not None:
+                query = query.filter(Pet.pet_id > after_pet_id)
+            query = query.order_by(Pet.pet_id)
+            if limit is not None:
+                query = query.limit(limit)
+            rows = query.all()
 
-                # Get medical conditions
-                condition_ids = (
-                    db.query(Pet_medical_condition.mc_id)  # type: ignore
-                    .filter(Pet_medical_condition.pet_id == pet.pet_id)
-                    .all()
-                )
-                condition_ids = [cid[0] for cid in condition_ids] if condition_ids else []
-                
-                if condition_ids:
-                    conditions = (
-                        db.query(Medical_condition.name)  # type: ignore
-                        .filter(Medical_condition.mc_id.in_(condition_ids))
-                        .all()
-                    )
-                else:
-                    conditions = []
-                condition_names = [c[0] for c in conditions]
-
-                if last_history:
-                    reports.append({
-                        "id": last_history.hr_id,
-                        "report_type": "health_summary",
-                        "created_at": last_history.date.isoformat(),
-                        "pet_name": pet.name,
-                        "pet_species": species.name if species else "Unknown",
-                        "pet_breed": breed.name if breed else "Unknown",
-                        "pet_weight": pet.weight,
-                        "pet_height": pet.height,
-                        "health_metric": last_history.body_metric,
-                        "conditions": condition_names
-                    })
-
-            return reports
+            conditions = MedicalRepository.get_conditions_for_pets(db, [row.pet_id for row in rows])
+
+            return [
+                {
+                    "id": row.latest_hr_id,
+                    "pet_id": row.pet_id,
+                    "report_type": "health_summary",
+                    "created_at": row.latest_date.isoformat(),
+                    "pet_name": row.name,
+                    "pet_species": row.species_name or "Unknown",
+                    "pet_breed": row.breed_name or "Unknown",
+                    "pet_weight": row.weight,
+                    "pet_height": row.height,
+                    "health_metric": row.latest_metric,
+                    "previous_metric": row.previous_metric,
+                    "delta": row.delta,
+                    "record_count": row.record_count,
+                    "conditions": conditions[row.pet_id]
+                }
+                for row in rows
+            ]
         except Exception as e:
             print(f"Error getting pet reports: {e}")
             return []
@@ -0,0 +1,94 @@
+from sqlalchemy.orm.session import Session
+from sqlalchemy import case, delete
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Tuple
+from .upsert import upsert_insert
+from ..models.relationships import Pet_history, Pet_history_rollup
+
+PERIODS = ("day", "week", "month")
+
+def period_start(day: date, period: str) -> date:
+    """First day of the day/week (Monday)/month bucket holding ``day``"""
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    return day
+
+class RollupRepository:
+
+    @staticmethod
+    def aggregate(readings: Iterable[Tuple[int, date, Any]]) -> List[Dict[str, Any]]:
+        """Fold (pet_id, date, body_metric) readings into one row per pet, period
+        and bucket, ready for apply(). Readings without a date or metric are skipped"""
+        buckets: Dict[Tuple[int, str, date], Dict[str, Any]] = {}
+        for pet_id, day, metric in readings:
+            if day is None or metric is None:
+                continue
+            for period in PERIODS:
+                key = (pet_id, period, period_start(day, period))
+                bucket = buckets.get(key)
+                if bucket is None:
+                    buckets[key] = {
+                        "pet_id": pet_id, "period": period, "period_start": key[2],
+                        "record_count": 1, "total": metric, "min_metric": metric, "max_metric": metric
+                    }
+                else:
+                    bucket["record_count"] += 1
+                    bucket["total"] += metric
+                    bucket["min_metric"] = min(bucket["min_metric"], metric)
+                    bucket["max_metric"] = max(bucket["max_metric"], metric)
+        return list(buckets.values())
+
+    @staticmethod
+    def apply(db: Session, rows: List[Dict[str, Any]]):
+        """Add aggregated rows to the rollups with one INSERT ... ON CONFLICT DO
+        UPDATE (executemany), without committing"""
+        if not rows:
+            return
+        rollup = Pet_history_rollup.__table__
+        stmt = upsert_insert(db, rollup)
+        new = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[rollup.c.pet_id, rollup.c.period, rollup.c.period_start],
+            set_={
+                "record_count": rollup.c.record_count + new.record_count,
+                "total": rollup.c.total + new.total,
+                "min_metric": case((new.min_metric < rollup.c.min_metric, new.min_metric), else_=rollup.c.min_metric),
+                "max_metric": case((new.max_metric > rollup.c.max_metric, new.max_metric), else_=rollup.c.max_metric),
+            }
+        )
+        db.execute(stmt, rows)
+
+    @staticmethod
+    def rebuild(db: Session, batch_size: int = 10000) -> int:
+        """Recompute every rollup from history_register, returning the rows written"""
+        try:
+            db.execute(delete(Pet_history_rollup))
+            readings = (
+                db.query(Pet_history.pet_id, Pet_history.date, Pet_history.body_metric)
+                .execution_options(stream_results=True, yield_per=batch_size)
+            )
+            rows = RollupRepository.aggregate(tuple(reading) for reading in readings)
+            RollupRepository.apply(db, rows)
+            db.commit()
+            return len(rows)
+        except Exception:
+            db.rollback()
+            raise
+
+    @staticmethod
+    def get_rollups(db: Session, pet_id: int, period: str, date_from: date, date_to: date):
+        """Buckets of one granularity whose start falls in [period_start(date_from), date_to]"""
+        rollup = Pet_history_rollup
+        return (
+            db.query(rollup)
+            .filter(
+                rollup.pet_id == pet_id,
+                rollup.period == period,
+                rollup.period_start >= period_start(date_from, period),
+                rollup.period_start <= date_to
+            )
+            .order_by(rollup.period_start)
+            .all()
+        )
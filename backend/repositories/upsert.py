@@ -0,0 +1,17 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm.session import Session
+from typing import Any
+
+# PostgreSQL and SQLite share the INSERT ... ON CONFLICT syntax, but each
+# dialect has its own insert() that knows how to render it.
+_DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+def upsert_insert(db: Session, table: Any):
+    """INSERT construct supporting on_conflict_do_update/do_nothing on the session's database"""
+    name = db.get_bind().dialect.name
+    if name not in _DIALECT_INSERTS:
+        raise NotImplementedError(f"ON CONFLICT upserts are not supported on {name}")
+    return _DIALECT_INSERTS[name](table)
@@ -1,4 +1,8 @@
 from sqlalchemy.orm.session import Session
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from typing import Set
+from .lookup import get_by_pk
 from ..models.user import User
 
 class UserRepository:
@@ -15,12 +19,35 @@ class UserRepository:
     def get_by_phone(db: Session, phone: str):
         return db.query(User).filter(User.phone_number == phone).first()
     
+    @staticmethod
+    def find_conflicts(db: Session, email: str, phone: str, name: str) -> Set[str]:
+        """Which of email / phone / name are already taken, in one query"""
+        rows = (
+            db.query(User.email, User.phone_number, User.name)
+            .filter(or_(User.email == email, User.phone_number == phone, User.name == name))
+            .all()
+        )
+        conflicts = set()
+        for row in rows:
+            if row.email == email:
+                conflicts.add("email")
+            if row.phone_number == phone:
+                conflicts.add("phone")
+            if row.name == name:
+                conflicts.add("name")
+        return conflicts
+    
     @staticmethod
     def create_user(db: Session, user: User):
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return UserRepository.get_by_email(db, user.email if isinstance(user.email, str) else getattr(user, 'email'))
+        # Unique indexes on email, phone and name catch concurrent registrations;
+        # the IntegrityError is left for the service to turn into a 409
+        try:
+            db.add(user)
+            db.commit()
+            return user
+        except IntegrityError:
+            db.rollback()
+            raise
     
     @staticmethod
     def create(db: Session, user: User):
@@ -29,4 +56,4 @@ class UserRepository:
     
     @staticmethod
     def get_user_by_id(db: Session, user_id: int):
-        return db.query(User).filter(User.user_id == user_id).first()
+        return get_by_pk(db, User, user_id)
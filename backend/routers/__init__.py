@@ -1,9 +1,11 @@
-from . import auth, pets, medical, activities, reports
+from . import auth, pets, medical, activities, reports, catalog, system
 
 __all__ = [
     "auth",
     "pets", 
     "medical",
     "activities",
-    "reports"
+    "reports",
+    "catalog",
+    "system"
 ]
\ No newline at end of file
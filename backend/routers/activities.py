@@ -1,64 +1,58 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm.session import Session
-from ..config.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config.database import get_db, get_async_db
 from ..schemas.activity import Activity, Feeding, ActivityCreate, FeedingCreate
 from ..services.activity_service import ActivityService
 from ..services.pet_service import PetService
+from .catalog import catalog_response
 from typing import List
 
 router = APIRouter(tags=["activities"])
 
 @router.get("/activities", response_model=List[Activity])
 def get_activities(db: Session = Depends(get_db)):
-    activities = ActivityService.get_all_activities(db)
-    if not activities:
-        raise HTTPException(status_code=404, detail="No activities found")
-    return activities
+    return catalog_response(ActivityService.get_activities_catalog(db), "No activities found")
 
 @router.get("/feedings", response_model=List[Feeding])
 def get_feedings(db: Session = Depends(get_db)):
-    feedings = ActivityService.get_all_feedings(db)
-    if not feedings:
-        raise HTTPException(status_code=404, detail="No feedings found")
-    return feedings
+    return catalog_response(ActivityService.get_feedings_catalog(db), "No feedings found")
 
 @router.post("/api/activities", status_code=201)
 def create_pet_activity(data: ActivityCreate, db: Session = Depends(get_db)):
-    if not PetService.pet_exists(db, data.pet_id):
-        raise HTTPException(status_code=404, detail="Pet not found")
-    if not ActivityService.activity_exists(db, data.activity_id):
-        raise HTTPException(status_code=404, detail="Activity not found")
-    try:
-        ActivityService.create_pet_activity(db, data)
-        return {"message": "Pet activity created successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    ActivityService.check_activity_refs(db, data)
+    ActivityService.create_pet_activity(db, data)
+    return {"message": "Pet activity created successfully"}
 
 @router.post("/api/foods", status_code=201)
 def create_pet_feeding(data: FeedingCreate, db: Session = Depends(get_db)):
-    if not PetService.pet_exists(db, data.pet_id):
-        raise HTTPException(status_code=404, detail="Pet not found")
-    if not ActivityService.feeding_exists(db, data.feeding_id):
-        raise HTTPException(status_code=404, detail="Feeding not found")
-    try:
-        ActivityService.create_pet_feeding(db, data)
-        return {"message": "Pet feeding created successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    ActivityService.check_feeding_refs(db, data)
+    ActivityService.create_pet_feeding(db, data)
+    return {"message": "Pet feeding created successfully"}
+
+@router.post("/api/activities/batch", status_code=201)
+def upsert_pet_activities(data: List[ActivityCreate], db: Session = Depends(get_db)):
+    count = ActivityService.upsert_pet_activities(db, data)
+    return {"message": "Pet activities saved successfully", "count": count}
+
+@router.post("/api/foods/batch", status_code=201)
+def upsert_pet_feedings(data: List[FeedingCreate], db: Session = Depends(get_db)):
+    count = ActivityService.upsert_pet_feedings(db, data)
+    return {"message": "Pet feedings saved successfully", "count": count}
 
 @router.get("/api/activities/pet/{pet_id}")
-def get_activities_by_pet(pet_id: int, db: Session = Depends(get_db)):
-    if not PetService.pet_exists(db, pet_id):
+async def get_activities_by_pet(pet_id: int, db: AsyncSession = Depends(get_async_db)):
+    if not await PetService.pet_exists_async(db, pet_id):
         raise HTTPException(status_code=404, detail="Pet not found")
         
-    activities = ActivityService.get_activities_by_pet(db, pet_id)
+    activities = await ActivityService.get_activities_by_pet_async(db, pet_id)
     return [{"name": activity[0], "frequency": activity[1]} for activity in activities]
 
 @router.get("/api/foods/pet/{pet_id}")
-def get_feedings_by_pet(pet_id: int, db: Session = Depends(get_db)):
+async def get_feedings_by_pet(pet_id: int, db: AsyncSession = Depends(get_async_db)):
 
-    if not PetService.pet_exists(db, pet_id):
+    if not await PetService.pet_exists_async(db, pet_id):
         raise HTTPException(status_code=404, detail="Pet not found")
 
-    feedings = ActivityService.get_feedings_by_pet(db, pet_id)
+    feedings = await ActivityService.get_feedings_by_pet_async(db, pet_id)
     return [{"name": feeding[0], "frequency": feeding[1]} for feeding in feedings]
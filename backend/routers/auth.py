@@ -1,14 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm.session import Session
-from ..config.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config.database import get_async_db
 from ..schemas.user import UserCreate, UserLogin, UserOut
 from ..services.user_service import UserService
+from ..utils.auth_utils import create_access_token
 
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
-def create_user(data: UserCreate, db: Session = Depends(get_db)):
-    user = UserService.create_user(db, data)
+async def create_user(data: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    user = await UserService.create_user_async(db, data)
     # Retornar un diccionario directamente para evitar problemas de tipo
     return {
         "user": {
@@ -17,16 +18,18 @@ def create_user(data: UserCreate, db: Session = Depends(get_db)):
         "email": user.email,  # type: ignore
         "phone_number": user.phone_number,  # type: ignore
         "password_hash": user.password_hash  # type: ignore
-        }
+        },
+        "token": create_access_token(user.user_id)  # type: ignore
     }
 
 @router.post("/login")
-def login_user(data: UserLogin, db: Session = Depends(get_db)):
-    user = UserService.login_user(db, data)
+async def login_user(data: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    user = await UserService.login_user_async(db, data)
     return {
         "user": {
         "user_id": user.user_id,  # type: ignore
         "name": user.name,  # type: ignore
         "email": user.email  # type: ignore
-        }
+        },
+        "token": create_access_token(user.user_id)  # type: ignore
     }
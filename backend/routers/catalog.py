@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.orm.session import Session
+from ..config.database import get_db
+from ..schemas.pet import Species, Breed
+from ..schemas.catalog import CatalogBootstrap
+from ..services.medical_service import MedicalService
+from ..services.catalog_service import CatalogService
+from ..utils.reference_cache import CatalogEntry
+from typing import List
+
+# Handlers shared by the legacy routes the frontend calls (/species, /breeds/{id})
+# and their /api/pets counterparts. Every catalog is read once into the
+# reference cache and served from the same bytes on all paths.
+router = APIRouter(tags=["catalog"])
+
+def catalog_response(entry: CatalogEntry, not_found_detail: str) -> Response:
+    if not entry.count:
+        raise HTTPException(status_code=404, detail=not_found_detail)
+    return Response(content=entry.payload, media_type="application/json")
+
+@router.get("/species", response_model=List[Species])
+def get_species(db: Session = Depends(get_db)):
+    return catalog_response(MedicalService.get_species_catalog(db), "No species found")
+
+@router.get("/breeds/{species_id}", response_model=List[Breed])
+def get_breeds_by_species(species_id: int, db: Session = Depends(get_db)):
+    return catalog_response(MedicalService.get_breeds_catalog(db, species_id), "No breeds found for this species")
+
+@router.get("/api/catalog/bootstrap", response_model=CatalogBootstrap)
+def get_catalog_bootstrap(request: Request, db: Session = Depends(get_db)):
+    entry = CatalogService.get_bootstrap(db)
+    gzipped = "gzip" in request.headers.get("accept-encoding", "")
+    # Strong ETags differ per encoding; either one proves the client has this version
+    etag = f'"{entry.version}-gzip"' if gzipped else f'"{entry.version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    known = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in known or f'"{entry.version}"' in known or f'"{entry.version}-gzip"' in known:
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=entry.gzipped, media_type="application/json", headers=headers)
+    return Response(content=entry.payload, media_type="application/json", headers=headers)
@@ -1,34 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from sqlalchemy.orm.session import Session
 from ..config.database import get_db
+from ..schemas.medical import ConditionOut, VaccineOut
 from ..services.medical_service import MedicalService
-from pydantic import BaseModel
+from .catalog import catalog_response
 from typing import List
 
-# Schemas específicos para medical
-class ConditionOut(BaseModel):
-    mc_id: int
-    name: str
-    description: str
-    recommendations: str
-
-class VaccineOut(BaseModel):
-    vaccine_id: int
-    name: str
-    recommended_age: float
-
 router = APIRouter(tags=["medical"])
 
 @router.get("/conditions", response_model=List[ConditionOut])
 def get_conditions(db: Session = Depends(get_db)):
-    conditions = MedicalService.get_medical_conditions(db)
-    if not conditions:
-        raise HTTPException(status_code=404, detail="No medical conditions found")
-    return conditions
+    return catalog_response(MedicalService.get_conditions_catalog(db), "No medical conditions found")
 
 @router.get("/vaccines", response_model=List[VaccineOut])
 def get_vaccines(db: Session = Depends(get_db)):
-    vaccines = MedicalService.get_vaccines(db)
-    if not vaccines:
-        raise HTTPException(status_code=404, detail="No vaccines found")
-    return vaccines
+    return catalog_response(MedicalService.get_vaccines_catalog(db), "No vaccines found")
@@ -1,23 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from datetime import date, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm.session import Session
 from ..config.database import get_db
-from ..schemas.pet import PetCreate, PetOut, Species, Breed
+from ..schemas.pet import PetCreate, PetOut, PetMetricsOut, PetNutritionOut, PetDashboard, Species, Breed
+from ..schemas.reports import RollupResponse
+from ..config.settings import settings
 from ..services.pet_service import PetService
-from ..repositories.pet_repository import PetRepository
+from ..services.report_service import ReportService
+from ..services.nutrition_service import NutritionService
+from . import catalog
 from ..services.user_service import UserService
-from typing import List
+from ..utils.auth_utils import get_token_user_id
+from ..utils.pagination import PageParams, page_params, set_next_cursor
+from typing import Any, Dict, Iterator, List, Optional
 
 router = APIRouter(prefix="/api/pets", tags=["pets"])
 
 @router.get("", response_model=List[PetOut])
-def get_pets(user_id: int, db: Session = Depends(get_db)):
-    # Validar que el usuario existe
-    user_service = UserService.get_user_by_id(db, user_id)  
-    if not user_service:
-        raise HTTPException(status_code=404, detail="User not found")
-    pets = PetService.get_user_pets(db, user_id)
+def get_pets(user_id: int, response: Response, page: PageParams = Depends(page_params),
+             db: Session = Depends(get_db), token_user_id: Optional[int] = Depends(get_token_user_id)):
+    # Validar que el usuario existe (sin consulta si el token ya lo acredita)
+    UserService.ensure_user_exists(db, user_id, token_user_id)
+    pets, next_cursor = PetService.get_user_pets_page(db, user_id, page)
+    set_next_cursor(response, next_cursor)
     return pets
 
+@router.get("/metrics", response_model=List[PetMetricsOut])
+def get_pet_metrics(user_id: int, db: Session = Depends(get_db),
+                    token_user_id: Optional[int] = Depends(get_token_user_id)):
+    UserService.ensure_user_exists(db, user_id, token_user_id)
+    return PetService.get_user_pet_metrics(db, user_id)
+
+@router.get("/nutrition", response_model=List[PetNutritionOut])
+def get_pet_nutrition(user_id: int, db: Session = Depends(get_db),
+                      token_user_id: Optional[int] = Depends(get_token_user_id)):
+    UserService.ensure_user_exists(db, user_id, token_user_id)
+    return NutritionService.get_user_nutrition(db, user_id)
+
 @router.post("",status_code=status.HTTP_201_CREATED)
 def create_pet(data: PetCreate, db: Session = Depends(get_db)):
     try:
@@ -26,16 +47,51 @@ def create_pet(data: PetCreate, db: Session = Depends(get_db)):
     except HTTPException as http_exc:
         raise http_exc  # Re-lanzar tal cual
 
-@router.get("/species", response_model=List[Species])
-def get_species(db: Session = Depends(get_db)):
-    species = PetRepository.get_species(db)
-    if not species:
-        raise HTTPException(status_code=404, detail="No species found")
-    return species
-
-@router.get("/breeds/{species_id}", response_model=List[Breed])
-def get_breeds_by_species(species_id: int, db: Session = Depends(get_db)):
-    breeds = PetRepository.get_breeds_by_species(db, species_id)
-    if not breeds:
-        raise HTTPException(status_code=404, detail="No breeds found for this species")
-    return breeds
+@router.get("/{pet_id}/history")
+def get_pet_history(
+    pet_id: int,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    points: int = Query(settings.HISTORY_POINTS_DEFAULT, ge=3, le=settings.HISTORY_POINTS_MAX),
+    db: Session = Depends(get_db)
+):
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    if not PetService.pet_exists(db, pet_id):
+        raise HTTPException(status_code=404, detail="Pet not found")
+    total, downsampled, series = ReportService.get_pet_history_series(db, pet_id, date_from, date_to, points)
+    return StreamingResponse(_history_json(pet_id, total, downsampled, series), media_type="application/json")
+
+@router.get("/{pet_id}/dashboard", response_model=PetDashboard)
+def get_pet_dashboard(pet_id: int, db: Session = Depends(get_db)):
+    return Response(content=PetService.get_pet_dashboard(db, pet_id), media_type="application/json")
+
+@router.get("/{pet_id}/rollups", response_model=RollupResponse)
+def get_pet_rollups(
+    pet_id: int,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    points: int = Query(30, ge=1, le=settings.HISTORY_POINTS_MAX),
+    granularity: Optional[str] = Query(None, pattern="^(day|week|month)$"),
+    db: Session = Depends(get_db)
+):
+    """Per-period count/avg/min/max of the pet's body metric. Without ``granularity``
+    the coarsest one giving at least ``points`` buckets over the range is used"""
+    date_to = date_to or date.today()
+    date_from = date_from or date_to - timedelta(days=365)
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    if not PetService.pet_exists(db, pet_id):
+        raise HTTPException(status_code=404, detail="Pet not found")
+    return ReportService.get_pet_rollups(db, pet_id, date_from, date_to, points, granularity)
+
+def _history_json(pet_id: int, total: int, downsampled: bool, series: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    # Written point by point so long series never sit in memory as one document
+    yield json.dumps({"pet_id": pet_id, "total": total, "downsampled": downsampled})[:-1] + ', "points": ['
+    for i, point in enumerate(series):
+        yield ("," if i else "") + json.dumps(point)
+    yield "]}"
+
+# Same handlers as the legacy /species and /breeds routes, sharing one cache
+router.add_api_route("/species", catalog.get_species, methods=["GET"], response_model=List[Species])
+router.add_api_route("/breeds/{species_id}", catalog.get_breeds_by_species, methods=["GET"], response_model=List[Breed])
@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm.session import Session
-from ..config.database import get_db
-from ..schemas.reports import PetHistory, ReportResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config.database import get_db, get_async_db
+from ..config.settings import settings
+from ..schemas.reports import PetHistory, ReportResponse, BulkHistoryResponse
 from ..services.report_service import ReportService
 from ..services.user_service import UserService
 from ..services.pet_service import PetService
-from typing import List
+from ..utils.auth_utils import get_token_user_id
+from ..utils.pagination import PageParams, page_params, set_next_cursor
+from typing import List, Optional
 import logging
 
 # Configure logging
@@ -38,18 +43,33 @@ def create_report(data: PetHistory, db: Session = Depends(get_db)):
         logger.error(f"Error creating report: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+@router.post("/bulk", status_code=201, response_model=BulkHistoryResponse)
+async def ingest_reports(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Bulk history upload: a JSON array or NDJSON stream of PetHistory objects"""
+    ndjson = request.headers.get("content-type", "").split(";")[0].strip() in NDJSON_TYPES
+    content_length = request.headers.get("content-length", "")
+    if not ndjson and content_length.isdigit() and int(content_length) > settings.BULK_INGEST_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"At most {settings.BULK_INGEST_MAX_BYTES} bytes per upload")
+    items, errors = await ReportService.read_history_upload(request.stream(), ndjson)
+
+    result = await ReportService.ingest_history_async(db, items, errors)
+    logger.info(f"Bulk upload: {result['created']} created, {result['failed']} failed")
+    return result
+
 @router.get("/{user_id}", response_model=List[ReportResponse])
-def get_reports_by_user(user_id: int, db: Session = Depends(get_db)):
+def get_reports_by_user(user_id: int, response: Response, page: PageParams = Depends(page_params),
+                        db: Session = Depends(get_db), token_user_id: Optional[int] = Depends(get_token_user_id)):
     try:
         logger.info(f"Getting reports for user {user_id}")
 
-        # Validar que el usuario existe
-        user_service = UserService.get_user_by_id(db, user_id)
-        if not user_service:
-            raise HTTPException(status_code=404, detail="User not found")
+        # Validar que el usuario existe (sin consulta si el token ya lo acredita)
+        UserService.ensure_user_exists(db, user_id, token_user_id)
             
-        reports = ReportService.get_pet_reports_for_user(db, user_id)
+        reports, next_cursor = ReportService.get_pet_reports_page(db, user_id, page)
         logger.info(f"Found {len(reports)} reports for user {user_id}")
+        set_next_cursor(response, next_cursor)
         
         return reports  # Devolver lista vacía si no hay reportes
     except HTTPException:
@@ -57,3 +77,17 @@ def get_reports_by_user(user_id: int, db: Session = Depends(get_db)):
     except Exception as e:
         logger.error(f"Error getting reports for user {user_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+@router.get("/{user_id}/export")
+def export_reports(user_id: int, format: str = Query("csv", pattern="^(csv|ndjson)$"),
+                   db: Session = Depends(get_db), token_user_id: Optional[int] = Depends(get_token_user_id)):
+    """Full history of the user's pets, streamed as CSV or NDJSON"""
+    UserService.ensure_user_exists(db, user_id, token_user_id)
+    logger.info(f"Exporting history for user {user_id} as {format}")
+    return StreamingResponse(
+        ReportService.export_history(db, user_id, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="health-history-{user_id}.{format}"'}
+    )
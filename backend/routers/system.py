@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from ..config.database import get_pool_stats
+
+router = APIRouter(prefix="/api/system", tags=["system"])
+
+@router.get("/pool")
+def get_database_pool_stats():
+    """Connection pool usage: checked-out and overflow connections plus checkout wait times"""
+    return get_pool_stats()
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import Dict, List
+from .pet import Species, Breed
+from .medical import ConditionOut, VaccineOut
+from .activity import Activity, Feeding
+
+class CatalogBootstrap(BaseModel):
+    version: str
+    species: List[Species]
+    breeds: Dict[int, List[Breed]]  # by species_id
+    conditions: List[ConditionOut]
+    vaccines: List[VaccineOut]
+    activities: List[Activity]
+    feedings: List[Feeding]
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import date
-from typing import List
+from typing import List, Optional
 
 class Species(BaseModel):
     species_id: int
@@ -32,3 +32,48 @@ class PetOut(BaseModel):
     weight: float
     conditions: List[str]
     vaccines: List[str]
+
+class PetMetricsOut(BaseModel):
+    id: int
+    name: str
+    weight: Optional[float]
+    height: Optional[float]
+    bmi: float
+    status: str
+
+class PetRoutine(BaseModel):
+    name: str
+    frequency: int
+
+class LatestHealthRecord(BaseModel):
+    report_id: int
+    health_metric: Optional[float] = None
+    previous_metric: Optional[float] = None
+    delta: Optional[float] = None
+    record_count: int
+    date: date
+
+class PetDashboard(BaseModel):
+    id: int
+    name: str
+    species: str
+    breed: str
+    birthdate: Optional[date]
+    height: Optional[float]
+    weight: Optional[float]
+    bmi: float
+    status: str
+    activities: List[PetRoutine]
+    feedings: List[PetRoutine]
+    conditions: List[str]
+    vaccines: List[str]
+    latest_health: Optional[LatestHealthRecord]
+
+class PetNutritionOut(BaseModel):
+    id: int
+    name: str
+    weight: Optional[float]
+    daily_calories: float
+    resting_energy: float
+    intake_ratio: Optional[float]
+    status: str
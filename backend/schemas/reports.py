@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date
 from typing import List, Optional
 
@@ -7,8 +7,23 @@ class PetHistory(BaseModel):
     bmiStatus: float
     date: date
 
+class BulkHistoryRow(PetHistory):
+    # history_register.body_metric is Numeric(2, 1): anything that rounds past 9.9 overflows
+    bmiStatus: float = Field(gt=-9.95, lt=9.95)
+
+class BulkHistoryRowResult(BaseModel):
+    index: int
+    status: str  # "created" or "error"
+    detail: Optional[str] = None
+
+class BulkHistoryResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[BulkHistoryRowResult]
+
 class ReportResponse(BaseModel):
     id: int
+    pet_id: int
     report_type: str
     created_at: date
     pet_name: str
@@ -17,4 +32,19 @@ class ReportResponse(BaseModel):
     pet_weight: float
     pet_height: float
     health_metric: float
+    previous_metric: Optional[float] = None
+    delta: Optional[float] = None
+    record_count: int = 1
     conditions: List[str]
+
+class RollupBucket(BaseModel):
+    period_start: date
+    count: int
+    avg: float
+    min: float
+    max: float
+
+class RollupResponse(BaseModel):
+    pet_id: int
+    granularity: str
+    buckets: List[RollupBucket]
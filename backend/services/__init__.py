@@ -3,11 +3,15 @@ from .pet_service import PetService
 from .medical_service import MedicalService
 from .activity_service import ActivityService
 from .report_service import ReportService
+from .catalog_service import CatalogService
+from .nutrition_service import NutritionService
 
 __all__ = [
     "UserService",
     "PetService", 
     "MedicalService",
     "ActivityService",
-    "ReportService"
+    "ReportService",
+    "CatalogService",
+    "NutritionService"
 ]
\ No newline at end of file
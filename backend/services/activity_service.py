@@ -1,7 +1,16 @@
 from sqlalchemy.orm.session import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from fastapi import HTTPException
+from ..config.settings import settings
 from ..repositories.activity_repository import ActivityRepository
-from ..schemas.activity import ActivityCreate, FeedingCreate
+from ..repositories.async_repositories import AsyncActivityRepository
+from ..repositories.pet_repository import PetRepository
+from ..services.pet_service import PetService
+from ..schemas.activity import Activity, Feeding, ActivityCreate, FeedingCreate
 from ..models.relationships import Pet_activity, Pet_feeding
+from ..utils.reference_cache import reference_cache, CatalogEntry
+from typing import Dict, List, Tuple
 
 class ActivityService:
 
@@ -12,7 +21,14 @@ class ActivityService:
             activity_id=activity_data.activity_id,
             weekly_frequency_activity=activity_data.frequency
         )
-        return ActivityRepository.create_pet_activity(db, pet_activity)
+        try:
+            pet_activity = ActivityRepository.create_pet_activity(db, pet_activity)
+        except IntegrityError:
+            # The pet or activity was deleted after check_activity_refs
+            ActivityService.check_activity_refs(db, activity_data)
+            raise HTTPException(status_code=400, detail="Invalid pet activity")
+        PetService.invalidate_dashboard(activity_data.pet_id)
+        return pet_activity
 
     @staticmethod
     def create_pet_feeding(db: Session, feeding_data: FeedingCreate):
@@ -21,8 +37,84 @@ class ActivityService:
             feeding_id=feeding_data.feeding_id,
             daily_meal_frequency=feeding_data.frequency
         )
-        return ActivityRepository.create_pet_feeding(db, pet_feeding)
+        try:
+            pet_feeding = ActivityRepository.create_pet_feeding(db, pet_feeding)
+        except IntegrityError:
+            ActivityService.check_feeding_refs(db, feeding_data)
+            raise HTTPException(status_code=400, detail="Invalid pet feeding")
+        PetService.invalidate_dashboard(feeding_data.pet_id)
+        return pet_feeding
     
+    @staticmethod
+    def upsert_pet_activities(db: Session, items: List[ActivityCreate]) -> int:
+        """Create or update many pet activities at once. Every pet and activity id
+        is checked first (one query each); nothing is written if any is unknown"""
+        ActivityService._check_batch_size(items)
+        ActivityService._check_batch_refs(
+            db, {item.pet_id for item in items}, {item.activity_id for item in items},
+            ActivityRepository.existing_activity_ids, "Activity"
+        )
+        # One row per key, the last one wins, as if the items were posted in order
+        rows: Dict[Tuple[int, int], dict] = {}
+        for item in items:
+            rows[(item.pet_id, item.activity_id)] = {
+                "pet_id": item.pet_id, "activity_id": item.activity_id, "weekly_frequency_activity": item.frequency
+            }
+        count = ActivityRepository.upsert_pet_activities(db, list(rows.values()))
+        PetService.invalidate_dashboard(*{item.pet_id for item in items})
+        return count
+
+    @staticmethod
+    def upsert_pet_feedings(db: Session, items: List[FeedingCreate]) -> int:
+        """Feeding counterpart of upsert_pet_activities"""
+        ActivityService._check_batch_size(items)
+        ActivityService._check_batch_refs(
+            db, {item.pet_id for item in items}, {item.feeding_id for item in items},
+            ActivityRepository.existing_feeding_ids, "Feeding"
+        )
+        rows: Dict[Tuple[int, int], dict] = {}
+        for item in items:
+            rows[(item.pet_id, item.feeding_id)] = {
+                "pet_id": item.pet_id, "feeding_id": item.feeding_id, "daily_meal_frequency": item.frequency
+            }
+        count = ActivityRepository.upsert_pet_feedings(db, list(rows.values()))
+        PetService.invalidate_dashboard(*{item.pet_id for item in items})
+        return count
+
+    @staticmethod
+    def _check_batch_size(items: list):
+        if len(items) > settings.BATCH_UPSERT_MAX_ROWS:
+            raise HTTPException(status_code=413, detail=f"At most {settings.BATCH_UPSERT_MAX_ROWS} rows per batch")
+
+    @staticmethod
+    def _check_batch_refs(db: Session, pet_ids: set, ref_ids: set, existing_ref_ids, ref_label: str):
+        unknown_pets = sorted(pet_ids - PetRepository.existing_pet_ids(db, pet_ids))
+        if unknown_pets:
+            raise HTTPException(status_code=404, detail=f"Pet not found: {unknown_pets}")
+        unknown_refs = sorted(ref_ids - existing_ref_ids(db, ref_ids))
+        if unknown_refs:
+            raise HTTPException(status_code=404, detail=f"{ref_label} not found: {unknown_refs}")
+
+    @staticmethod
+    def check_activity_refs(db: Session, activity_data: ActivityCreate):
+        pet_found, activity_found = ActivityRepository.pet_and_activity_exist(
+            db, activity_data.pet_id, activity_data.activity_id
+        )
+        if not pet_found:
+            raise HTTPException(status_code=404, detail="Pet not found")
+        if not activity_found:
+            raise HTTPException(status_code=404, detail="Activity not found")
+
+    @staticmethod
+    def check_feeding_refs(db: Session, feeding_data: FeedingCreate):
+        pet_found, feeding_found = ActivityRepository.pet_and_feeding_exist(
+            db, feeding_data.pet_id, feeding_data.feeding_id
+        )
+        if not pet_found:
+            raise HTTPException(status_code=404, detail="Pet not found")
+        if not feeding_found:
+            raise HTTPException(status_code=404, detail="Feeding not found")
+
     @staticmethod
     def activity_exists(db: Session, activity_id: int):
         return ActivityRepository.get_activity_by_id(db, activity_id) is not None
@@ -31,6 +123,10 @@ class ActivityService:
     def get_activities_by_pet(db: Session, pet_id: int):
         return ActivityRepository.get_activities_by_pet(db, pet_id)
     
+    @staticmethod
+    async def get_activities_by_pet_async(db: AsyncSession, pet_id: int):
+        return await AsyncActivityRepository.get_activities_by_pet(db, pet_id)
+    
     @staticmethod
     def feeding_exists(db: Session, feeding_id: int):
         return ActivityRepository.get_feeding_by_id(db, feeding_id) is not None
@@ -39,6 +135,10 @@ class ActivityService:
     def get_feedings_by_pet(db: Session, pet_id: int):
         return ActivityRepository.get_feedings_by_pet(db, pet_id)
 
+    @staticmethod
+    async def get_feedings_by_pet_async(db: AsyncSession, pet_id: int):
+        return await AsyncActivityRepository.get_feedings_by_pet(db, pet_id)
+
     @staticmethod
     def get_all_activities(db: Session):
         return ActivityRepository.get_activities(db)
@@ -54,4 +154,17 @@ class ActivityService:
     @staticmethod
     def get_feedings(db: Session):
         return ActivityRepository.get_feedings(db)
-    
+
+    @staticmethod
+    def get_activities_catalog(db: Session) -> CatalogEntry:
+        return reference_cache.get("activities", lambda: ActivityRepository.get_activities(db), Activity)
+
+    @staticmethod
+    def get_feedings_catalog(db: Session) -> CatalogEntry:
+        return reference_cache.get("feedings", lambda: ActivityRepository.get_feedings(db), Feeding)
+
+    @staticmethod
+    def invalidate_catalogs():
+        reference_cache.invalidate("activities")
+        reference_cache.invalidate("feedings")
+        reference_cache.invalidate("bootstrap")
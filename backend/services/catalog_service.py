@@ -0,0 +1,59 @@
+import asyncio
+import gzip
+import hashlib
+import signal
+from typing import NamedTuple
+from sqlalchemy.orm.session import Session
+from ..services.medical_service import MedicalService
+from ..services.activity_service import ActivityService
+from ..utils.reference_cache import reference_cache
+
+class BootstrapEntry(NamedTuple):
+    payload: bytes  # JSON object, already serialized
+    gzipped: bytes  # the same payload, gzip-compressed once
+    version: str  # content hash, used as the ETag
+
+class CatalogService:
+
+    @staticmethod
+    def get_bootstrap(db: Session) -> BootstrapEntry:
+        """Every catalog the pet forms need, with breeds grouped by species"""
+        return reference_cache.get_or_build("bootstrap", lambda: CatalogService._build_bootstrap(db))
+
+    @staticmethod
+    def invalidate_catalogs():
+        """Drop every cached catalog and the bootstrap built from them, after
+        the catalog tables were changed outside the API"""
+        MedicalService.invalidate_catalogs()
+        ActivityService.invalidate_catalogs()
+
+    @staticmethod
+    def reload_on_signal() -> bool:
+        """Invalidate this process's catalogs on SIGUSR1. The callback runs on the
+        event loop, not inside the signal handler, so it never interrupts a thread
+        holding the cache lock. Call from the running loop in the main thread;
+        returns False where that is not possible (Windows, test clients)"""
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, CatalogService.invalidate_catalogs)
+        except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+            return False
+        return True
+
+    @staticmethod
+    def _build_bootstrap(db: Session) -> BootstrapEntry:
+        # Reuse the bytes already cached for each catalog endpoint
+        parts = [
+            (b"species", MedicalService.get_species_catalog(db).payload),
+            (b"breeds", b"{%s}" % b",".join(
+                b'"%d":%s' % (species_id, entry.payload)
+                for species_id, entry in MedicalService.get_breeds_by_species_catalog(db).items()
+            )),
+            (b"conditions", MedicalService.get_conditions_catalog(db).payload),
+            (b"vaccines", MedicalService.get_vaccines_catalog(db).payload),
+            (b"activities", ActivityService.get_activities_catalog(db).payload),
+            (b"feedings", ActivityService.get_feedings_catalog(db).payload),
+        ]
+        body = b",".join(b'"%s":%s' % (name, payload) for name, payload in parts)
+        version = hashlib.sha256(body).hexdigest()[:16]
+        payload = b'{"version":"%s",%s}' % (version.encode(), body)
+        return BootstrapEntry(payload, gzip.compress(payload, mtime=0), version)
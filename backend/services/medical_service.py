@@ -1,5 +1,10 @@
 from sqlalchemy.orm.session import Session
+from collections import defaultdict
+from typing import Dict, Iterable, List
 from ..repositories.medical_repository import MedicalRepository
+from ..schemas.medical import ConditionOut, VaccineOut
+from ..schemas.pet import Species, Breed
+from ..utils.reference_cache import reference_cache, build_catalog_entry, CatalogEntry, EMPTY_CATALOG
 
 class MedicalService:
 
@@ -26,3 +31,65 @@ class MedicalService:
     @staticmethod
     def get_breeds_by_species(db: Session, species_id: int):
         return MedicalRepository.get_breeds_by_species(db, species_id)
+
+    # Cached catalogs, served as pre-serialized JSON
+
+    @staticmethod
+    def get_conditions_catalog(db: Session) -> CatalogEntry:
+        return reference_cache.get("conditions", lambda: MedicalRepository.get_medical_conditions(db), ConditionOut)
+
+    @staticmethod
+    def get_vaccines_catalog(db: Session) -> CatalogEntry:
+        return reference_cache.get("vaccines", lambda: MedicalRepository.get_vaccines(db), VaccineOut)
+
+    @staticmethod
+    def get_species_catalog(db: Session) -> CatalogEntry:
+        return reference_cache.get("species", lambda: MedicalRepository.get_species(db), Species)
+
+    @staticmethod
+    def get_breeds_catalog(db: Session, species_id: int) -> CatalogEntry:
+        """Breeds of one species, cut from the cached catalog of every breed, so
+        unknown species ids neither query nor add cache entries"""
+        return MedicalService.get_breeds_by_species_catalog(db).get(species_id, EMPTY_CATALOG)
+
+    @staticmethod
+    def get_breeds_by_species_catalog(db: Session) -> Dict[int, CatalogEntry]:
+        def build():
+            grouped = defaultdict(list)
+            for breed in MedicalRepository.get_breeds(db):
+                grouped[breed.species_id].append(breed)
+            return {species_id: build_catalog_entry(rows, Breed) for species_id, rows in grouped.items()}
+        return reference_cache.get_or_build("breeds", build)
+
+    @staticmethod
+    def find_unknown_condition_ids(db: Session, condition_ids: Iterable[int]) -> List[int]:
+        return MedicalService._find_unknown_ids(
+            db, condition_ids, MedicalService.get_conditions_catalog, lambda item: item.mc_id,
+            MedicalRepository.existing_condition_ids
+        )
+
+    @staticmethod
+    def find_unknown_vaccine_ids(db: Session, vaccine_ids: Iterable[int]) -> List[int]:
+        return MedicalService._find_unknown_ids(
+            db, vaccine_ids, MedicalService.get_vaccines_catalog, lambda item: item.vaccine_id,
+            MedicalRepository.existing_vaccine_ids
+        )
+
+    @staticmethod
+    def _find_unknown_ids(db: Session, ids, get_catalog, id_of, existing_ids) -> List[int]:
+        ids = list(ids)
+        if not ids:
+            return []
+        known = {id_of(item) for item in get_catalog(db).items}
+        missing = {item_id for item_id in ids if item_id not in known}
+        if not missing:
+            return []
+        # The catalog may have grown since it was cached: check only the misses
+        # with one IN query instead of reloading it
+        known = existing_ids(db, missing)
+        return [item_id for item_id in ids if item_id in missing and item_id not in known]
+
+    @staticmethod
+    def invalidate_catalogs():
+        for key in ("conditions", "vaccines", "species", "breeds", "bootstrap"):
+            reference_cache.invalidate(key)
@@ -0,0 +1,45 @@
+from sqlalchemy.orm.session import Session
+from ..repositories.activity_repository import ActivityRepository
+from ..utils.health_metrics import calculate_energy_balance_batch
+from typing import Iterator, List
+
+class NutritionService:
+
+    @staticmethod
+    def get_user_nutrition(db: Session, user_id: int) -> List[dict]:
+        """Daily calories against resting energy requirement for every pet of the user"""
+        return NutritionService._summarize(ActivityRepository.get_daily_calories(db, user_id=user_id))
+
+    @staticmethod
+    def iter_nutrition(db: Session, chunk_size: int = 1000) -> Iterator[List[dict]]:
+        """The same summary for every pet in the table, one chunk of ``chunk_size``
+        pets (one aggregate query) at a time"""
+        after_pet_id = None
+        while True:
+            rows = ActivityRepository.get_daily_calories(db, after_pet_id=after_pet_id, limit=chunk_size)
+            if not rows:
+                return
+            yield NutritionService._summarize(rows)
+            if len(rows) < chunk_size:
+                return
+            after_pet_id = rows[-1].pet_id
+
+    @staticmethod
+    def _summarize(rows) -> List[dict]:
+        if not rows:
+            return []
+        rers, ratios, statuses = calculate_energy_balance_batch(
+            [row.weight for row in rows], [row.daily_calories for row in rows]
+        )
+        return [
+            {
+                "id": row.pet_id,
+                "name": row.name,
+                "weight": row.weight,
+                "daily_calories": float(row.daily_calories),
+                "resting_energy": rer,
+                "intake_ratio": ratio,
+                "status": status
+            }
+            for row, rer, ratio, status in zip(rows, rers, ratios, statuses)
+        ]
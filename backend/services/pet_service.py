@@ -1,11 +1,18 @@
 from sqlalchemy.orm.session import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from ..repositories.pet_repository import PetRepository
 from ..repositories.medical_repository import MedicalRepository
+from ..repositories.activity_repository import ActivityRepository
+from ..repositories.async_repositories import AsyncPetRepository
 from ..services.user_service import UserService
-from ..schemas.pet import PetCreate
+from ..services.medical_service import MedicalService
+from ..schemas.pet import PetCreate, PetDashboard
 from ..models.pet import Pet
-from ..models.relationships import Pet_medical_condition, Pet_vaccine
+from ..utils.pagination import PageParams, trim_page
+from ..utils.health_metrics import calculate_health_metrics, calculate_health_metrics_batch, species_thresholds
+from ..utils.reference_cache import dashboard_cache
+from typing import List, Optional, Tuple
 
 class PetService:
 
@@ -21,6 +28,16 @@ class PetService:
         if existing_pet:
             raise HTTPException(status_code=409, detail="Pet with this name already exists")
 
+        # Validate link ids against the cached catalogs instead of waiting for FK errors
+        condition_ids = list(dict.fromkeys(pet_data.conditions))
+        vaccine_ids = list(dict.fromkeys(pet_data.vaccines))
+        unknown_conditions = MedicalService.find_unknown_condition_ids(db, condition_ids)
+        if unknown_conditions:
+            raise HTTPException(status_code=404, detail=f"Medical condition not found: {unknown_conditions}")
+        unknown_vaccines = MedicalService.find_unknown_vaccine_ids(db, vaccine_ids)
+        if unknown_vaccines:
+            raise HTTPException(status_code=404, detail=f"Vaccine not found: {unknown_vaccines}")
+
         # Calculate age using the static function from the original model
         age = Pet.calculate_age(pet_data.birthdate)
         
@@ -36,63 +53,131 @@ class PetService:
             user_id=pet_data.user_id  # type: ignore
         )
         
-        # Save pet
-        pet = PetRepository.create(db, pet)
-        
-        # Create medical conditions (EXACT as in the original)
-        for condition_id in pet_data.conditions:
-            pet_condition = Pet_medical_condition(
-                pet_id=pet.pet_id,  # type: ignore
-                mc_id=condition_id
-            )
-            db.add(pet_condition)
-        
-        # Create vaccines (EXACT as in the original)
-        for vaccine_id in pet_data.vaccines:
-            pet_vaccine = Pet_vaccine(
-                pet_id=pet.pet_id,  # type: ignore
-                vaccine_id=vaccine_id
-            )
-            db.add(pet_vaccine)
-        
-        db.commit()
+        # Pet and link rows go in one transaction, links as a single executemany each
+        pet = PetRepository.create_with_links(db, pet, condition_ids, vaccine_ids)
         
         return pet
 
     @staticmethod
     def get_user_pets(db: Session, user_id: int):
+        # Three queries no matter how many pets: pets with species/breed
+        # names, then conditions and vaccines batched by pet id
+        rows = PetRepository.get_user_pets_with_names(db, user_id)
+        return PetService._pets_to_dicts(db, rows)
 
-        pets = PetRepository.get_user_pets(db, user_id)
-        
-        if not pets:
+    @staticmethod
+    def get_user_pets_page(db: Session, user_id: int, page: PageParams) -> Tuple[List[dict], Optional[str]]:
+        """One page of get_user_pets plus the cursor of the next page (None on the last one)"""
+        fetch = page.limit + 1 if page.limit is not None else None  # one extra row tells if more follow
+        rows = PetRepository.get_user_pets_with_names(db, user_id, page.after_id, fetch)
+        rows, next_cursor = trim_page(rows, page.limit, key=lambda row: row[0].pet_id)
+        return PetService._pets_to_dicts(db, rows), next_cursor
+
+    @staticmethod
+    def _pets_to_dicts(db: Session, rows) -> List[dict]:
+        if not rows:
             # Return empty list instead of raising exception
             return []
 
-        result = []
-        for pet in pets:
-            # Get information exactly as in the original
-            species = PetRepository.get_species_by_id(db, pet.species_id)  # type: ignore
-            breed = PetRepository.get_breed_by_id(db, pet.breed_id)  # type: ignore
-            conditions = MedicalRepository.get_conditions_by_pet(db, pet.pet_id)  # type: ignore
-            vaccines = MedicalRepository.get_vaccines_by_pet(db, pet.pet_id)  # type: ignore
-            
-            conditions_names = [condition.name for condition in conditions]
-            vaccines_names = [vaccine.name for vaccine in vaccines]
+        pet_ids = [pet.pet_id for pet, _, _ in rows]
+        conditions = MedicalRepository.get_conditions_for_pets(db, pet_ids)  # type: ignore
+        vaccines = MedicalRepository.get_vaccines_for_pets(db, pet_ids)  # type: ignore
 
+        result = []
+        for pet, species_name, breed_name in rows:
             result.append({
                 "id": pet.pet_id,  # type: ignore
                 "name": pet.name,  # type: ignore
-                "species": species.name if species else "Unknown",  
-                "breed": breed.name if breed else "Unknown",
+                "species": species_name or "Unknown",  
+                "breed": breed_name or "Unknown",
                 "birthdate": pet.date_of_birth,  # type: ignore
                 "height": pet.height,  # type: ignore
                 "weight": pet.weight,  # type: ignore
-                "conditions": conditions_names,  
-                "vaccines": vaccines_names        
+                "conditions": conditions.get(pet.pet_id, []),  # type: ignore
+                "vaccines": vaccines.get(pet.pet_id, [])  # type: ignore
             })
 
         return result
     
+    @staticmethod
+    def get_user_pet_metrics(db: Session, user_id: int) -> List[dict]:
+        """BMI and status of every pet of the user, computed in one batch"""
+        rows = PetRepository.get_user_pet_measures(db, user_id)
+        if not rows:
+            return []
+        species = MedicalService.get_species_catalog(db).items
+        thresholds = species_thresholds((item.species_id, item.name) for item in species)
+        _, names, species_ids, weights, heights = zip(*rows)
+        bmis, statuses = calculate_health_metrics_batch(weights, heights, species_ids, thresholds)
+        return [
+            {
+                "id": row.pet_id,
+                "name": row.name,
+                "weight": row.weight,
+                "height": row.height,
+                "bmi": bmi,
+                "status": status
+            }
+            for row, bmi, status in zip(rows, bmis, statuses)
+        ]
+
+    @staticmethod
+    def get_pet_dashboard(db: Session, pet_id: int) -> bytes:
+        """Everything the dashboard shows for one pet, as cached JSON bytes"""
+        return dashboard_cache.get_document(
+            f"pet:{pet_id}", lambda: PetService._build_dashboard(db, pet_id), PetDashboard
+        )
+
+    @staticmethod
+    def invalidate_dashboard(*pet_ids: int):
+        for pet_id in pet_ids:
+            dashboard_cache.invalidate(f"pet:{pet_id}")
+
+    @staticmethod
+    def _build_dashboard(db: Session, pet_id: int) -> dict:
+        # Five queries: pet with names and health summary, activities,
+        # feedings, conditions and vaccines
+        row = PetRepository.get_pet_with_summary(db, pet_id)
+        if row is None:
+            raise HTTPException(status_code=404, detail="Pet not found")
+        pet = row[0]
+        species = row.species_name or "Unknown"
+        metrics = calculate_health_metrics({"weight": pet.weight or 0, "height": pet.height or 0, "species": species})
+        activities = ActivityRepository.get_activities_by_pet(db, pet_id)
+        feedings = ActivityRepository.get_feedings_by_pet(db, pet_id)
+
+        latest_health = None
+        if row.latest_hr_id is not None:
+            latest_health = {
+                "report_id": row.latest_hr_id,
+                "health_metric": row.latest_metric,
+                "previous_metric": row.previous_metric,
+                "delta": row.delta,
+                "record_count": row.record_count,
+                "date": row.latest_date
+            }
+
+        return {
+            "id": pet.pet_id,
+            "name": pet.name,
+            "species": species,
+            "breed": row.breed_name or "Unknown",
+            "birthdate": pet.date_of_birth,
+            "height": pet.height,
+            "weight": pet.weight,
+            "bmi": metrics["bmi"],
+            "status": metrics["status"],
+            "activities": [{"name": name, "frequency": frequency} for name, frequency in activities],
+            "feedings": [{"name": name, "frequency": frequency} for name, frequency in feedings],
+            "conditions": MedicalRepository.get_conditions_for_pets(db, [pet_id]).get(pet_id, []),
+            "vaccines": MedicalRepository.get_vaccines_for_pets(db, [pet_id]).get(pet_id, []),
+            "latest_health": latest_health
+        }
+
     @staticmethod
     def pet_exists(db: Session, pet_id: int) -> bool:
         return PetRepository.get_pet_by_id(db, pet_id) is not None
+
+    @staticmethod
+    async def pet_exists_async(db: AsyncSession, pet_id: int) -> bool:
+        return await AsyncPetRepository.get_pet_by_id(db, pet_id) is not None
@@ -1,10 +1,32 @@
+import csv
+import io
+import json
+from pydantic import TypeAdapter, ValidationError
+from fastapi import HTTPException
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..repositories.report_repository import ReportRepository
-from ..schemas.reports import PetHistory
+from ..repositories.rollup_repository import RollupRepository
+from ..repositories.async_repositories import AsyncPetRepository, AsyncReportRepository
+from ..schemas.reports import PetHistory, BulkHistoryRow
+from ..services.pet_service import PetService
 from ..models.relationships import Pet_history
+from ..utils.pagination import PageParams, trim_page
+from ..utils.downsampling import lttb_stream
+from ..config.settings import settings
+from datetime import date
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+_history_adapter = TypeAdapter(BulkHistoryRow)
 
 class ReportService:
 
+    EXPORT_COLUMNS = ["pet_id", "pet_name", "species", "breed", "report_id", "date", "body_metric"]
+
+    # Approximate bucket widths in days, coarsest first
+    ROLLUP_WIDTHS = {"month": 30.44, "week": 7, "day": 1}
+
     @staticmethod
     def create_report(db: Session, report_data: PetHistory):
         pet_history = Pet_history(
@@ -12,8 +34,186 @@ class ReportService:
             date=report_data.date,
             body_metric=report_data.bmiStatus
         )
-        return ReportRepository.create_pet_history(db, pet_history)
+        pet_history = ReportRepository.create_pet_history(db, pet_history)
+        PetService.invalidate_dashboard(report_data.petId)
+        return pet_history
 
     @staticmethod
     def get_pet_reports_for_user(db: Session, user_id: int):
         return ReportRepository.get_pet_reports_for_user(db, user_id)
+
+    @staticmethod
+    def get_pet_reports_page(db: Session, user_id: int, page: PageParams) -> Tuple[List[dict], Optional[str]]:
+        """One page of reports (keyed on pet_id) plus the cursor of the next page"""
+        fetch = page.limit + 1 if page.limit is not None else None  # one extra row tells if more follow
+        reports = ReportRepository.get_pet_reports_for_user(db, user_id, page.after_id, fetch)
+        return trim_page(reports, page.limit, key=lambda report: report["pet_id"])
+
+    @staticmethod
+    def get_pet_history_series(db: Session, pet_id: int, date_from: Optional[date], date_to: Optional[date],
+                               points: int) -> Tuple[int, bool, Iterator[Dict[str, Any]]]:
+        """Body-metric series of a pet ordered by date as (total rows, downsampled, points).
+        Series longer than ``points`` are reduced with LTTB; shorter ones are streamed as read"""
+        total = ReportRepository.count_pet_history(db, pet_id, date_from, date_to)
+        rows = ReportRepository.iter_pet_history(db, pet_id, date_from, date_to)
+        if total <= points:
+            return total, False, ({"date": day.isoformat(), "value": float(value)} for day, value in rows)
+
+        # Bucket-at-a-time LTTB over the counted rows: memory holds two buckets, not the range
+        kept = lttb_stream(rows, total, points, lambda row: (row[0].toordinal(), float(row[1])))
+        return total, True, ({"date": day.isoformat(), "value": float(value)} for day, value in kept)
+
+    @staticmethod
+    async def read_history_upload(chunks: AsyncIterator[bytes], ndjson: bool) -> Tuple[List[Any], Dict[int, str]]:
+        """Items of a bulk upload (JSON array or NDJSON) plus per-row parse errors
+        by index, read from the request stream. NDJSON is parsed line by line and
+        rejected with 413 as soon as it passes BULK_INGEST_MAX_ROWS; a JSON array
+        body is capped at BULK_INGEST_MAX_BYTES"""
+        max_rows, max_bytes = settings.BULK_INGEST_MAX_ROWS, settings.BULK_INGEST_MAX_BYTES
+        too_many_rows = HTTPException(status_code=413, detail=f"At most {max_rows} rows per upload")
+        too_large = HTTPException(status_code=413, detail=f"At most {max_bytes} bytes per upload")
+
+        if not ndjson:
+            body = bytearray()
+            async for chunk in chunks:
+                body += chunk
+                if len(body) > max_bytes:
+                    raise too_large
+            try:
+                items = json.loads(body)
+            except ValueError:
+                items = None
+            if not isinstance(items, list):
+                raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+            if len(items) > max_rows:
+                raise too_many_rows
+            return items, {}
+
+        items: List[Any] = []
+        errors: Dict[int, str] = {}
+        pending = b""
+        async for chunk in chunks:
+            *lines, pending = (pending + chunk).split(b"\n")
+            if len(pending) > max_bytes:
+                raise too_large
+            for line in lines:
+                ReportService._add_ndjson_line(line, items, errors)
+                if len(items) > max_rows:
+                    raise too_many_rows
+        ReportService._add_ndjson_line(pending, items, errors)
+        if len(items) > max_rows:
+            raise too_many_rows
+        return items, errors
+
+    @staticmethod
+    def _add_ndjson_line(line: bytes, items: List[Any], errors: Dict[int, str]):
+        if not line.strip():
+            return
+        try:
+            items.append(json.loads(line))
+        except ValueError:
+            errors[len(items)] = "Invalid JSON"
+            items.append(None)
+
+    @staticmethod
+    async def ingest_history_async(db: AsyncSession, items: List[Any], errors: Dict[int, str]) -> Dict[str, Any]:
+        """Validate and insert a batch of history readings. Rows that fail
+        validation or name an unknown pet are reported and skipped; the rest
+        are inserted together in one transaction"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending: List[Tuple[int, PetHistory]] = []
+        for index, item in enumerate(items):
+            if index in errors:
+                results[index] = {"index": index, "status": "error", "detail": errors[index]}
+                continue
+            try:
+                pending.append((index, _history_adapter.validate_python(item)))
+            except ValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(part) for part in error["loc"])
+                detail = f"{field}: {error['msg']}" if field else error["msg"]
+                results[index] = {"index": index, "status": "error", "detail": detail}
+
+        # All pet ids checked with one query
+        known_pets = await AsyncPetRepository.existing_pet_ids(db, {record.petId for _, record in pending})
+        rows, row_indexes = [], []
+        for index, record in pending:
+            if record.petId not in known_pets:
+                results[index] = {"index": index, "status": "error", "detail": "Pet not found"}
+                continue
+            rows.append({"pet_id": record.petId, "date": record.date, "body_metric": record.bmiStatus})
+            row_indexes.append(index)
+
+        try:
+            created = await AsyncReportRepository.bulk_create_pet_history(db, rows)
+        except SQLAlchemyError:
+            # The batch was rolled back as a whole: none of the valid rows were saved
+            for index in row_indexes:
+                results[index] = {"index": index, "status": "error", "detail": "Not saved: database error"}
+            return {"created": 0, "failed": len(items), "results": results}
+
+        PetService.invalidate_dashboard(*{row["pet_id"] for row in rows})
+        for index in row_indexes:
+            results[index] = {"index": index, "status": "created"}
+
+        return {"created": created, "failed": len(items) - created, "results": results}
+
+    @staticmethod
+    def export_history(db: Session, user_id: int, fmt: str, chunk_rows: int = 500) -> Iterator[str]:
+        """A user's full history as CSV (with header) or NDJSON text chunks of
+        ``chunk_rows`` rows each, produced as the rows are read"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if fmt == "csv" else None
+        if writer is not None:
+            writer.writerow(ReportService.EXPORT_COLUMNS)
+
+        for count, row in enumerate(ReportRepository.iter_user_history(db, user_id), start=1):
+            values = [
+                row.pet_id,
+                row.pet_name,
+                row.species_name or "Unknown",
+                row.breed_name or "Unknown",
+                row.hr_id,
+                row.date.isoformat() if row.date else None,
+                None if row.body_metric is None else float(row.body_metric)
+            ]
+            if writer is not None:
+                writer.writerow(values)
+            else:
+                buffer.write(json.dumps(dict(zip(ReportService.EXPORT_COLUMNS, values))) + "\n")
+            if count % chunk_rows == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @staticmethod
+    def pick_granularity(date_from: date, date_to: date, points: int) -> str:
+        """Coarsest rollup that still gives at least ``points`` buckets over the range"""
+        days = (date_to - date_from).days + 1
+        for period, width in ReportService.ROLLUP_WIDTHS.items():
+            if days / width >= points:
+                return period
+        return "day"
+
+    @staticmethod
+    def get_pet_rollups(db: Session, pet_id: int, date_from: date, date_to: date,
+                        points: int, granularity: Optional[str] = None) -> Dict[str, Any]:
+        period = granularity or ReportService.pick_granularity(date_from, date_to, points)
+        buckets = RollupRepository.get_rollups(db, pet_id, period, date_from, date_to)
+        return {
+            "pet_id": pet_id,
+            "granularity": period,
+            "buckets": [
+                {
+                    "period_start": bucket.period_start,
+                    "count": bucket.record_count,
+                    "avg": round(float(bucket.total) / bucket.record_count, 2),
+                    "min": float(bucket.min_metric),
+                    "max": float(bucket.max_metric)
+                }
+                for bucket in buckets
+            ]
+        }
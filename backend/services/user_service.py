@@ -1,27 +1,46 @@
 from sqlalchemy.orm.session import Session
+from typing import Optional
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..repositories.user_repository import UserRepository
+from ..repositories.async_repositories import AsyncUserRepository
 from ..schemas.user import UserCreate, UserLogin
 from ..models.user import User
+from ..utils.password_pool import password_pool, PasswordPoolBusy
 
 class UserService:
 
+    # Checked in this order so the first reported conflict matches the old messages
+    CONFLICT_MESSAGES = {
+        "email": "A user with this email already exists",
+        "phone": "A user with this phone number already exists",
+        "name": "A user with this name already exists",
+    }
+
+    @staticmethod
+    def check_user_available(db: Session, user_data: UserCreate):
+        conflicts = UserRepository.find_conflicts(db, user_data.email, user_data.phone, user_data.name)
+        if conflicts:
+            raise UserService._conflict_error(conflicts)
+
+    @staticmethod
+    def _conflict_error(conflicts) -> HTTPException:
+        field = next(field for field in UserService.CONFLICT_MESSAGES if field in conflicts)
+        return HTTPException(status_code=409, detail=UserService.CONFLICT_MESSAGES[field])
+
+    @staticmethod
+    def _insert_user(db: Session, user: User, user_data: UserCreate):
+        try:
+            return UserRepository.create_user(db, user)
+        except IntegrityError:
+            # Lost a race with a concurrent registration
+            conflicts = UserRepository.find_conflicts(db, user_data.email, user_data.phone, user_data.name)
+            raise UserService._conflict_error(conflicts or {"email"})
+
     @staticmethod
     def create_user(db: Session, user_data: UserCreate):
-        # Check if user with email already exists
-        existing_user = UserRepository.get_by_email(db, user_data.email)
-        if existing_user:
-            raise HTTPException(status_code=409, detail="A user with this email already exists")
-        
-        # Check if user with phone already exists
-        existing_user_phone = UserRepository.get_by_phone(db, user_data.phone)
-        if existing_user_phone:
-            raise HTTPException(status_code=409, detail="A user with this phone number already exists")
-        
-        # Check if user with name already exists
-        existing_user_name = UserRepository.get_by_name(db, user_data.name) 
-        if existing_user_name:
-            raise HTTPException(status_code=409, detail="A user with this name already exists")
+        UserService.check_user_available(db, user_data)
         
         # Create new user
         user = User(
@@ -32,7 +51,7 @@ class UserService:
         # Hash the password
         user.password_to_hash(user_data.password)
         
-        return UserRepository.create_user(db, user)
+        return UserService._insert_user(db, user, user_data)
 
     @staticmethod
     def login_user(db: Session, user_data: UserLogin):
@@ -47,6 +66,55 @@ class UserService:
         
         return user
 
+    @staticmethod
+    async def create_user_async(db: AsyncSession, user_data: UserCreate):
+        # Same flow as create_user, but bcrypt runs on the password pool
+        # and the database calls go through the async session
+        await db.run_sync(UserService.check_user_available, user_data)
+
+        user = User(
+            name=user_data.name,
+            email=user_data.email,
+            phone_number=user_data.phone
+        )
+        user.password_hash = await UserService._password_job(password_pool.hash, user_data.password)  # type: ignore
+
+        return await db.run_sync(UserService._insert_user, user, user_data)
+
+    @staticmethod
+    async def login_user_async(db: AsyncSession, user_data: UserLogin):
+        user = await AsyncUserRepository.get_by_email(db, user_data.email)
+        if not user:
+            raise HTTPException(status_code=401, detail="Invalid email or password")
+
+        password_hash = str(user.password_hash)
+        if not await UserService._password_job(password_pool.verify, user_data.password, password_hash):
+            raise HTTPException(status_code=401, detail="Invalid email or password")
+
+        return user
+
+    @staticmethod
+    async def _password_job(job, *args):
+        # Fail fast with 503 when the pool is saturated instead of queueing forever
+        try:
+            return await job(*args)
+        except PasswordPoolBusy as busy:
+            raise HTTPException(
+                status_code=503,
+                detail="Server is busy, please retry shortly",
+                headers={"Retry-After": str(busy.retry_after)}
+            )
+
+    @staticmethod
+    def ensure_user_exists(db: Session, user_id: int, token_user_id: Optional[int] = None):
+        # A valid signed token for this user already proves it exists: skip the lookup
+        if token_user_id is not None and token_user_id != user_id:
+            raise HTTPException(status_code=403, detail="Not allowed to access this user")
+        if token_user_id == user_id:
+            return
+        if not UserRepository.get_user_by_id(db, user_id):
+            raise HTTPException(status_code=404, detail="User not found")
+
     @staticmethod
     def get_user_by_email(db: Session, email: str):
         return UserRepository.get_by_email(db, email)
@@ -55,4 +123,3 @@ class UserService:
     def get_user_by_id(db: Session, user_id: int):
         user = UserRepository.get_user_by_id(db, user_id)
         return user
-
@@ -1,4 +1,13 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
 import bcrypt
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from typing import Optional
+from ..config.settings import settings
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
@@ -8,3 +17,42 @@ def hash_password(password: str) -> str:
 def verify_password(password: str, hashed: str) -> bool:
     """Verify a password against its hash"""
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+def _sign(payload: str) -> str:
+    digest = hmac.new(settings.SECRET_KEY.encode('utf-8'), payload.encode('ascii'), hashlib.sha256).digest()
+    return _b64encode(digest)
+
+def create_access_token(user_id: int, expires_in: Optional[int] = None) -> str:
+    """Create an HMAC-SHA256 signed token carrying the user id and an expiry"""
+    if expires_in is None:
+        expires_in = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    claims = {"sub": user_id, "exp": int(time.time()) + expires_in}
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode('utf-8'))
+    return f"{payload}.{_sign(payload)}"
+
+def decode_access_token(token: str) -> Optional[int]:
+    """Return the user id of a valid, unexpired token, or None"""
+    try:
+        payload, signature = token.split(".")
+        if not hmac.compare_digest(signature, _sign(payload)):
+            return None
+        claims = json.loads(_b64decode(payload))
+        if claims["exp"] < time.time():
+            return None
+        return int(claims["sub"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+def get_token_user_id(credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)) -> Optional[int]:
+    """Dependency: user id from a valid Bearer token, None when missing or invalid"""
+    if credentials is None:
+        return None
+    return decode_access_token(credentials.credentials)
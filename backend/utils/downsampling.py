@@ -0,0 +1,96 @@
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple, TypeVar
+
+Point = Tuple[float, float]
+T = TypeVar("T")
+
+def lttb(points: Sequence[Point], threshold: int) -> List[int]:
+    """Largest-Triangle-Three-Buckets: indexes of ``threshold`` points that keep
+    the visual shape of an x-sorted series. First and last points are always kept"""
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    selected = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0  # index of the last selected point
+
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket (the last point for the final bucket)
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        if next_start >= next_end:
+            next_start, next_end = n - 1, n
+        count = next_end - next_start
+        avg_x = sum(points[j][0] for j in range(next_start, next_end)) / count
+        avg_y = sum(points[j][1] for j in range(next_start, next_end)) / count
+
+        # Keep the point forming the largest triangle with the previous pick and that average
+        ax, ay = points[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (points[j][1] - ay) - (ax - points[j][0]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+
+    selected.append(n - 1)
+    return selected
+
+def lttb_stream(items: Iterable[T], n: int, threshold: int, point: Callable[[T], Point]) -> Iterator[T]:
+    """LTTB over ``n`` x-sorted items read once, in order. Only the current and
+    the next bucket are held in memory; yields the items lttb() would select.
+    ``point`` maps an item to its (x, y)"""
+    items = iter(items)
+    if threshold >= n or threshold < 3:
+        yield from items
+        return
+
+    bucket_size = (n - 2) / (threshold - 2)
+    buckets = threshold - 2
+
+    def read_bucket(i: int) -> List[T]:
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        return list(islice(items, end - start))
+
+    first = next(items, None)
+    if first is None:
+        return
+    yield first
+    ax, ay = point(first)
+
+    current = read_bucket(0)
+    for i in range(buckets):
+        if i + 1 < buckets:
+            following = read_bucket(i + 1)
+        else:
+            # Only the last point follows the final bucket; drain to it even if
+            # the source grew since ``n`` was counted
+            last = None
+            for last in items:
+                pass
+            following = [last] if last is not None else []
+        if not current:
+            break
+
+        averaged = [point(item) for item in following] or [point(current[-1])]
+        avg_x = sum(x for x, _ in averaged) / len(averaged)
+        avg_y = sum(y for _, y in averaged) / len(averaged)
+
+        best, best_area, best_point = current[0], -1.0, None
+        for item in current:
+            x, y = point(item)
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best, best_area, best_point = item, area, (x, y)
+        yield best
+        ax, ay = best_point
+        current = following
+
+    if current:
+        yield current[-1]
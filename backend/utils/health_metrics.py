@@ -1,4 +1,24 @@
 from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: the *_batch functions fall back to plain Python
+    np = None
+
+BMI_STATUSES = ("Underweight", "Healthy", "Overweight", "Obese")
+UNKNOWN_STATUS = "Unknown"
+
+# Per species name: BMI where Healthy starts, then the (inclusive) top of Healthy and Overweight
+BMI_THRESHOLDS: Dict[str, Tuple[float, float, float]] = {
+    "dog": (15.0, 25.0, 30.0),
+    "cat": (18.0, 27.0, 32.0),
+}
+
+# Daily intake as a multiple of the resting energy requirement (RER): below 1x
+# does not cover resting needs; adult maintenance is usually 1.2-1.8x
+INTAKE_RATIO_LIMITS = (1.0, 2.0)
+INTAKE_STATUSES = ("Insufficient", "Adequate", "Excessive")
 
 def calculate_age(birthdate: date) -> int:
     """Calculate age in years from birthdate"""
@@ -17,31 +37,12 @@ def calculate_health_metrics(pet_data: dict) -> dict:
     weight = float(pet_data.get('weight', 0))
     height = float(pet_data.get('height', 0))
     age = pet_data.get('age', 0)
-    species = pet_data.get('species', '').lower()
     
     bmi = calculate_bmi(weight, height)
     
-    # Basic health status based on BMI and species
-    if species == 'dog':
-        if bmi < 15:
-            status = 'Underweight'
-        elif 15 <= bmi <= 25:
-            status = 'Healthy'
-        elif 25 < bmi <= 30:
-            status = 'Overweight'
-        else:
-            status = 'Obese'
-    elif species == 'cat':
-        if bmi < 18:
-            status = 'Underweight'
-        elif 18 <= bmi <= 27:
-            status = 'Healthy'
-        elif 27 < bmi <= 32:
-            status = 'Overweight'
-        else:
-            status = 'Obese'
-    else:
-        status = 'Unknown'
+    # Basic health status based on BMI and the species thresholds
+    thresholds = thresholds_for(pet_data.get('species'))
+    status = bmi_status(bmi, thresholds) if thresholds else UNKNOWN_STATUS
     
     return {
         'bmi': round(bmi, 2),
@@ -50,3 +51,100 @@ def calculate_health_metrics(pet_data: dict) -> dict:
         'height': height,
         'age': age
     }
+
+def bmi_status(bmi: float, thresholds: Tuple[float, float, float]) -> str:
+    """Status label of a BMI against one species' thresholds"""
+    healthy_from, healthy_to, overweight_to = thresholds
+    return BMI_STATUSES[(bmi >= healthy_from) + (bmi > healthy_to) + (bmi > overweight_to)]
+
+def thresholds_for(species_name: Optional[str]) -> Optional[Tuple[float, float, float]]:
+    """BMI_THRESHOLDS of a species name as stored or typed ("Dog", " dog "), or None"""
+    return BMI_THRESHOLDS.get((species_name or "").strip().casefold())
+
+def species_thresholds(species: Iterable[Tuple[int, str]]) -> Dict[int, Tuple[float, float, float]]:
+    """Map (species_id, name) pairs onto BMI_THRESHOLDS by id; unknown names are left out"""
+    thresholds = ((species_id, thresholds_for(name)) for species_id, name in species)
+    return {species_id: found for species_id, found in thresholds if found}
+
+def calculate_health_metrics_batch(weights: Sequence, heights: Sequence, species_ids: Sequence[Optional[int]],
+                                   thresholds: Dict[int, Tuple[float, float, float]]) -> Tuple[List[float], List[str]]:
+    """BMI (rounded to 2 decimals) and status for many pets at once.
+
+    Gives the same results as calculate_health_metrics row by row, with
+    missing measures counted as 0 and species missing from ``thresholds``
+    as Unknown. Runs as one NumPy pass when NumPy is installed.
+    """
+    if np is None:
+        return _health_metrics_loop(weights, heights, species_ids, thresholds)
+
+    weight = np.nan_to_num(np.asarray(weights, dtype=float))
+    height = np.nan_to_num(np.asarray(heights, dtype=float))
+    bmi = np.divide(weight, height * height, out=np.zeros_like(weight), where=height > 0)
+
+    level = np.full(bmi.shape, len(BMI_STATUSES))  # Unknown unless the species has thresholds
+    if thresholds:
+        ids = np.array(sorted(thresholds), dtype=float)
+        table = np.array([thresholds[species_id] for species_id in sorted(thresholds)], dtype=float)
+        species = np.asarray(species_ids, dtype=float)  # None becomes NaN and never matches
+        pos = np.minimum(np.searchsorted(ids, species), len(ids) - 1)
+        known = ids[pos] == species
+        limits = table[pos]
+        graded = (bmi >= limits[:, 0]).astype(int) + (bmi > limits[:, 1]) + (bmi > limits[:, 2])
+        level = np.where(known, graded, level)
+
+    labels = np.array(BMI_STATUSES + (UNKNOWN_STATUS,), dtype=object)
+    return np.round(bmi, 2).tolist(), labels[level].tolist()
+
+def _health_metrics_loop(weights, heights, species_ids, thresholds) -> Tuple[List[float], List[str]]:
+    bmis, statuses = [], []
+    for weight, height, species_id in zip(weights, heights, species_ids):
+        bmi = calculate_bmi(float(weight or 0), float(height or 0))
+        limits = thresholds.get(species_id)
+        bmis.append(round(bmi, 2))
+        statuses.append(bmi_status(bmi, limits) if limits else UNKNOWN_STATUS)
+    return bmis, statuses
+
+def calculate_rer(weight: float) -> float:
+    """Resting energy requirement in kcal/day, 70 * weight(kg) ^ 0.75"""
+    if weight <= 0:
+        return 0.0
+    return 70 * weight ** 0.75
+
+def intake_status(ratio: float) -> str:
+    """Status label of daily intake divided by RER"""
+    low, high = INTAKE_RATIO_LIMITS
+    return INTAKE_STATUSES[(ratio >= low) + (ratio > high)]
+
+def calculate_energy_balance_batch(weights: Sequence, daily_calories: Sequence
+                                   ) -> Tuple[List[float], List[Optional[float]], List[str]]:
+    """RER (1 decimal), intake/RER ratio (2 decimals) and intake status for many
+    pets at once. Pets without a weight get ratio None and status Unknown.
+    Runs as one NumPy pass when NumPy is installed"""
+    if np is None:
+        return _energy_balance_loop(weights, daily_calories)
+
+    weight = np.nan_to_num(np.asarray(weights, dtype=float))
+    calories = np.nan_to_num(np.asarray(daily_calories, dtype=float))
+    known = weight > 0
+    rer = np.where(known, 70 * np.power(np.maximum(weight, 0), 0.75), 0.0)
+    ratio = np.divide(calories, rer, out=np.zeros_like(rer), where=known)
+    low, high = INTAKE_RATIO_LIMITS
+    level = np.where(known, (ratio >= low).astype(int) + (ratio > high), len(INTAKE_STATUSES))
+
+    labels = np.array(INTAKE_STATUSES + (UNKNOWN_STATUS,), dtype=object)
+    ratios = np.where(known, np.round(ratio, 2), None).tolist()
+    return np.round(rer, 1).tolist(), ratios, labels[level].tolist()
+
+def _energy_balance_loop(weights, daily_calories) -> Tuple[List[float], List[Optional[float]], List[str]]:
+    rers, ratios, statuses = [], [], []
+    for weight, calories in zip(weights, daily_calories):
+        rer = calculate_rer(float(weight or 0))
+        rers.append(round(rer, 1))
+        if rer > 0:
+            ratio = float(calories or 0) / rer
+            ratios.append(round(ratio, 2))
+            statuses.append(intake_status(ratio))
+        else:
+            ratios.append(None)
+            statuses.append(UNKNOWN_STATUS)
+    return rers, ratios, statuses
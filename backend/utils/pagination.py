@@ -0,0 +1,49 @@
+import base64
+import json
+from fastapi import HTTPException, Query, Response
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+from ..config.settings import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+class PageParams(NamedTuple):
+    limit: Optional[int]
+    after_id: Optional[int]
+
+def encode_cursor(last_id: int) -> str:
+    """Opaque cursor pointing just past the row with ``last_id``"""
+    payload = json.dumps({"after": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+def decode_cursor(cursor: str) -> int:
+    """Inverse of encode_cursor, raises ValueError for anything it did not produce"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return int(json.loads(payload)["after"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+def page_params(
+    limit: Optional[int] = Query(None, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None)
+) -> PageParams:
+    """Dependency: ``limit`` and ``cursor`` query parameters. Without a limit the
+    whole list is returned, as before pagination existed"""
+    if cursor is None:
+        return PageParams(limit, None)
+    try:
+        after_id = decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return PageParams(limit or settings.PAGE_SIZE_MAX, after_id)
+
+def trim_page(rows: List[Any], limit: Optional[int], key: Callable[[Any], int]) -> Tuple[List[Any], Optional[str]]:
+    """Cut rows fetched with ``limit + 1`` down to the page and build the next cursor"""
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(key(rows[-1]))
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]):
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
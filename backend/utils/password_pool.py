@@ -0,0 +1,56 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from ..config.settings import settings
+from .auth_utils import hash_password, verify_password
+
+class PasswordPoolBusy(Exception):
+    """Raised when the password pool has no free slot for a new job"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Password hashing pool is saturated")
+        self.retry_after = retry_after
+
+class PasswordPool:
+    """Bounded thread pool for bcrypt work.
+
+    At most ``max_workers`` jobs run at once and at most ``max_queue`` more
+    wait for a worker. Anything beyond that is rejected right away with
+    PasswordPoolBusy so the caller can answer 503 instead of timing out.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, retry_after: int = 1):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self.retry_after = retry_after
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password")
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordPoolBusy(self.retry_after)
+        try:
+            job = self._executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Freed when the job itself ends: a cancelled await must not free the
+        # slot while bcrypt is still running on a worker
+        job.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(job)
+
+    async def hash(self, password: str) -> str:
+        return await self.run(hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self.run(verify_password, password, hashed)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+password_pool = PasswordPool(
+    settings.PASSWORD_POOL_WORKERS,
+    settings.PASSWORD_POOL_MAX_QUEUE,
+    settings.PASSWORD_POOL_RETRY_AFTER,
+)
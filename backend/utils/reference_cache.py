@@ -0,0 +1,104 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Type
+from pydantic import BaseModel, TypeAdapter
+from ..config.settings import settings
+
+class CatalogEntry(NamedTuple):
+    payload: bytes  # JSON array, already serialized
+    count: int
+    items: tuple  # validated schema objects, for lookups such as id checks
+
+EMPTY_CATALOG = CatalogEntry(b"[]", 0, ())
+
+def build_catalog_entry(rows: List[Any], schema: Type[BaseModel]) -> CatalogEntry:
+    """Validate ``rows`` with ``schema`` and serialize them once"""
+    adapter = TypeAdapter(List[schema])
+    items = adapter.validate_python(rows, from_attributes=True)
+    return CatalogEntry(adapter.dump_json(items), len(items), tuple(items))
+
+class ReferenceCache:
+    """In-process cache for catalog tables that almost never change.
+
+    Entries hold the response body as JSON bytes, so a hit costs no query
+    and no Pydantic work. Entries expire after ``ttl`` seconds and can be
+    dropped explicitly with ``invalidate``. A miss is built once per key
+    (single flight) outside the cache lock, so misses on different keys run
+    in parallel.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[str, tuple] = {}
+        # Builds in flight, by key. invalidate drops the matching ones, so a build
+        # no longer listed here raced an invalidation of its own key and is not stored
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()  # guards the dicts only, never held while building
+
+    def get(self, key: str, loader: Callable[[], List[Any]], schema: Type[BaseModel]) -> CatalogEntry:
+        return self.get_or_build(key, lambda: build_catalog_entry(loader(), schema))
+
+    def get_document(self, key: str, loader: Callable[[], Any], schema: Type[BaseModel]) -> bytes:
+        """A single object (not a list) serialized with ``schema``. Errors raised
+        by ``loader`` propagate and nothing is cached"""
+        return self.get_or_build(
+            key, lambda: schema.model_validate(loader(), from_attributes=True).model_dump_json().encode()
+        )
+
+    def get_or_build(self, key: str, build: Callable[[], Any]) -> Any:
+        """Any value made by ``build``, cached under ``key`` with the same TTL.
+        Concurrent misses on ``key`` wait for the first caller's build"""
+        cached = self._entries.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        with self._lock:
+            # Another thread may have filled the entry in the meantime
+            cached = self._entries.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            pending = self._pending.get(key)
+            building = pending is None
+            if building:
+                pending = self._pending[key] = Future()
+        if not building:
+            return pending.result()
+
+        try:
+            entry = build()
+        except BaseException as error:
+            self._finish(key, pending)
+            pending.set_exception(error)
+            raise
+        with self._lock:
+            if self._pending.get(key) is pending:
+                del self._pending[key]
+                now = time.monotonic()
+                # Expired entries are only replaced when read again: prune them here
+                for expired in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                    del self._entries[expired]
+                self._entries[key] = (now + self.ttl, entry)
+        pending.set_result(entry)
+        return entry
+
+    def _finish(self, key: str, pending: Future):
+        with self._lock:
+            if self._pending.get(key) is pending:
+                del self._pending[key]
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one entry, every entry under a ``prefix:`` key, or everything"""
+        with self._lock:
+            for entries in (self._entries, self._pending):
+                if key is None:
+                    entries.clear()
+                    continue
+                for cached_key in list(entries):
+                    if cached_key == key or cached_key.startswith(f"{key}:"):
+                        del entries[cached_key]
+
+reference_cache = ReferenceCache(settings.CATALOG_CACHE_TTL)
+
+# Per-pet dashboards, dropped by the services that write the pet's data
+dashboard_cache = ReferenceCache(settings.DASHBOARD_CACHE_TTL)
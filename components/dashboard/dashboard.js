@@ -394,17 +394,13 @@ class Dashboard {
         
         try {
             const token = localStorage.getItem('authToken');
-            const [activitiesResponse, foodsResponse] = await Promise.all([
-                fetch(`/api/activities/pet/${pet.id}`, {
-                    headers: { 'Authorization': `Bearer ${token}` }
-                }),
-                fetch(`/api/foods/pet/${pet.id}`, {
-                    headers: { 'Authorization': `Bearer ${token}` }
-                })
-            ]);
-
-            const activities = activitiesResponse.ok ? await activitiesResponse.json() : [];
-            const foods = foodsResponse.ok ? await foodsResponse.json() : [];
+            const response = await fetch(`/api/pets/${pet.id}/dashboard`, {
+                headers: { 'Authorization': `Bearer ${token}` }
+            });
+
+            const dashboard = response.ok ? await response.json() : null;
+            const activities = dashboard ? dashboard.activities : [];
+            const foods = dashboard ? dashboard.feedings : [];
 
             let content = '';
             console.log('Activities:', activities);
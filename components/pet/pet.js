@@ -2,6 +2,7 @@
 class Pet {
     constructor() {
         this.currentPetForActivity = null;
+        this.breedsBySpecies = {};
         this.init();
     }
 
@@ -378,10 +379,26 @@ class Pet {
         });
     }
 
-    async loadVaccines() {
+    async loadCatalogs() {
+        // One request for every catalog the forms use, breeds included
+        try {
+            const response = await fetch('/api/catalog/bootstrap');
+            const catalogs = await response.json();
+            this.breedsBySpecies = catalogs.breeds;
+
+            this.loadMedicalConditions(catalogs.conditions);
+            this.loadVaccines(catalogs.vaccines);
+            this.loadSpecies(catalogs.species);
+            this.setupBreedSelector();
+            this.loadActivities(catalogs.activities);
+            this.loadFeedings(catalogs.feedings);
+        } catch (error) {
+            console.error('Error loading catalogs:', error);
+        }
+    }
+
+    loadVaccines(vaccines) {
         try {
-            const response = await fetch('/vaccines');
-            const vaccines = await response.json();
 
             console.log('Vaccines:', vaccines);
 
@@ -400,10 +417,8 @@ class Pet {
         }
     }
 
-    async loadMedicalConditions() {
+    loadMedicalConditions(conditions) {
     try {
-        const response = await fetch('/conditions');
-        const conditions = await response.json();
 
         const select = document.getElementById('pet-conditions');
         select.innerHTML = ''; // Clear existing options
@@ -422,10 +437,8 @@ class Pet {
         }
     }
 
-    async loadSpecies() {
+    loadSpecies(species) {
         try {
-            const response = await fetch('/species');
-            const species = await response.json();
 
             const select = document.getElementById('pet-species');
             select.innerHTML = ''; // Clear existing options
@@ -466,8 +479,7 @@ class Pet {
         }
 
         try { 
-            const response = await fetch(`/breeds/${speciesId}`);
-            const breeds = await response.json();
+            const breeds = this.breedsBySpecies[speciesId] || [];
 
             const defaultOption = document.createElement('option');
             defaultOption.value = "0";
@@ -481,14 +493,12 @@ class Pet {
                 breedSelect.appendChild(option);
             });
         } catch (error) {
-            console.error('Error fetching breeds:', error);
+            console.error('Error loading breeds:', error);
         }
     });}
 
-    async loadActivities() {
+    loadActivities(activities) {
         try {
-            const response = await fetch('/activities');
-            const activities = await response.json();
 
             const select = document.getElementById('activity-name');
             select.innerHTML = ''; // Clear existing options
@@ -505,10 +515,8 @@ class Pet {
         }
     }
 
-    async loadFeedings() {
+    loadFeedings(feedings) {
         try {
-            const response = await fetch('/feedings');
-            const feedings = await response.json();
 
             const select = document.getElementById('food-name');
             select.innerHTML = ''; // Clear existing options
@@ -529,12 +537,7 @@ class Pet {
 
 // Initialize when the page is ready
 window.addEventListener('DOMContentLoaded', () => {
-    window.petComponent.loadMedicalConditions();
-    window.petComponent.loadVaccines();
-    window.petComponent.loadSpecies();
-    window.petComponent.setupBreedSelector();
-    window.petComponent.loadActivities();
-    window.petComponent.loadFeedings();
+    window.petComponent.loadCatalogs();
 });
 
 // Initialize pet component
@@ -1,24 +1,36 @@
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm.session import Session
-from backend.config.database import Base, engine, get_db
+from sqlalchemy.exc import DBAPIError
+from backend.config.database import engine
 from backend.config.settings import settings
-from backend.routers import auth, pets, medical, activities, reports
-from backend.services.medical_service import MedicalService
+from backend.config.migrations import upgrade_database
+from backend.routers import auth, pets, medical, activities, reports, catalog, system
+from backend.services.catalog_service import CatalogService
+from backend.utils.password_pool import password_pool
+from backend.utils.pagination import NEXT_CURSOR_HEADER
 
 # Crear tablas solo si no estamos en modo de importación
 import os
 if not os.environ.get('SKIP_DB_INIT'):
     try:
-        Base.metadata.create_all(bind=engine)  # type: ignore
-        print("✅ Base de datos inicializada correctamente")
-    except Exception as e:
+        with engine.connect():
+            pass
+    except DBAPIError as e:
         print(f"⚠️  Advertencia: No se pudo conectar a la base de datos: {e}")
         print("🔧 La aplicación se ejecutará en modo sin base de datos")
         # Establecer variable de entorno para evitar reconexiones
         os.environ['SKIP_DB_INIT'] = 'true'
+    else:
+        # Tables, indexes and backfills, run by one worker at a time. A failure
+        # here is a schema or data problem, not a missing database: stop startup
+        try:
+            upgrade_database(engine)
+        except Exception as e:
+            print(f"❌ Error al actualizar la base de datos: {e!r}")
+            raise
+        print("✅ Base de datos inicializada correctamente")
 
 app = FastAPI(title="PetCare Monitor API", version="1.0.0")
 
@@ -29,6 +41,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Static files
@@ -41,6 +54,18 @@ app.include_router(pets.router)
 app.include_router(medical.router)
 app.include_router(activities.router)
 app.include_router(reports.router)
+# Legacy catalog routes without the /api prefix, used by the frontend
+app.include_router(catalog.router)
+app.include_router(system.router)
+
+@app.on_event("startup")
+async def reload_catalogs_on_signal():
+    # kill -USR1 <worker pid> drops that worker's catalog cache
+    CatalogService.reload_on_signal()
+
+@app.on_event("shutdown")
+def shutdown_password_pool():
+    password_pool.shutdown()
 
 @app.get("/", response_class=HTMLResponse)
 def serve_index():
@@ -53,42 +78,3 @@ def serve_index():
             return f.read()
     except FileNotFoundError:
         return "<h1>Error: index.html not found</h1>"
-
-# Para mantener compatibilidad con las rutas del frontend sin prefijo /api
-@app.get("/species")
-def get_species_legacy(db: Session = Depends(get_db)):
-
-    if not MedicalService.get_species(db):
-        raise HTTPException(status_code=404, detail="No species found")
-    return MedicalService.get_species(db)
-
-@app.get("/breeds/{species_id}")
-def get_breeds_legacy(species_id: int, db: Session = Depends(get_db)):
-
-    if not MedicalService.get_breeds_by_species(db, species_id):
-        raise HTTPException(status_code=404, detail="No breeds found for this species")
-    return MedicalService.get_breeds_by_species(db, species_id)
-
-@app.get("/conditions")
-def get_conditions_legacy(db: Session = Depends(get_db)):
-
-    if not MedicalService.get_medical_conditions(db):
-        raise HTTPException(status_code=404, detail="No medical conditions found")
-    return MedicalService.get_medical_conditions(db)
-
-@app.get("/vaccines")
-def get_vaccines_legacy(db: Session = Depends(get_db)):
-
-    if not MedicalService.get_vaccines(db):
-        raise HTTPException(status_code=404, detail="No vaccines found")
-    return MedicalService.get_vaccines(db)
-
-@app.get("/activities")
-def get_activities_legacy(db: Session = Depends(get_db)):
-    from backend.services.activity_service import ActivityService
-    return ActivityService.get_all_activities(db)
-
-@app.get("/feedings")
-def get_feedings_legacy(db: Session = Depends(get_db)):
-    from backend.services.activity_service import ActivityService
-    return ActivityService.get_all_feedings(db)
@@ -0,0 +1,123 @@
+"""Throughput of the sync and async data-access paths.
+
+Replays two of the JMeter scenarios (login, and the per-pet activity and
+feeding reads) in-process with concurrent clients. Each scenario runs once
+against a sync handler (Session on Starlette's threadpool) and once against
+the real async route (AsyncSession through aiosqlite/asyncpg), on the same
+database: a temporary SQLite file, or an empty scratch database given in
+BENCH_DATABASE_URL.
+
+    python testing/benchmarks/async_throughput.py [concurrency] [requests]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL", f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy.orm.session import Session
+from backend.config.database import Base, engine, SessionLocal, get_db
+from backend.models import Activity, Feeding, Pet, Pet_activity, Pet_feeding, User
+from backend.routers import activities, auth
+from backend.schemas.user import UserLogin
+from backend.services.activity_service import ActivityService
+from backend.services.pet_service import PetService
+from backend.services.user_service import UserService
+
+PETS = 50
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = User(name="bench", email="bench@example.com", phone_number="000")
+    user.password_to_hash("bench-password")
+    db.add(user)
+    db.add_all([Activity(activity_id=i, name=f"Activity {i}", description="-") for i in range(1, 6)])
+    db.add_all([Feeding(feeding_id=i, name=f"Feeding {i}", description="-", calories=100) for i in range(1, 6)])
+    for pet_id in range(1, PETS + 1):
+        db.add(Pet(pet_id=pet_id, name=f"Pet {pet_id}", user_id=1))
+        db.add_all([Pet_activity(pet_id=pet_id, activity_id=i, weekly_frequency_activity=i) for i in range(1, 6)])
+        db.add_all([Pet_feeding(pet_id=pet_id, feeding_id=i, daily_meal_frequency=i) for i in range(1, 6)])
+    db.commit()
+    db.close()
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(auth.router)
+    app.include_router(activities.router)
+
+    # Sync twins of the async routes, as they were before the async stack
+    @app.get("/sync/activities/pet/{pet_id}")
+    def sync_activities(pet_id: int, db: Session = Depends(get_db)):
+        if not PetService.pet_exists(db, pet_id):
+            raise HTTPException(status_code=404, detail="Pet not found")
+        return [{"name": row[0], "frequency": row[1]} for row in ActivityService.get_activities_by_pet(db, pet_id)]
+
+    @app.get("/sync/foods/pet/{pet_id}")
+    def sync_feedings(pet_id: int, db: Session = Depends(get_db)):
+        if not PetService.pet_exists(db, pet_id):
+            raise HTTPException(status_code=404, detail="Pet not found")
+        return [{"name": row[0], "frequency": row[1]} for row in ActivityService.get_feedings_by_pet(db, pet_id)]
+
+    @app.post("/sync/auth/login")
+    def sync_login(data: UserLogin, db: Session = Depends(get_db)):
+        user = UserService.login_user(db, data)
+        return {"user": {"user_id": user.user_id}}
+
+    return app
+
+async def run_scenario(client, requests, concurrency, make_request):
+    queue = asyncio.Queue()
+    for index in range(requests):
+        queue.put_nowait(index)
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while not queue.empty():
+            index = queue.get_nowait()
+            response = await make_request(client, index)
+            errors += response.status_code >= 400
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return requests / elapsed, errors
+
+async def main(concurrency: int, requests: int):
+    seed()
+    transport = httpx.ASGITransport(app=build_app())
+    login = {"email": "bench@example.com", "password": "bench-password"}
+    login_requests = max(concurrency, requests // 20)  # bcrypt is slow on purpose
+
+    scenarios = [
+        ("activities", requests,
+         lambda c, i: c.get(f"/sync/activities/pet/{i % PETS + 1}"),
+         lambda c, i: c.get(f"/api/activities/pet/{i % PETS + 1}")),
+        ("feedings", requests,
+         lambda c, i: c.get(f"/sync/foods/pet/{i % PETS + 1}"),
+         lambda c, i: c.get(f"/api/foods/pet/{i % PETS + 1}")),
+        ("login", login_requests,
+         lambda c, i: c.post("/sync/auth/login", json=login),
+         lambda c, i: c.post("/api/auth/login", json=login)),
+    ]
+
+    print(f"concurrency={concurrency}")
+    print(f"{'scenario':<12}{'requests':>10}{'sync req/s':>14}{'async req/s':>14}{'errors':>10}")
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, count, sync_request, async_request in scenarios:
+            sync_rps, sync_errors = await run_scenario(client, count, concurrency, sync_request)
+            async_rps, async_errors = await run_scenario(client, count, concurrency, async_request)
+            print(f"{name:<12}{count:>10}{sync_rps:>14.1f}{async_rps:>14.1f}{sync_errors + async_errors:>10}")
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2000,
+    ))
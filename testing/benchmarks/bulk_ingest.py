@@ -0,0 +1,90 @@
+"""Rows per second for history ingestion.
+
+Sends the same readings through POST /api/reports/bulk (JSON array and
+NDJSON) and, for comparison, one POST /api/reports per reading as the
+clients did before. Runs against a temporary SQLite file, or an empty
+scratch database given in BENCH_DATABASE_URL.
+
+    python testing/benchmarks/bulk_ingest.py [rows] [batch]
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+_tmpdir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL", f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import httpx
+from fastapi import FastAPI
+from backend.config.database import Base, engine, SessionLocal
+from backend.models import Pet
+from backend.routers import reports
+
+PETS = 200
+SINGLE_ROWS = 500  # per-request baseline is slow, keep it short
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    db.add_all([Pet(pet_id=pet_id, name=f"Pet {pet_id}", user_id=1) for pet_id in range(1, PETS + 1)])
+    db.commit()
+    db.close()
+
+def readings(count: int, offset: int = 0):
+    start = date(2020, 1, 1)
+    return [
+        {"petId": i % PETS + 1, "date": (start + timedelta(days=(offset + i) // PETS)).isoformat(),
+         "bmiStatus": round(1 + (i % 80) / 10, 1)}
+        for i in range(count)
+    ]
+
+def chunks(rows, size):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+async def main(rows: int, batch: int):
+    seed()
+    app = FastAPI()
+    app.include_router(reports.router)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        results = []
+
+        started = time.perf_counter()
+        for row in readings(SINGLE_ROWS):
+            await client.post("/api/reports", json=row)
+        results.append(("single POST", SINGLE_ROWS, time.perf_counter() - started))
+
+        data = readings(rows, offset=SINGLE_ROWS)
+        started = time.perf_counter()
+        created = 0
+        for part in chunks(data, batch):
+            created += (await client.post("/api/reports/bulk", json=part)).json()["created"]
+        results.append(("bulk JSON", created, time.perf_counter() - started))
+
+        data = readings(rows, offset=SINGLE_ROWS + rows)
+        started = time.perf_counter()
+        created = 0
+        for part in chunks(data, batch):
+            body = "\n".join(json.dumps(row) for row in part)
+            response = await client.post("/api/reports/bulk", content=body,
+                                         headers={"Content-Type": "application/x-ndjson"})
+            created += response.json()["created"]
+        results.append(("bulk NDJSON", created, time.perf_counter() - started))
+
+    print(f"rows={rows} batch={batch}")
+    print(f"{'mode':<14}{'rows':>10}{'seconds':>10}{'rows/s':>12}")
+    for name, count, elapsed in results:
+        print(f"{name:<14}{count:>10}{elapsed:>10.2f}{count / elapsed:>12.0f}")
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10000,
+    ))
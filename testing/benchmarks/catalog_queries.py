@@ -0,0 +1,80 @@
+"""Query count and latency per request for the catalog endpoints.
+
+Runs the real routers against a seeded in-memory SQLite database and
+prints, for each catalog route, the SQL statements issued on a cold and a
+warm reference cache plus the mean time per request.
+
+    python testing/benchmarks/catalog_queries.py [requests_per_route]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from backend.config.database import Base, get_db
+from backend.models import Species, Breed, Medical_condition, Vaccine, Activity, Feeding
+from backend.routers import catalog, pets, medical, activities
+from backend.utils.reference_cache import reference_cache
+
+ROUTES = [
+    "/species", "/api/pets/species", "/breeds/1", "/api/pets/breeds/1",
+    "/conditions", "/vaccines", "/activities", "/feedings",
+]
+
+def build_client():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    SessionBench = sessionmaker(bind=engine)
+
+    db = SessionBench()
+    db.add_all([Species(species_id=i, name=f"Species {i}") for i in range(1, 4)])
+    db.add_all([Breed(breed_id=i, species_id=1 + i % 3, name=f"Breed {i}") for i in range(1, 60)])
+    db.add_all([Medical_condition(mc_id=i, name=f"Condition {i}", description="-", recommendations="-") for i in range(1, 30)])
+    db.add_all([Vaccine(vaccine_id=i, name=f"Vaccine {i}", recommended_age=0.5) for i in range(1, 15)])
+    db.add_all([Activity(activity_id=i, name=f"Activity {i}", description="-") for i in range(1, 15)])
+    db.add_all([Feeding(feeding_id=i, name=f"Feeding {i}", description="-", calories=120) for i in range(1, 15)])
+    db.commit()
+    db.close()
+
+    def get_bench_db():
+        session = SessionBench()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app = FastAPI()
+    for module in (pets, medical, activities, catalog):
+        app.include_router(module.router)
+    app.dependency_overrides[get_db] = get_bench_db
+    return TestClient(app), engine
+
+def main(requests_per_route: int):
+    client, engine = build_client()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    print(f"{'route':<22}{'cold queries':>14}{'warm queries':>14}{'ms/request':>12}")
+    for route in ROUTES:
+        reference_cache.invalidate()
+        statements.clear()
+        client.get(route)
+        cold = len(statements)
+
+        statements.clear()
+        started = time.perf_counter()
+        for _ in range(requests_per_route):
+            client.get(route)
+        elapsed = time.perf_counter() - started
+        warm = len(statements) / requests_per_route
+
+        print(f"{route:<22}{cold:>14}{warm:>14.1f}{elapsed / requests_per_route * 1000:>12.3f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
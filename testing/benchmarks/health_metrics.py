@@ -0,0 +1,56 @@
+"""Rows per second for the pet health-metric calculation.
+
+Compares calculate_health_metrics called once per pet with
+calculate_health_metrics_batch, on its NumPy path (when installed) and on
+its pure-Python fallback. Needs no database.
+
+    python testing/benchmarks/health_metrics.py [rows]
+"""
+import os
+import random
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.utils import health_metrics
+from backend.utils.health_metrics import calculate_health_metrics, calculate_health_metrics_batch, species_thresholds
+
+SPECIES = [(1, "Dog"), (2, "Cat"), (3, "Parrot")]
+
+def sample(rows: int):
+    rng = random.Random(42)
+    weights = [round(rng.uniform(1, 60), 2) for _ in range(rows)]
+    heights = [round(rng.uniform(0.2, 1.2), 2) for _ in range(rows)]
+    species_ids = [rng.choice(SPECIES)[0] for _ in range(rows)]
+    return weights, heights, species_ids
+
+def scalar(weights, heights, species_ids):
+    names = dict(SPECIES)
+    return [
+        calculate_health_metrics({'weight': weight, 'height': height, 'species': names[species_id]})
+        for weight, height, species_id in zip(weights, heights, species_ids)
+    ]
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - started
+
+def main(rows: int):
+    weights, heights, species_ids = sample(rows)
+    thresholds = species_thresholds(SPECIES)
+    results = [("scalar loop", timed(scalar, weights, heights, species_ids))]
+    if health_metrics.np is not None:
+        results.append(("batch NumPy", timed(calculate_health_metrics_batch, weights, heights, species_ids, thresholds)))
+    with patch.object(health_metrics, 'np', None):
+        results.append(("batch Python", timed(calculate_health_metrics_batch, weights, heights, species_ids, thresholds)))
+
+    print(f"rows={rows}")
+    print(f"{'mode':<14}{'seconds':>10}{'rows/s':>14}{'speedup':>10}")
+    for name, elapsed in results:
+        print(f"{name:<14}{elapsed:>10.2f}{rows / elapsed:>14.0f}{results[0][1] / elapsed:>9.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
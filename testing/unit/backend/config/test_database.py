@@ -0,0 +1,150 @@
+import unittest
+from unittest.mock import Mock, patch
+import os
+import asyncio
+import sqlite3
+import tempfile
+
+# Imports del código a testear
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+from backend.config import database
+from backend.config.database import InstrumentedQueuePool, InstrumentedAsyncQueuePool, PoolWaitStats, engine_options
+
+
+class TestDatabaseConfig(unittest.TestCase):
+    """Test cases for engine options and pool instrumentation"""
+    
+    def test_engine_options_postgres_uses_settings(self):
+        """Test that server databases get the configured pool"""
+        # Act
+        with patch('backend.config.database.settings') as mock_settings:
+            mock_settings.DB_POOL_SIZE = 7
+            mock_settings.DB_MAX_OVERFLOW = 3
+            mock_settings.DB_POOL_TIMEOUT = 5
+            mock_settings.DB_POOL_RECYCLE = 60
+            mock_settings.DB_POOL_PRE_PING = True
+            mock_settings.DB_ECHO = False
+            options = engine_options("postgresql://user:pw@localhost/db")
+        
+        # Assert
+        self.assertIs(options["poolclass"], InstrumentedQueuePool)
+        self.assertEqual(options["pool_size"], 7)
+        self.assertEqual(options["max_overflow"], 3)
+        self.assertEqual(options["pool_timeout"], 5)
+        self.assertEqual(options["pool_recycle"], 60)
+        self.assertFalse(options["echo"])
+        
+    def test_engine_options_sqlite_keeps_default_pool(self):
+        """Test that SQLite URLs do not receive QueuePool arguments"""
+        # Act
+        options = engine_options("sqlite://")
+        
+        # Assert
+        self.assertNotIn("pool_size", options)
+        self.assertNotIn("poolclass", options)
+        
+    def test_instrumented_pool_records_waits_and_timeouts(self):
+        """Test that checkouts and pool timeouts are counted"""
+        # Arrange
+        stats = PoolWaitStats()
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(
+                f"sqlite:///{os.path.join(tmp, 'pool.db')}",
+                poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05
+            )
+            with patch('backend.config.database.pool_wait_stats', stats):
+                # Act
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                    with self.assertRaises(PoolTimeoutError):
+                        engine.connect()
+            engine.dispose()
+        
+        # Assert
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot["checkouts"], 1)
+        self.assertEqual(snapshot["timeouts"], 1)
+        self.assertGreaterEqual(snapshot["max_wait_ms"], 40)
+        
+    def test_instrumented_pool_connect_error_is_not_a_timeout(self):
+        """Test that a failing connect is neither a checkout nor a timeout"""
+        # Arrange
+        stats = PoolWaitStats()
+        def refuse():
+            raise sqlite3.OperationalError("unable to open database file")
+        engine = create_engine("sqlite://", creator=refuse, poolclass=InstrumentedQueuePool)
+        
+        # Act
+        with patch('backend.config.database.pool_wait_stats', stats):
+            with self.assertRaises(DBAPIError):
+                engine.connect()
+        engine.dispose()
+        
+        # Assert
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot["checkouts"], 0)
+        self.assertEqual(snapshot["timeouts"], 0)
+
+        
+    def test_engine_options_async_has_own_budget(self):
+        """Test that the async engine gets its own pool size instead of a second copy of the sync one"""
+        # Act
+        with patch('backend.config.database.settings') as mock_settings:
+            mock_settings.DB_POOL_SIZE = 7
+            mock_settings.DB_MAX_OVERFLOW = 3
+            mock_settings.DB_ASYNC_POOL_SIZE = 2
+            mock_settings.DB_ASYNC_MAX_OVERFLOW = 1
+            options = engine_options("postgresql://user:pw@localhost/db", async_engine=True)
+        
+        # Assert
+        self.assertIs(options["poolclass"], InstrumentedAsyncQueuePool)
+        self.assertEqual(options["pool_size"], 2)
+        self.assertEqual(options["max_overflow"], 1)
+        
+    def test_async_pool_records_into_its_own_stats(self):
+        """Test that async checkouts are counted apart from the sync pool"""
+        # Arrange
+        from sqlalchemy.ext.asyncio import create_async_engine
+        sync_stats, async_stats = PoolWaitStats(), PoolWaitStats()
+        
+        async def scenario(path):
+            async_engine = create_async_engine(
+                f"sqlite+aiosqlite:///{path}", poolclass=InstrumentedAsyncQueuePool, pool_size=1, max_overflow=0
+            )
+            async with async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            await async_engine.dispose()
+        
+        # Act
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch('backend.config.database.pool_wait_stats', sync_stats), \
+                 patch('backend.config.database.async_pool_wait_stats', async_stats):
+                asyncio.run(scenario(os.path.join(tmp, 'pool.db')))
+        
+        # Assert
+        self.assertEqual(async_stats.snapshot()["checkouts"], 1)
+        self.assertEqual(sync_stats.snapshot()["checkouts"], 0)
+        
+    def test_pool_stats_include_async_pool(self):
+        """Test that /api/system/pool covers the async engine once it exists"""
+        # Arrange
+        async_engine = Mock()
+        async_engine.pool = InstrumentedQueuePool(lambda: None, pool_size=2)
+        
+        # Act
+        with patch.object(database, '_async_engine', None):
+            without_async = database.get_pool_stats()
+        with patch.object(database, '_async_engine', async_engine):
+            with_async = database.get_pool_stats()
+        
+        # Assert
+        self.assertNotIn("async", without_async)
+        self.assertEqual(with_async["async"]["size"], 2)
+        self.assertIn("checkouts", with_async["async"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+import unittest
+from unittest.mock import MagicMock
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from datetime import date
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+from backend.config.database import Base
+from backend.config.migrations import ensure_indexes, backfill_health_summary, migration_lock, upgrade_database, MIGRATION_LOCK_ID
+from backend.models import Pet, Pet_history, Pet_health_summary
+
+
+class TestMigrations(unittest.TestCase):
+    """Test cases for upgrading databases created before the indexes existed"""
+    
+    def setUp(self):
+        """Set up a database with the old, index-less schema"""
+        self.engine = create_engine("sqlite://")
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE pet (pet_id INTEGER PRIMARY KEY, name VARCHAR, user_id INTEGER)"))
+            conn.execute(text(
+                'CREATE TABLE "USER" (user_id INTEGER PRIMARY KEY, name VARCHAR, email VARCHAR, '
+                'phone_number VARCHAR, password_hash VARCHAR)'
+            ))
+            conn.execute(text('INSERT INTO "USER" (name, email, phone_number) VALUES (\'a\', \'dup@x\', \'1\')'))
+            conn.execute(text('INSERT INTO "USER" (name, email, phone_number) VALUES (\'b\', \'dup@x\', \'2\')'))
+            
+    def tearDown(self):
+        self.engine.dispose()
+        
+    def test_ensure_indexes_creates_missing_indexes(self):
+        """Test that indexes are added to tables that already exist"""
+        # Act
+        created = ensure_indexes(self.engine)
+        
+        # Assert
+        pet_indexes = {index["name"] for index in inspect(self.engine).get_indexes("pet")}
+        self.assertIn("ix_pet_user_id", created)
+        self.assertIn("ix_pet_user_id", pet_indexes)
+        
+    def test_ensure_indexes_skips_colliding_unique_index(self):
+        """Test that a unique index over duplicate rows is reported, not fatal"""
+        # Act
+        created = ensure_indexes(self.engine)
+        
+        # Assert
+        self.assertNotIn("ix_USER_email", created)
+        self.assertIn("ix_USER_phone_number", created)
+        
+    def test_ensure_indexes_makes_existing_index_unique(self):
+        """Test that an index created non-unique by an older model is replaced"""
+        # Arrange
+        with self.engine.begin() as conn:
+            conn.execute(text('CREATE INDEX "ix_USER_name" ON "USER" (name)'))
+        
+        # Act
+        created = ensure_indexes(self.engine)
+        
+        # Assert
+        indexes = {index["name"]: index for index in inspect(self.engine).get_indexes("USER")}
+        self.assertIn("ix_USER_name", created)
+        self.assertTrue(indexes["ix_USER_name"]["unique"])
+        
+    def test_ensure_indexes_keeps_old_index_when_unique_collides(self):
+        """Test that a failed unique rebuild leaves the non-unique index in place"""
+        # Arrange
+        with self.engine.begin() as conn:
+            conn.execute(text('INSERT INTO "USER" (name, email, phone_number) VALUES (\'a\', \'c@x\', \'3\')'))
+            conn.execute(text('CREATE INDEX "ix_USER_name" ON "USER" (name)'))
+        
+        # Act
+        created = ensure_indexes(self.engine)
+        
+        # Assert
+        indexes = {index["name"]: index for index in inspect(self.engine).get_indexes("USER")}
+        self.assertNotIn("ix_USER_name", created)
+        self.assertFalse(indexes["ix_USER_name"]["unique"])
+        
+    def test_ensure_indexes_is_idempotent(self):
+        """Test that a second run creates nothing"""
+        # Arrange
+        ensure_indexes(self.engine)
+        
+        # Act
+        created = ensure_indexes(self.engine)
+        
+        # Assert
+        self.assertEqual(created, [])
+
+
+
+class TestHealthSummaryBackfill(unittest.TestCase):
+    """Test cases for filling pet_health_summary on databases with history"""
+    
+    def setUp(self):
+        """Set up a database with history but no summary rows"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        with Session(bind=self.engine) as db:
+            db.add(Pet(pet_id=1, name="Buddy", user_id=1))
+            db.add_all([
+                Pet_history(pet_id=1, date=date(2024, 1, 1), body_metric=2.0),
+                Pet_history(pet_id=1, date=date(2024, 3, 1), body_metric=2.4),
+            ])
+            db.commit()
+            
+    def tearDown(self):
+        self.engine.dispose()
+        
+    def test_backfill_fills_empty_summary(self):
+        """Test that the first run summarises every pet with history"""
+        # Act
+        pets = backfill_health_summary(self.engine)
+        
+        # Assert
+        self.assertEqual(pets, 1)
+        with Session(bind=self.engine) as db:
+            summary = db.get(Pet_health_summary, 1)
+            self.assertEqual(summary.latest_date, date(2024, 3, 1))
+            self.assertEqual(summary.record_count, 2)
+            self.assertAlmostEqual(float(summary.delta), 0.4)
+            
+    def test_backfill_skips_existing_summary(self):
+        """Test that startup leaves an already populated summary alone"""
+        # Arrange
+        backfill_health_summary(self.engine)
+        
+        # Act & Assert
+        self.assertEqual(backfill_health_summary(self.engine), 0)
+        self.assertEqual(backfill_health_summary(self.engine, force=True), 1)
+
+
+
+class TestUpgradeDatabase(unittest.TestCase):
+    """Test cases for the locked startup upgrade"""
+    
+    def test_upgrade_creates_schema_and_backfills(self):
+        """Test that an empty database gets every table and nothing to backfill"""
+        # Arrange
+        engine = create_engine("sqlite://")
+        
+        # Act
+        names, pets, rollups = upgrade_database(engine)
+        
+        # Assert
+        self.assertIn("pet_health_summary", inspect(engine).get_table_names())
+        self.assertEqual((names, pets, rollups), ([], 0, 0))
+        engine.dispose()
+        
+    def test_migration_lock_uses_postgres_advisory_lock(self):
+        """Test that PostgreSQL upgrades hold and release the advisory lock"""
+        # Arrange
+        engine = MagicMock()
+        engine.dialect.name = "postgresql"
+        conn = engine.connect.return_value.__enter__.return_value
+        
+        # Act
+        with migration_lock(engine):
+            held = [call.args[0].text for call in conn.execute.call_args_list]
+        
+        # Assert
+        released = [call.args[0].text for call in conn.execute.call_args_list]
+        self.assertEqual(held, ["SELECT pg_advisory_lock(:id)"])
+        self.assertEqual(released[-1], "SELECT pg_advisory_unlock(:id)")
+        self.assertEqual(conn.execute.call_args.args[1], {"id": MIGRATION_LOCK_ID})
+        
+    def test_migration_lock_released_on_error(self):
+        """Test that a failing upgrade still releases the lock"""
+        # Arrange
+        engine = MagicMock()
+        engine.dialect.name = "postgresql"
+        conn = engine.connect.return_value.__enter__.return_value
+        
+        # Act
+        with self.assertRaises(RuntimeError):
+            with migration_lock(engine):
+                raise RuntimeError("bad schema")
+        
+        # Assert
+        self.assertEqual(conn.execute.call_args.args[0].text, "SELECT pg_advisory_unlock(:id)")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+import csv
+import io
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import Pet, Feeding, Pet_feeding
+from backend.jobs.nutrition_summary import run
+
+
+class TestNutritionSummaryJob(SQLiteTestCase):
+    """Test cases for the chunked nutrition summary job"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.seed(
+            Feeding(feeding_id=1, name="Kibble", description="-", calories=100),
+            *[Pet(pet_id=pet_id, name=f"Pet {pet_id}", weight=pet_id, user_id=pet_id % 3) for pet_id in range(1, 8)],
+            Pet_feeding(pet_id=5, feeding_id=1, daily_meal_frequency=3),
+        )
+        
+    def test_run_writes_every_pet(self):
+        """Test that the job writes a CSV row for every pet across chunks"""
+        # Arrange
+        output = io.StringIO()
+        
+        # Act
+        written = run(self.engine, output, chunk_size=3)
+        
+        # Assert
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        self.assertEqual(written, 7)
+        self.assertEqual([row["id"] for row in rows], [str(pet_id) for pet_id in range(1, 8)])
+        self.assertEqual(rows[4]["daily_calories"], "300.0")
+        self.assertEqual(rows[0]["status"], "Insufficient")
+
+
+if __name__ == '__main__':
+    unittest.main()
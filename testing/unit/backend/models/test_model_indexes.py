@@ -0,0 +1,64 @@
+import unittest
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError
+from backend.config.database import Base
+import backend.models  # noqa: F401
+
+
+class TestModelIndexes(unittest.TestCase):
+    """EXPLAIN-based checks that hot-path lookups use the model indexes"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        
+    def tearDown(self):
+        self.engine.dispose()
+        
+    def _plan(self, sql, **params):
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).fetchall()
+        return " | ".join(row[-1] for row in rows)
+        
+    def test_user_pets_uses_user_id_index(self):
+        """Test that get_user_pets searches pet by ix_pet_user_id"""
+        plan = self._plan("SELECT * FROM pet WHERE user_id = :u", u=1)
+        self.assertIn("ix_pet_user_id", plan)
+        
+    def test_breeds_by_species_uses_species_id_index(self):
+        """Test that get_breeds_by_species searches breed by ix_breed_species_id"""
+        plan = self._plan("SELECT * FROM breed WHERE species_id = :s", s=1)
+        self.assertIn("ix_breed_species_id", plan)
+        
+    def test_latest_history_uses_composite_index(self):
+        """Test that the latest-history lookup avoids a sort"""
+        plan = self._plan(
+            "SELECT * FROM history_register WHERE pet_id = :p ORDER BY date DESC LIMIT 1", p=1
+        )
+        self.assertIn("ix_history_register_pet_id_date", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+        
+    def test_user_uniqueness_lookups_use_indexes(self):
+        """Test that the registration lookups hit the email, phone and name indexes"""
+        self.assertIn("ix_USER_email", self._plan('SELECT * FROM "USER" WHERE email = :e', e="a"))
+        self.assertIn("ix_USER_phone_number", self._plan('SELECT * FROM "USER" WHERE phone_number = :p', p="1"))
+        self.assertIn("ix_USER_name", self._plan('SELECT * FROM "USER" WHERE name = :n', n="a"))
+        
+    def test_email_and_phone_are_unique(self):
+        """Test that duplicate emails are rejected by the database"""
+        with self.engine.begin() as conn:
+            conn.execute(text('INSERT INTO "USER" (name, email, phone_number) VALUES (\'a\', \'a@x\', \'1\')'))
+        with self.assertRaises(IntegrityError):
+            with self.engine.begin() as conn:
+                conn.execute(text('INSERT INTO "USER" (name, email, phone_number) VALUES (\'b\', \'a@x\', \'2\')'))
+
+
+if __name__ == '__main__':
+    unittest.main()
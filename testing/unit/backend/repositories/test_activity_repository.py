@@ -15,6 +15,7 @@ class TestActivityRepository(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.mock_db = Mock()
+        self.mock_db.info = {}
         
     @patch('backend.repositories.activity_repository.Activity')
     def test_get_activities(self, mock_activity):
@@ -64,26 +65,26 @@ class TestActivityRepository(unittest.TestCase):
         mock_activity_instance.activity_id = 1
         mock_activity_instance.name = "Walking"
         
-        self.mock_db.query.return_value.filter.return_value.first.return_value = mock_activity_instance
+        self.mock_db.get.return_value = mock_activity_instance
         
         # Act
         result = ActivityRepository.get_activity_by_id(self.mock_db, 1)
         
         # Assert
-        self.mock_db.query.assert_called_once_with(mock_activity)
+        self.mock_db.get.assert_called_once_with(mock_activity, 1)
         self.assertEqual(result, mock_activity_instance)
         
     @patch('backend.repositories.activity_repository.Activity')
     def test_get_activity_by_id_not_found(self, mock_activity):
         """Test retrieving activity by ID when not found"""
         # Arrange
-        self.mock_db.query.return_value.filter.return_value.first.return_value = None
+        self.mock_db.get.return_value = None
         
         # Act
         result = ActivityRepository.get_activity_by_id(self.mock_db, 999)
         
         # Assert
-        self.mock_db.query.assert_called_once_with(mock_activity)
+        self.mock_db.get.assert_called_once_with(mock_activity, 999)
         self.assertIsNone(result)
         
     @patch('backend.repositories.activity_repository.Pet_activity')
@@ -120,36 +121,56 @@ class TestActivityRepository(unittest.TestCase):
         self.assertEqual(result[0], ("Dry Food", 2))
         self.assertEqual(result[1], ("Wet Food", 1))
         
-    @patch('backend.repositories.activity_repository.Pet_activity')
-    def test_create_pet_activity_success(self, mock_pet_activity_class):
-        """Test successful creation of pet activity"""
+    @patch('backend.repositories.activity_repository.upsert_insert')
+    def test_create_pet_activity_success(self, mock_upsert_insert):
+        """Test that a pet activity is written as a single upsert"""
         # Arrange
-        mock_pet_activity = Mock()
+        mock_pet_activity = Mock(pet_id=1, activity_id=2, weekly_frequency_activity=3)
+        stmt = mock_upsert_insert.return_value.on_conflict_do_update.return_value
         
         # Act
         result = ActivityRepository.create_pet_activity(self.mock_db, mock_pet_activity)
         
         # Assert
-        self.mock_db.add.assert_called_once_with(mock_pet_activity)
+        self.mock_db.add.assert_not_called()
+        self.mock_db.execute.assert_called_once_with(
+            stmt, [{"pet_id": 1, "activity_id": 2, "weekly_frequency_activity": 3}]
+        )
         self.mock_db.commit.assert_called_once()
-        self.mock_db.refresh.assert_called_once_with(mock_pet_activity)
+        self.mock_db.refresh.assert_not_called()
         self.assertTrue(result)
         
-    @patch('backend.repositories.activity_repository.Pet_feeding')
-    def test_create_pet_feeding_success(self, mock_pet_feeding_class):
-        """Test successful creation of pet feeding"""
+    @patch('backend.repositories.activity_repository.upsert_insert')
+    def test_create_pet_feeding_success(self, mock_upsert_insert):
+        """Test that a pet feeding is written as a single upsert"""
         # Arrange
-        mock_pet_feeding = Mock()
+        mock_pet_feeding = Mock(pet_id=1, feeding_id=2, daily_meal_frequency=3)
+        stmt = mock_upsert_insert.return_value.on_conflict_do_update.return_value
         
         # Act
         result = ActivityRepository.create_pet_feeding(self.mock_db, mock_pet_feeding)
         
         # Assert
-        self.mock_db.add.assert_called_once_with(mock_pet_feeding)
+        self.mock_db.add.assert_not_called()
+        self.mock_db.execute.assert_called_once_with(
+            stmt, [{"pet_id": 1, "feeding_id": 2, "daily_meal_frequency": 3}]
+        )
         self.mock_db.commit.assert_called_once()
-        self.mock_db.refresh.assert_called_once_with(mock_pet_feeding)
+        self.mock_db.refresh.assert_not_called()
         self.assertTrue(result)
         
+    @patch('backend.repositories.activity_repository.upsert_insert')
+    def test_create_pet_activity_rolls_back_on_error(self, mock_upsert_insert):
+        """Test that a failed upsert is rolled back and re-raised"""
+        # Arrange
+        self.mock_db.execute.side_effect = RuntimeError("db down")
+        
+        # Act & Assert
+        with self.assertRaises(RuntimeError):
+            ActivityRepository.create_pet_activity(self.mock_db, Mock(pet_id=1, activity_id=2, weekly_frequency_activity=3))
+        self.mock_db.rollback.assert_called_once()
+        self.mock_db.commit.assert_not_called()
+        
     def test_get_activities_by_pet_empty_result(self):
         """Test retrieving activities for pet with no activities"""
         # Arrange
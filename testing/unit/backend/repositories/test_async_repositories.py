@@ -0,0 +1,91 @@
+import unittest
+import asyncio
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from backend.config.database import Base, async_database_url
+from backend.models import Pet, Activity, Pet_activity, Pet_history
+from backend.repositories.async_repositories import (
+    AsyncPetRepository,
+    AsyncActivityRepository,
+    AsyncReportRepository
+)
+
+
+class TestAsyncRepositories(unittest.TestCase):
+    """Test cases for the async repository variants on aiosqlite"""
+    
+    def _run(self, scenario):
+        async def wrapper():
+            engine = create_async_engine("sqlite+aiosqlite://")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            SessionTest = async_sessionmaker(engine, expire_on_commit=False)
+            try:
+                async with SessionTest() as db:
+                    return await scenario(db)
+            finally:
+                await engine.dispose()
+        return asyncio.run(wrapper())
+        
+    def test_async_database_url(self):
+        """Test that sync URLs are mapped to their async drivers"""
+        # Act & Assert
+        self.assertEqual(async_database_url("postgresql://u:p@host:5432/db"), "postgresql+asyncpg://u:p@host:5432/db")
+        self.assertEqual(async_database_url("sqlite:///./local.db"), "sqlite+aiosqlite:///./local.db")
+        self.assertEqual(async_database_url("mysql://u@host/db"), "mysql://u@host/db")
+        
+    def test_create_and_get_pet(self):
+        """Test creating a pet and reading it back through the async session"""
+        # Act
+        async def scenario(db):
+            pet = await AsyncPetRepository.create(db, Pet(name="Buddy", user_id=1))
+            return pet.pet_id, await AsyncPetRepository.get_pet_by_id(db, pet.pet_id)
+        pet_id, found = self._run(scenario)
+        
+        # Assert
+        self.assertEqual(found.pet_id, pet_id)
+        self.assertEqual(found.name, "Buddy")
+        
+    def test_get_activities_by_pet(self):
+        """Test reading a pet's activities through the async session"""
+        # Act
+        async def scenario(db):
+            db.add_all([
+                Pet(pet_id=1, name="Buddy", user_id=1),
+                Activity(activity_id=1, name="Walking", description="-"),
+            ])
+            await db.commit()
+            await AsyncActivityRepository.create_pet_activity(
+                db, Pet_activity(pet_id=1, activity_id=1, weekly_frequency_activity=3)
+            )
+            return await AsyncActivityRepository.get_activities_by_pet(db, 1)
+        activities = self._run(scenario)
+        
+        # Assert
+        self.assertEqual([tuple(row) for row in activities], [("Walking", 3)])
+        
+    def test_get_pet_reports_for_user(self):
+        """Test that the report query runs unchanged on the async session"""
+        # Act
+        async def scenario(db):
+            from datetime import date
+            db.add(Pet(pet_id=1, name="Buddy", user_id=1, weight=10, height=0.5))
+            await db.commit()
+            await AsyncReportRepository.create_pet_history(
+                db, Pet_history(pet_id=1, date=date(2024, 1, 1), body_metric=2.5)
+            )
+            return await AsyncReportRepository.get_pet_reports_for_user(db, 1)
+        reports = self._run(scenario)
+        
+        # Assert
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0]["pet_name"], "Buddy")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import Pet, Activity, Feeding
+from backend.repositories.lookup import get_by_pk
+from backend.repositories.activity_repository import ActivityRepository
+
+
+class TestPrimaryKeyLookup(SQLiteTestCase):
+    """Test cases for session-scoped primary-key lookups against SQLite"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.seed(
+            Pet(pet_id=1, name="Buddy", weight=10, height=0.5, species_id=1, breed_id=1, user_id=1),
+            Activity(activity_id=1, name="Walk", description="Daily walk"),
+            Feeding(feeding_id=1, name="Kibble", description="Dry food", calories=350),
+        )
+
+        self.db = self.session()
+        self.count_statements()
+
+    def test_get_by_pk_hit_served_from_identity_map(self):
+        """Test a second lookup of the same row skips the SELECT"""
+        # Act
+        first = get_by_pk(self.db, Pet, 1)
+        second = get_by_pk(self.db, Pet, 1)
+
+        # Assert
+        self.assertIs(first, second)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_get_by_pk_miss_is_remembered(self):
+        """Test a missing row is only queried once per session"""
+        # Act
+        first = get_by_pk(self.db, Pet, 99)
+        second = get_by_pk(self.db, Pet, 99)
+
+        # Assert
+        self.assertIsNone(first)
+        self.assertIsNone(second)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_get_by_pk_miss_forgotten_after_flush(self):
+        """Test a flush clears remembered misses so new rows are found"""
+        # Arrange
+        self.assertIsNone(get_by_pk(self.db, Pet, 2))
+
+        # Act
+        self.db.add(Pet(pet_id=2, name="Max", weight=8, height=0.4, species_id=1, breed_id=1, user_id=1))
+        self.db.flush()
+        result = get_by_pk(self.db, Pet, 2)
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual(result.name, "Max")
+
+    def test_pet_and_activity_exist_single_query(self):
+        """Test both references are checked with one statement"""
+        # Act
+        found = ActivityRepository.pet_and_activity_exist(self.db, 1, 1)
+        missing = ActivityRepository.pet_and_activity_exist(self.db, 99, 1)
+
+        # Assert
+        self.assertEqual(found, (True, True))
+        self.assertEqual(missing, (False, True))
+        self.assertEqual(len(self.statements), 2)
+
+    def test_pet_and_feeding_exist_missing_feeding(self):
+        """Test a missing feeding is reported separately from the pet"""
+        # Act
+        result = ActivityRepository.pet_and_feeding_exist(self.db, 1, 99)
+
+        # Assert
+        self.assertEqual(result, (True, False))
+        self.assertEqual(len(self.statements), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
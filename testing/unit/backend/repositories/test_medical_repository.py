@@ -15,6 +15,7 @@ class TestMedicalRepository(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.mock_db = Mock()
+        self.mock_db.info = {}
         
     @patch('backend.repositories.medical_repository.Medical_condition')
     def test_get_medical_conditions(self, mock_medical_condition):
@@ -60,26 +61,26 @@ class TestMedicalRepository(unittest.TestCase):
         mock_condition.mc_id = 1
         mock_condition.name = "Allergy"
         
-        self.mock_db.query.return_value.filter.return_value.first.return_value = mock_condition
+        self.mock_db.get.return_value = mock_condition
         
         # Act
         result = MedicalRepository.get_condition_by_id(self.mock_db, 1)
         
         # Assert
-        self.mock_db.query.assert_called_once_with(mock_medical_condition)
+        self.mock_db.get.assert_called_once_with(mock_medical_condition, 1)
         self.assertEqual(result, mock_condition)
         
     @patch('backend.repositories.medical_repository.Medical_condition')
     def test_get_condition_by_id_not_found(self, mock_medical_condition):
         """Test retrieving medical condition by ID when not found"""
         # Arrange
-        self.mock_db.query.return_value.filter.return_value.first.return_value = None
+        self.mock_db.get.return_value = None
         
         # Act
         result = MedicalRepository.get_condition_by_id(self.mock_db, 999)
         
         # Assert
-        self.mock_db.query.assert_called_once_with(mock_medical_condition)
+        self.mock_db.get.assert_called_once_with(mock_medical_condition, 999)
         self.assertIsNone(result)
         
     @patch('backend.repositories.medical_repository.Vaccine')
@@ -90,13 +91,13 @@ class TestMedicalRepository(unittest.TestCase):
         mock_vaccine_instance.vaccine_id = 1
         mock_vaccine_instance.name = "Rabies"
         
-        self.mock_db.query.return_value.filter.return_value.first.return_value = mock_vaccine_instance
+        self.mock_db.get.return_value = mock_vaccine_instance
         
         # Act
         result = MedicalRepository.get_vaccine_by_id(self.mock_db, 1)
         
         # Assert
-        self.mock_db.query.assert_called_once_with(mock_vaccine)
+        self.mock_db.get.assert_called_once_with(mock_vaccine, 1)
         self.assertEqual(result, mock_vaccine_instance)
         
     @patch('backend.repositories.medical_repository.Pet_medical_condition')
@@ -135,6 +136,50 @@ class TestMedicalRepository(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0], mock_vaccine_instance)
         
+    def test_get_conditions_for_pets_groups_by_pet(self):
+        """Test that condition names are grouped by pet id"""
+        # Arrange
+        self.mock_db.query.return_value.join.return_value.filter.return_value.all.return_value = [
+            (1, "Allergy"), (1, "Diabetes"), (3, "Arthritis")
+        ]
+        
+        # Act
+        result = MedicalRepository.get_conditions_for_pets(self.mock_db, [1, 2, 3])
+        
+        # Assert
+        self.mock_db.query.assert_called_once()
+        self.assertEqual(result, {1: ["Allergy", "Diabetes"], 2: [], 3: ["Arthritis"]})
+        
+    def test_get_vaccines_for_pets_no_pets(self):
+        """Test that an empty id list does not hit the database"""
+        # Act
+        result = MedicalRepository.get_vaccines_for_pets(self.mock_db, [])
+        
+        # Assert
+        self.mock_db.query.assert_not_called()
+        self.assertEqual(result, {})
+        
+    def test_existing_condition_ids_one_query(self):
+        """Test that the ids are checked with a single IN query"""
+        # Arrange
+        self.mock_db.query.return_value.filter.return_value = iter([(1,), (3,)])
+        
+        # Act
+        result = MedicalRepository.existing_condition_ids(self.mock_db, {1, 2, 3})
+        
+        # Assert
+        self.mock_db.query.assert_called_once()
+        self.assertEqual(result, {1, 3})
+        
+    def test_existing_vaccine_ids_no_ids(self):
+        """Test that an empty id set does not hit the database"""
+        # Act
+        result = MedicalRepository.existing_vaccine_ids(self.mock_db, set())
+        
+        # Assert
+        self.mock_db.query.assert_not_called()
+        self.assertEqual(result, set())
+        
     @patch('backend.repositories.medical_repository.Species')
     def test_get_species(self, mock_species):
         """Test retrieving all species"""
@@ -183,7 +228,7 @@ class TestMedicalRepository(unittest.TestCase):
         # Assert
         self.mock_db.add.assert_called_once_with(mock_pet_condition)
         self.mock_db.commit.assert_called_once()
-        self.mock_db.refresh.assert_called_once_with(mock_pet_condition)
+        self.mock_db.refresh.assert_not_called()
         self.assertTrue(result)
         
     @patch('backend.repositories.medical_repository.Pet_vaccine')
@@ -198,7 +243,7 @@ class TestMedicalRepository(unittest.TestCase):
         # Assert
         self.mock_db.add.assert_called_once_with(mock_pet_vaccine)
         self.mock_db.commit.assert_called_once()
-        self.mock_db.refresh.assert_called_once_with(mock_pet_vaccine)
+        self.mock_db.refresh.assert_not_called()
         self.assertTrue(result)
 
 
@@ -15,6 +15,7 @@ class TestPetRepository(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.mock_db = Mock()
+        self.mock_db.info = {}
         self.mock_pet = Mock()
         self.mock_pet.pet_id = 1
         self.mock_pet.name = "Buddy"
@@ -31,7 +32,7 @@ class TestPetRepository(unittest.TestCase):
         # Assert
         self.mock_db.add.assert_called_once_with(self.mock_pet)
         self.mock_db.commit.assert_called_once()
-        self.mock_db.refresh.assert_called_once_with(self.mock_pet)
+        self.mock_db.refresh.assert_not_called()
         self.assertEqual(result, self.mock_pet)
         
     @patch('backend.repositories.pet_repository.Pet')
@@ -127,26 +128,26 @@ class TestPetRepository(unittest.TestCase):
         mock_species.species_id = 1
         mock_species.name = "Dog"
         
-        self.mock_db.query.return_value.filter.return_value.first.return_value = mock_species
+        self.mock_db.get.return_value = mock_species
         
         # Act
         result = PetRepository.get_species_by_id(self.mock_db, 1)
         
         # Assert
-        self.mock_db.query.assert_called_once_with(mock_species_class)
+        self.mock_db.get.assert_called_once_with(mock_species_class, 1)
         self.assertEqual(result, mock_species)
         
     @patch('backend.repositories.pet_repository.Species')
     def test_get_species_by_id_not_found(self, mock_species_class):
         """Test retrieving species by ID when not found"""
         # Arrange
-        self.mock_db.query.return_value.filter.return_value.first.return_value = None
+        self.mock_db.get.return_value = None
         
         # Act
         result = PetRepository.get_species_by_id(self.mock_db, 999)
         
         # Assert
-        self.mock_db.query.assert_called_once_with(mock_species_class)
+        self.mock_db.get.assert_called_once_with(mock_species_class, 999)
         self.assertIsNone(result)
         
     @patch('backend.repositories.pet_repository.Breed')
@@ -191,26 +192,26 @@ class TestPetRepository(unittest.TestCase):
         mock_breed.breed_id = 1
         mock_breed.name = "Golden Retriever"
         
-        self.mock_db.query.return_value.filter.return_value.first.return_value = mock_breed
+        self.mock_db.get.return_value = mock_breed
         
         # Act
         result = PetRepository.get_breed_by_id(self.mock_db, 1)
         
         # Assert
-        self.mock_db.query.assert_called_once_with(mock_breed_class)
+        self.mock_db.get.assert_called_once_with(mock_breed_class, 1)
         self.assertEqual(result, mock_breed)
         
     @patch('backend.repositories.pet_repository.Breed')
     def test_get_breed_by_id_not_found(self, mock_breed_class):
         """Test retrieving breed by ID when not found"""
         # Arrange
-        self.mock_db.query.return_value.filter.return_value.first.return_value = None
+        self.mock_db.get.return_value = None
         
         # Act
         result = PetRepository.get_breed_by_id(self.mock_db, 999)
         
         # Assert
-        self.mock_db.query.assert_called_once_with(mock_breed_class)
+        self.mock_db.get.assert_called_once_with(mock_breed_class, 999)
         self.assertIsNone(result)
         
     def test_create_pet_with_database_error(self):
@@ -227,6 +228,20 @@ class TestPetRepository(unittest.TestCase):
         # refresh should not be called due to exception
         self.mock_db.refresh.assert_not_called()
 
+        
+    def test_create_with_links_rolls_back_on_error(self):
+        """Test that a failing link insert rolls back the pet as well"""
+        # Arrange
+        self.mock_db.execute.side_effect = Exception("FK violation")
+        
+        # Act & Assert
+        with self.assertRaises(Exception):
+            PetRepository.create_with_links(self.mock_db, self.mock_pet, [1], [])
+        
+        self.mock_db.flush.assert_called_once()
+        self.mock_db.rollback.assert_called_once()
+        self.mock_db.commit.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
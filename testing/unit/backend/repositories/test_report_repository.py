@@ -0,0 +1,237 @@
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from sqlalchemy.exc import IntegrityError
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import Pet, Species, Breed, Medical_condition, Pet_medical_condition, Pet_history, Pet_health_summary
+from backend.repositories.report_repository import ReportRepository
+
+
+class TestReportRepository(SQLiteTestCase):
+    """Test cases for ReportRepository against an in-memory SQLite database"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.db = self.session()
+        self.count_statements()
+        
+        self.db.add_all([
+            Species(species_id=1, name="Dog"),
+            Breed(breed_id=1, species_id=1, name="Labrador"),
+            Medical_condition(mc_id=1, name="Allergy"),
+            Medical_condition(mc_id=2, name="Diabetes"),
+        ])
+        self.db.commit()
+        
+    def _add_pets(self, user_id, count, start_id):
+        for offset in range(count):
+            pet_id = start_id + offset
+            self.db.add(Pet(pet_id=pet_id, name=f"Pet {pet_id}", weight=10, height=0.5,
+                            species_id=1, breed_id=1, user_id=user_id))
+            self.db.add(Pet_history(pet_id=pet_id, date=date(2024, 1, 1), body_metric=2.0))
+            self.db.add(Pet_history(pet_id=pet_id, date=date(2024, 6, 1), body_metric=3.5))
+            self.db.add(Pet_medical_condition(pet_id=pet_id, mc_id=1))
+            self.db.add(Pet_medical_condition(pet_id=pet_id, mc_id=2))
+        self.db.commit()
+        
+    def _count_report_queries(self, user_id):
+        ReportRepository.rebuild_health_summary(self.db)  # fixtures insert history directly
+        self.db.expire_all()
+        self.statements.clear()
+        reports = ReportRepository.get_pet_reports_for_user(self.db, user_id)
+        return reports, len(self.statements)
+        
+    def test_iter_pet_history_ordered_within_range(self):
+        """Test that history rows come back oldest first inside the date range"""
+        # Arrange
+        self.db.add(Pet(pet_id=1, name="Buddy", weight=10, height=0.5, species_id=1, breed_id=1, user_id=1))
+        for day, metric in [(3, 2.0), (1, 1.5), (2, 1.8), (9, 3.0)]:
+            self.db.add(Pet_history(pet_id=1, date=date(2024, 1, day), body_metric=metric))
+        self.db.add(Pet_history(pet_id=1, date=date(2024, 1, 4), body_metric=None))
+        self.db.commit()
+        
+        # Act
+        rows = list(ReportRepository.iter_pet_history(self.db, 1, date(2024, 1, 1), date(2024, 1, 5)))
+        total = ReportRepository.count_pet_history(self.db, 1, date(2024, 1, 1), date(2024, 1, 5))
+        
+        # Assert
+        self.assertEqual([day.day for day, _ in rows], [1, 2, 3])
+        self.assertEqual(total, 3)
+        
+    def test_get_pet_reports_for_user_keyset_page(self):
+        """Test that a page starts after the given pet and stops at the limit"""
+        # Arrange
+        self._add_pets(user_id=1, count=5, start_id=1)
+        ReportRepository.rebuild_health_summary(self.db)
+        
+        # Act
+        reports = ReportRepository.get_pet_reports_for_user(self.db, 1, after_pet_id=2, limit=2)
+        
+        # Assert
+        self.assertEqual([report["pet_id"] for report in reports], [3, 4])
+        
+    def test_get_pet_reports_for_user_latest_history(self):
+        """Test that each report uses the latest history record"""
+        # Arrange
+        self._add_pets(user_id=1, count=2, start_id=1)
+        
+        # Act
+        reports, _ = self._count_report_queries(1)
+        
+        # Assert
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(reports[0]["created_at"], "2024-06-01")
+        self.assertEqual(float(reports[0]["health_metric"]), 3.5)
+        self.assertEqual(reports[0]["pet_species"], "Dog")
+        self.assertEqual(reports[0]["pet_breed"], "Labrador")
+        self.assertEqual(sorted(reports[0]["conditions"]), ["Allergy", "Diabetes"])
+        
+    def test_get_pet_reports_for_user_skips_pets_without_history(self):
+        """Test that pets without history records are not reported"""
+        # Arrange
+        self.db.add(Pet(pet_id=1, name="New", weight=10, height=0.5, species_id=99, breed_id=99, user_id=1))
+        self.db.commit()
+        
+        # Act
+        reports, _ = self._count_report_queries(1)
+        
+        # Assert
+        self.assertEqual(reports, [])
+        
+    def test_get_pet_reports_for_user_unknown_species_and_breed(self):
+        """Test fallback names when species or breed rows are missing"""
+        # Arrange
+        self.db.add(Pet(pet_id=1, name="Stray", weight=10, height=0.5, species_id=99, breed_id=99, user_id=1))
+        self.db.add(Pet_history(pet_id=1, date=date(2024, 1, 1), body_metric=2.0))
+        self.db.commit()
+        
+        # Act
+        reports, _ = self._count_report_queries(1)
+        
+        # Assert
+        self.assertEqual(reports[0]["pet_species"], "Unknown")
+        self.assertEqual(reports[0]["pet_breed"], "Unknown")
+        self.assertEqual(reports[0]["conditions"], [])
+        
+    def test_get_pet_reports_for_user_query_count_is_constant(self):
+        """Test that the number of queries does not grow with the number of pets"""
+        # Arrange
+        self._add_pets(user_id=1, count=1, start_id=1)
+        self._add_pets(user_id=2, count=50, start_id=100)
+        
+        # Act
+        small_reports, small_queries = self._count_report_queries(1)
+        large_reports, large_queries = self._count_report_queries(2)
+        
+        # Assert
+        self.assertEqual(len(small_reports), 1)
+        self.assertEqual(len(large_reports), 50)
+        self.assertEqual(small_queries, large_queries)
+        self.assertLessEqual(large_queries, 2)
+        
+    def _summary_row(self, pet_id):
+        summary = self.db.get(Pet_health_summary, pet_id)
+        return (summary.latest_date, float(summary.latest_metric),
+                summary.previous_date, None if summary.previous_metric is None else float(summary.previous_metric),
+                None if summary.delta is None else float(summary.delta), summary.record_count)
+        
+    def test_create_pet_history_maintains_summary(self):
+        """Test that inserts in any date order keep the summary equal to a rebuild"""
+        # Arrange
+        self.db.add(Pet(pet_id=1, name="Buddy", weight=10, height=0.5, species_id=1, breed_id=1, user_id=1))
+        self.db.commit()
+        
+        # Act
+        for day, metric in [(10, 2.0), (20, 2.6), (5, 1.0), (15, 2.2), (20, 2.9)]:
+            ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=date(2024, 1, day), body_metric=metric))
+        incremental = self._summary_row(1)
+        ReportRepository.rebuild_health_summary(self.db)
+        self.db.expire_all()
+        rebuilt = self._summary_row(1)
+        
+        # Assert
+        self.assertEqual(incremental, (date(2024, 1, 20), 2.9, date(2024, 1, 20), 2.6, 0.3, 5))
+        self.assertEqual(incremental, rebuilt)
+        
+    def test_bulk_create_pet_history_merges_summary(self):
+        """Test that a bulk insert on top of existing history matches a rebuild"""
+        # Arrange
+        self.db.add(Pet(pet_id=1, name="Buddy", weight=10, height=0.5, species_id=1, breed_id=1, user_id=1))
+        self.db.add(Pet(pet_id=2, name="Max", weight=10, height=0.5, species_id=1, breed_id=1, user_id=1))
+        self.db.commit()
+        ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=date(2024, 1, 10), body_metric=2.0))
+        ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=date(2024, 1, 20), body_metric=2.4))
+        rows = [
+            {"pet_id": 1, "date": date(2024, 1, 15), "body_metric": 2.2},
+            {"pet_id": 1, "date": date(2024, 1, 5), "body_metric": 1.8},
+            {"pet_id": 2, "date": date(2024, 1, 1), "body_metric": 3.0},
+        ]
+        
+        # Act
+        created = ReportRepository.bulk_create_pet_history(self.db, rows)
+        self.db.expire_all()
+        merged = [self._summary_row(1), self._summary_row(2)]
+        ReportRepository.rebuild_health_summary(self.db)
+        self.db.expire_all()
+        rebuilt = [self._summary_row(1), self._summary_row(2)]
+        
+        # Assert
+        self.assertEqual(created, 3)
+        self.assertEqual(merged[0], (date(2024, 1, 20), 2.4, date(2024, 1, 15), 2.2, 0.2, 4))
+        self.assertEqual(merged, rebuilt)
+        
+    def test_create_pet_history_merges_like_bulk(self):
+        """Test that a later record costs the INSERT, the summary read and UPDATE and the rollup upsert"""
+        # Arrange
+        self.db.add(Pet(pet_id=1, name="Buddy", weight=10, height=0.5, species_id=1, breed_id=1, user_id=1))
+        self.db.commit()
+        ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=date(2024, 1, 1), body_metric=2.0))
+        self.statements.clear()
+        
+        # Act
+        ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=date(2024, 2, 1), body_metric=2.5))
+        
+        # Assert
+        self.assertEqual([s.split()[0] for s in self.statements], ["INSERT", "SELECT", "UPDATE", "INSERT"])
+        
+    def test_summary_insert_race_folds_into_winner(self):
+        """Test that losing the first-insert race retries once as an update"""
+        # Arrange
+        self.db.add(Pet(pet_id=1, name="Buddy", weight=10, height=0.5, species_id=1, breed_id=1, user_id=1))
+        self.db.commit()
+        ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=date(2024, 1, 1), body_metric=2.0))
+        real = ReportRepository._current_summaries
+        
+        # Act: the first read misses the row another transaction just inserted
+        with patch.object(ReportRepository, "_current_summaries", side_effect=[{}, real(self.db, [1])]) as read:
+            ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=date(2024, 2, 1), body_metric=2.5))
+        self.db.expire_all()
+        
+        # Assert
+        self.assertEqual(read.call_count, 2)
+        self.assertEqual(self._summary_row(1), (date(2024, 2, 1), 2.5, date(2024, 1, 1), 2.0, 0.5, 2))
+        
+    def test_summary_insert_race_retries_only_once(self):
+        """Test that a second conflict is raised instead of retried again"""
+        # Arrange
+        self.db.add(Pet(pet_id=1, name="Buddy", weight=10, height=0.5, species_id=1, breed_id=1, user_id=1))
+        self.db.commit()
+        ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=date(2024, 1, 1), body_metric=2.0))
+        
+        # Act / Assert
+        with patch.object(ReportRepository, "_current_summaries", return_value={}) as read:
+            with self.assertRaises(IntegrityError):
+                ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=date(2024, 2, 1), body_metric=2.5))
+        self.assertEqual(read.call_count, 2)
+        self.db.expire_all()
+        self.assertEqual(self._summary_row(1)[-1], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from datetime import date
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import Pet, Pet_history, Pet_history_rollup
+from backend.repositories.report_repository import ReportRepository
+from backend.repositories.rollup_repository import RollupRepository, period_start
+
+
+class TestRollupRepository(SQLiteTestCase):
+    """Test cases for the day/week/month body-metric rollups against SQLite"""
+    
+    session_options = {"expire_on_commit": False}
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.db = self.session()
+        self.db.add(Pet(pet_id=1, name="Buddy", user_id=1))
+        self.db.commit()
+        
+    def _rollups(self):
+        rows = self.db.query(Pet_history_rollup).order_by(
+            Pet_history_rollup.period, Pet_history_rollup.period_start
+        ).all()
+        return [(r.period, r.period_start, r.record_count, float(r.total), float(r.min_metric), float(r.max_metric))
+                for r in rows]
+        
+    def test_period_start(self):
+        """Test bucket starts for each granularity"""
+        # Arrange
+        day = date(2024, 5, 16)  # a Thursday
+        
+        # Act & Assert
+        self.assertEqual(period_start(day, "day"), day)
+        self.assertEqual(period_start(day, "week"), date(2024, 5, 13))
+        self.assertEqual(period_start(day, "month"), date(2024, 5, 1))
+        
+    def test_single_inserts_maintain_rollups(self):
+        """Test that each history insert updates the day, week and month buckets"""
+        # Act
+        for day, metric in [(date(2024, 5, 13), 2.0), (date(2024, 5, 16), 3.0), (date(2024, 5, 16), 2.5)]:
+            ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=day, body_metric=metric))
+        
+        # Assert
+        self.db.expire_all()
+        self.assertEqual(self._rollups(), [
+            ("day", date(2024, 5, 13), 1, 2.0, 2.0, 2.0),
+            ("day", date(2024, 5, 16), 2, 5.5, 2.5, 3.0),
+            ("month", date(2024, 5, 1), 3, 7.5, 2.0, 3.0),
+            ("week", date(2024, 5, 13), 3, 7.5, 2.0, 3.0),
+        ])
+        
+    def test_incremental_matches_rebuild(self):
+        """Test that single and bulk inserts leave the same rollups as a rebuild"""
+        # Arrange
+        ReportRepository.create_pet_history(self.db, Pet_history(pet_id=1, date=date(2024, 1, 31), body_metric=1.5))
+        ReportRepository.bulk_create_pet_history(self.db, [
+            {"pet_id": 1, "date": date(2024, 2, 1), "body_metric": 2.5},
+            {"pet_id": 1, "date": date(2024, 1, 30), "body_metric": 3.5},
+            {"pet_id": 1, "date": date(2024, 2, 1), "body_metric": 1.0},
+        ])
+        self.db.expire_all()
+        incremental = self._rollups()
+        
+        # Act
+        written = RollupRepository.rebuild(self.db)
+        self.db.expire_all()
+        
+        # Assert
+        self.assertEqual(written, len(incremental))
+        self.assertEqual(self._rollups(), incremental)
+        
+    def test_get_rollups_range(self):
+        """Test that buckets overlapping the range are returned in order"""
+        # Arrange
+        ReportRepository.bulk_create_pet_history(self.db, [
+            {"pet_id": 1, "date": date(2024, month, 10), "body_metric": 2.0} for month in range(1, 7)
+        ])
+        
+        # Act
+        buckets = RollupRepository.get_rollups(self.db, 1, "month", date(2024, 2, 15), date(2024, 4, 30))
+        
+        # Assert
+        self.assertEqual([b.period_start for b in buckets], [date(2024, 2, 1), date(2024, 3, 1), date(2024, 4, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
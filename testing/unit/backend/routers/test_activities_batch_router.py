@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import patch
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.config.settings import settings
+from backend.models import Pet, Activity, Feeding, Pet_activity, Pet_feeding
+from backend.routers import activities
+
+
+class TestActivitiesBatchRouter(SQLiteTestCase):
+    """Test cases for POST /api/activities/batch and /api/foods/batch"""
+
+    session_options = {"expire_on_commit": False}
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.seed(
+            Pet(pet_id=1, name="Buddy", user_id=1),
+            Pet(pet_id=2, name="Max", user_id=1),
+            Activity(activity_id=1, name="Walking", description="-"),
+            Activity(activity_id=2, name="Fetch", description="-"),
+            Feeding(feeding_id=1, name="Kibble", description="-", calories=350),
+            Pet_activity(pet_id=1, activity_id=1, weekly_frequency_activity=1),
+        )
+
+        self.count_statements()
+        self.client = self.make_client(activities.router)
+
+    def _count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement.lstrip().split()[0].upper(), executemany))
+
+    def _frequencies(self, model, ref, value):
+        db = self.SessionTest()
+        rows = db.query(model.pet_id, ref, value).order_by(model.pet_id, ref).all()
+        db.close()
+        return [tuple(row) for row in rows]
+
+    def test_batch_activities_upsert(self):
+        """Test that new pairs are inserted, existing ones updated and repeats resolved in order"""
+        # Arrange
+        payload = [
+            {"pet_id": 1, "activity_id": 1, "frequency": 4},
+            {"pet_id": 1, "activity_id": 2, "frequency": 2},
+            {"pet_id": 2, "activity_id": 1, "frequency": 3},
+            {"pet_id": 2, "activity_id": 1, "frequency": 5},
+        ]
+
+        # Act
+        response = self.client.post("/api/activities/batch", json=payload)
+
+        # Assert
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["count"], 3)
+        self.assertEqual(
+            self._frequencies(Pet_activity, Pet_activity.activity_id, Pet_activity.weekly_frequency_activity),
+            [(1, 1, 4), (1, 2, 2), (2, 1, 5)]
+        )
+
+    def test_batch_statements(self):
+        """Test one query per id kind and one executemany insert"""
+        # Arrange
+        payload = [{"pet_id": pet_id, "feeding_id": 1, "frequency": 2} for pet_id in (1, 2)]
+
+        # Act
+        self.client.post("/api/foods/batch", json=payload)
+
+        # Assert
+        self.assertEqual(self.statements, [("SELECT", False), ("SELECT", False), ("INSERT", True)])
+        self.assertEqual(
+            self._frequencies(Pet_feeding, Pet_feeding.feeding_id, Pet_feeding.daily_meal_frequency),
+            [(1, 1, 2), (2, 1, 2)]
+        )
+
+    def test_batch_unknown_ids_write_nothing(self):
+        """Test 404 naming every unknown id, with no row written"""
+        # Arrange
+        payload = [
+            {"pet_id": 2, "activity_id": 2, "frequency": 1},
+            {"pet_id": 1, "activity_id": 8, "frequency": 1},
+            {"pet_id": 1, "activity_id": 9, "frequency": 1},
+        ]
+
+        # Act
+        response = self.client.post("/api/activities/batch", json=payload)
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["detail"], "Activity not found: [8, 9]")
+        self.assertEqual(
+            self._frequencies(Pet_activity, Pet_activity.activity_id, Pet_activity.weekly_frequency_activity),
+            [(1, 1, 1)]
+        )
+
+    def test_batch_empty(self):
+        """Test that an empty list is accepted without touching the database"""
+        # Act
+        response = self.client.post("/api/foods/batch", json=[])
+
+        # Assert
+        self.assertEqual(response.json()["count"], 0)
+        self.assertEqual(self.statements, [])
+
+
+    def test_batch_over_row_limit(self):
+        """Test 413 above BATCH_UPSERT_MAX_ROWS without touching the database"""
+        # Arrange
+        payload = [{"pet_id": 1, "activity_id": 1, "frequency": day} for day in range(1, 4)]
+
+        # Act
+        with patch.object(settings, "BATCH_UPSERT_MAX_ROWS", 2):
+            response = self.client.post("/api/activities/batch", json=payload)
+
+        # Assert
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.json()["detail"], "At most 2 rows per batch")
+        self.assertEqual(self.statements, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import unittest
+import asyncio
+import json
+from unittest.mock import patch
+import tempfile
+from datetime import date
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from backend.config.database import Base, get_async_db
+from backend.models import Pet, Pet_history, Pet_health_summary
+from backend.routers import reports
+from backend.config.settings import settings
+from backend.services.report_service import ReportService
+from sqlalchemy.exc import OperationalError
+from fastapi import HTTPException
+
+
+class TestBulkReportsRouter(unittest.TestCase):
+    """Test cases for POST /api/reports/bulk on a SQLite file database"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmpdir.name, "bulk.db")
+        self.engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(self.engine)
+        with Session(bind=self.engine) as db:
+            db.add_all([Pet(pet_id=1, name="Buddy", user_id=1), Pet(pet_id=2, name="Max", user_id=1)])
+            db.commit()
+
+        # A fresh connection per session, so each TestClient event loop gets its own
+        self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+        self.SessionTest = async_sessionmaker(self.async_engine, expire_on_commit=False)
+
+        app = FastAPI()
+        app.include_router(reports.router)
+        app.dependency_overrides[get_async_db] = self._get_test_db
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmpdir.cleanup()
+
+    async def _get_test_db(self):
+        async with self.SessionTest() as db:
+            yield db
+
+    def test_bulk_json_array(self):
+        """Test that valid rows are inserted and bad rows reported by index"""
+        # Arrange
+        payload = [
+            {"petId": 1, "date": "2024-01-01", "bmiStatus": 2.0},
+            {"petId": 99, "date": "2024-01-02", "bmiStatus": 2.1},
+            {"petId": 1, "date": "not-a-date", "bmiStatus": 2.2},
+            {"petId": 2, "date": "2024-01-03", "bmiStatus": 3.0},
+        ]
+
+        # Act
+        response = self.client.post("/api/reports/bulk", json=payload)
+
+        # Assert
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual((body["created"], body["failed"]), (2, 2))
+        statuses = [(row["index"], row["status"]) for row in body["results"]]
+        self.assertEqual(statuses, [(0, "created"), (1, "error"), (2, "error"), (3, "created")])
+        self.assertEqual(body["results"][1]["detail"], "Pet not found")
+        self.assertTrue(body["results"][2]["detail"].startswith("date:"))
+        with Session(bind=self.engine) as db:
+            self.assertEqual(db.query(Pet_history).count(), 2)
+            self.assertEqual(db.query(Pet_history).filter_by(pet_id=2).count(), 1)
+
+    def test_bulk_ndjson_updates_summary(self):
+        """Test NDJSON uploads, including a malformed line, and the summary refresh"""
+        # Arrange
+        lines = [
+            json.dumps({"petId": 1, "date": "2024-03-01", "bmiStatus": 2.5}),
+            "{broken",
+            json.dumps({"petId": 1, "date": "2024-02-01", "bmiStatus": 2.0}),
+        ]
+
+        # Act
+        response = self.client.post("/api/reports/bulk", content="\n".join(lines) + "\n",
+                                    headers={"Content-Type": "application/x-ndjson"})
+
+        # Assert
+        body = response.json()
+        self.assertEqual(body["created"], 2)
+        self.assertEqual(body["results"][1], {"index": 1, "status": "error", "detail": "Invalid JSON"})
+        with Session(bind=self.engine) as db:
+            summary = db.get(Pet_health_summary, 1)
+            self.assertEqual(summary.latest_date, date(2024, 3, 1))
+            self.assertEqual(summary.previous_date, date(2024, 2, 1))
+            self.assertEqual(summary.record_count, 2)
+
+    def test_bulk_rejects_non_array(self):
+        """Test 400 for a JSON body that is not an array"""
+        # Act
+        response = self.client.post("/api/reports/bulk", json={"petId": 1})
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
+
+
+    def test_bulk_metric_out_of_column_range(self):
+        """Test that a metric body_metric cannot hold is a row error, not a failed batch"""
+        # Arrange
+        payload = [
+            {"petId": 1, "date": "2024-01-01", "bmiStatus": 2.0},
+            {"petId": 1, "date": "2024-01-02", "bmiStatus": 10.0},
+        ]
+
+        # Act
+        body = self.client.post("/api/reports/bulk", json=payload).json()
+
+        # Assert
+        self.assertEqual((body["created"], body["failed"]), (1, 1))
+        self.assertEqual(body["results"][1]["status"], "error")
+        self.assertTrue(body["results"][1]["detail"].startswith("bmiStatus:"))
+
+    def test_bulk_database_error_is_reported_per_row(self):
+        """Test that a failed insert comes back as per-row errors instead of a 500"""
+        # Arrange
+        payload = [{"petId": 1, "date": "2024-01-01", "bmiStatus": 2.0}, {"petId": 99, "date": "2024-01-01", "bmiStatus": 2.0}]
+        failure = OperationalError("INSERT", {}, Exception("disk full"))
+
+        # Act
+        with patch("backend.services.report_service.AsyncReportRepository.bulk_create_pet_history",
+                   side_effect=failure):
+            response = self.client.post("/api/reports/bulk", json=payload)
+
+        # Assert
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual((body["created"], body["failed"]), (0, 2))
+        self.assertEqual(body["results"][0]["detail"], "Not saved: database error")
+        self.assertEqual(body["results"][1]["detail"], "Pet not found")
+
+    def test_bulk_ndjson_row_limit_stops_reading(self):
+        """Test that NDJSON past the row limit is rejected without reading the rest"""
+        # Arrange
+        consumed = []
+        async def chunks():
+            for i in range(100):
+                consumed.append(i)
+                yield json.dumps({"petId": 1, "date": "2024-01-01", "bmiStatus": 2.0}).encode() + b"\n"
+
+        # Act
+        with patch.object(settings, "BULK_INGEST_MAX_ROWS", 3):
+            with self.assertRaises(HTTPException) as context:
+                asyncio.run(ReportService.read_history_upload(chunks(), ndjson=True))
+
+        # Assert
+        self.assertEqual(context.exception.status_code, 413)
+        self.assertEqual(len(consumed), 4)
+
+    def test_bulk_ndjson_lines_split_across_chunks(self):
+        """Test that lines are reassembled across stream chunks"""
+        # Arrange
+        async def chunks():
+            yield b'{"petId": 1, "da'
+            yield b'te": "2024-01-01", "bmiStatus": 2.0}\n{bro'
+            yield b'ken\n{"petId": 2}'
+
+        # Act
+        items, errors = asyncio.run(ReportService.read_history_upload(chunks(), ndjson=True))
+
+        # Assert
+        self.assertEqual(items, [{"petId": 1, "date": "2024-01-01", "bmiStatus": 2.0}, None, {"petId": 2}])
+        self.assertEqual(errors, {1: "Invalid JSON"})
+
+    def test_bulk_json_content_length_cap(self):
+        """Test 413 for a JSON array body over BULK_INGEST_MAX_BYTES"""
+        # Act
+        with patch.object(settings, "BULK_INGEST_MAX_BYTES", 20):
+            response = self.client.post("/api/reports/bulk", json=[{"petId": 1, "date": "2024-01-01", "bmiStatus": 2.0}])
+
+        # Assert
+        self.assertEqual(response.status_code, 413)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import Species, Breed, Activity, Feeding, Medical_condition, Vaccine
+from backend.routers import catalog, pets
+from backend.services.catalog_service import CatalogService
+from backend.utils.reference_cache import reference_cache
+
+
+class TestCatalogRouter(SQLiteTestCase):
+    """Test cases for the shared legacy and /api catalog handlers"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.seed(Species(species_id=1, name="Dog"), Breed(breed_id=1, species_id=1, name="Labrador"))
+        
+        self.count_statements()
+        reference_cache.invalidate()
+        
+        self.client = self.make_client(pets.router, catalog.router)
+        
+    def tearDown(self):
+        reference_cache.invalidate()
+        
+    def _queries_for(self, url):
+        self.statements.clear()
+        response = self.client.get(url)
+        return response, len(self.statements)
+        
+    def test_legacy_species_queries_once(self):
+        """Test that the legacy species route runs a single query on a cold cache"""
+        # Act
+        response, queries = self._queries_for("/species")
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{"species_id": 1, "name": "Dog"}])
+        self.assertEqual(queries, 1)
+        
+    def test_legacy_and_api_routes_share_cache(self):
+        """Test that /species warms the cache used by /api/pets/species"""
+        # Arrange
+        self.client.get("/species")
+        
+        # Act
+        response, queries = self._queries_for("/api/pets/species")
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(queries, 0)
+        
+    def test_breeds_not_found(self):
+        """Test that an unknown species still answers 404 after one query"""
+        # Act
+        response, queries = self._queries_for("/breeds/99")
+        
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"detail": "No breeds found for this species"})
+        self.assertEqual(queries, 1)
+        
+    def test_unknown_species_add_no_cache_entries(self):
+        """Test that probing breed ids is served from the one breeds entry"""
+        # Arrange
+        self.client.get("/breeds/1")
+        entries = len(reference_cache._entries)
+        
+        # Act
+        statuses = {self.client.get(f"/breeds/{species_id}").status_code for species_id in range(100, 300)}
+        response, queries = self._queries_for("/breeds/1")
+        
+        # Assert
+        self.assertEqual(statuses, {404})
+        self.assertEqual(len(reference_cache._entries), entries)
+        self.assertEqual([breed["name"] for breed in response.json()], ["Labrador"])
+        self.assertEqual(queries, 0)
+
+        
+    def _seed_catalogs(self):
+        db = self.SessionTest()
+        db.add_all([
+            Species(species_id=2, name="Cat"),
+            Breed(breed_id=2, species_id=2, name="Siamese"),
+            Breed(breed_id=3, species_id=1, name="Beagle"),
+            Medical_condition(mc_id=1, name="Allergy", description="-", recommendations="-"),
+            Vaccine(vaccine_id=1, name="Rabies", recommended_age=0.5),
+            Activity(activity_id=1, name="Walking", description="-"),
+            Feeding(feeding_id=1, name="Kibble", description="-", calories=350),
+        ])
+        db.commit()
+        db.close()
+        
+    def test_bootstrap_all_catalogs_then_no_queries(self):
+        """Test that one bootstrap carries every catalog and a warm one runs no query"""
+        # Arrange
+        self._seed_catalogs()
+        
+        # Act
+        cold, cold_queries = self._queries_for("/api/catalog/bootstrap")
+        warm, warm_queries = self._queries_for("/api/catalog/bootstrap")
+        
+        # Assert
+        body = cold.json()
+        self.assertEqual([item["name"] for item in body["species"]], ["Dog", "Cat"])
+        self.assertEqual({key: [b["name"] for b in value] for key, value in body["breeds"].items()},
+                         {"1": ["Labrador", "Beagle"], "2": ["Siamese"]})
+        self.assertEqual(body["vaccines"][0]["name"], "Rabies")
+        self.assertEqual(body["feedings"][0]["calories"], 350)
+        self.assertEqual(cold_queries, 6)
+        self.assertEqual(warm_queries, 0)
+        self.assertEqual(warm.content, cold.content)
+        
+    def test_bootstrap_gzip_and_etag(self):
+        """Test the gzip encoding, the per-encoding strong ETag and 304 revalidation"""
+        # Act
+        plain = self.client.get("/api/catalog/bootstrap", headers={"Accept-Encoding": "identity"})
+        zipped = self.client.get("/api/catalog/bootstrap", headers={"Accept-Encoding": "gzip"})
+        revalidated = self.client.get("/api/catalog/bootstrap", headers={"If-None-Match": plain.headers["etag"]})
+        
+        # Assert
+        version = plain.json()["version"]
+        self.assertEqual(plain.headers["etag"], f'"{version}"')
+        self.assertNotIn("content-encoding", plain.headers)
+        self.assertEqual(zipped.headers["content-encoding"], "gzip")
+        self.assertEqual(zipped.headers["etag"], f'"{version}-gzip"')
+        self.assertEqual(zipped.json(), plain.json())
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b"")
+        
+    def test_bootstrap_version_changes_with_catalogs(self):
+        """Test that invalidated catalogs produce a new version"""
+        # Arrange
+        before = self.client.get("/api/catalog/bootstrap").json()["version"]
+        self._seed_catalogs()
+        
+        # Act
+        CatalogService.invalidate_catalogs()
+        after = self.client.get("/api/catalog/bootstrap").json()["version"]
+        
+        # Assert
+        self.assertNotEqual(before, after)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+from datetime import date
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import (
+    Pet, Species, Breed, Activity, Feeding, Medical_condition, Vaccine,
+    Pet_activity, Pet_feeding, Pet_medical_condition, Pet_vaccine, Pet_history
+)
+from backend.repositories.report_repository import ReportRepository
+from backend.routers import pets, activities
+from backend.utils.reference_cache import dashboard_cache
+
+
+class TestDashboardRouter(SQLiteTestCase):
+    """Test cases for GET /api/pets/{pet_id}/dashboard"""
+
+    session_options = {"expire_on_commit": False}
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        db = self.SessionTest()
+        db.add_all([
+            Species(species_id=1, name="Dog"),
+            Breed(breed_id=1, species_id=1, name="Labrador"),
+            Pet(pet_id=1, name="Buddy", species_id=1, breed_id=1, user_id=1, weight=10, height=0.7,
+                date_of_birth=date(2020, 1, 1)),
+            Pet(pet_id=2, name="Max", user_id=1),
+            Activity(activity_id=1, name="Walking", description="-"),
+            Activity(activity_id=2, name="Fetch", description="-"),
+            Feeding(feeding_id=1, name="Kibble", description="-", calories=350),
+            Medical_condition(mc_id=1, name="Allergy", description="-", recommendations="-"),
+            Vaccine(vaccine_id=1, name="Rabies", recommended_age=0.5),
+            Pet_activity(pet_id=1, activity_id=1, weekly_frequency_activity=3),
+            Pet_feeding(pet_id=1, feeding_id=1, daily_meal_frequency=2),
+            Pet_medical_condition(pet_id=1, mc_id=1),
+            Pet_vaccine(pet_id=1, vaccine_id=1),
+        ])
+        db.commit()
+        ReportRepository.create_pet_history(db, Pet_history(pet_id=1, date=date(2024, 1, 1), body_metric=2.0))
+        ReportRepository.create_pet_history(db, Pet_history(pet_id=1, date=date(2024, 2, 1), body_metric=2.5))
+        db.close()
+        dashboard_cache.invalidate()
+
+        self.count_statements()
+        self.client = self.make_client(pets.router, activities.router)
+
+    def tearDown(self):
+        dashboard_cache.invalidate()
+
+    def test_dashboard_content(self):
+        """Test that one response carries routines, medical links, latest record and BMI"""
+        # Act
+        response = self.client.get("/api/pets/1/dashboard")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual((body["species"], body["breed"]), ("Dog", "Labrador"))
+        self.assertEqual(body["activities"], [{"name": "Walking", "frequency": 3}])
+        self.assertEqual(body["feedings"], [{"name": "Kibble", "frequency": 2}])
+        self.assertEqual((body["conditions"], body["vaccines"]), (["Allergy"], ["Rabies"]))
+        self.assertEqual(body["latest_health"]["date"], "2024-02-01")
+        self.assertEqual(body["latest_health"]["delta"], 0.5)
+        self.assertEqual(body["latest_health"]["record_count"], 2)
+        self.assertEqual((body["bmi"], body["status"]), (20.41, "Healthy"))
+
+    def test_dashboard_fixed_queries_then_cached(self):
+        """Test that a cold dashboard costs five queries and a warm one none"""
+        # Act
+        self.client.get("/api/pets/1/dashboard")
+        cold = len(self.statements)
+        self.statements.clear()
+        self.client.get("/api/pets/1/dashboard")
+
+        # Assert
+        self.assertEqual(cold, 5)
+        self.assertEqual(self.statements, [])
+
+    def test_dashboard_invalidated_on_write(self):
+        """Test that a new activity shows up on the next dashboard read"""
+        # Arrange
+        self.client.get("/api/pets/1/dashboard")
+
+        # Act
+        self.client.post("/api/activities", json={"pet_id": 1, "activity_id": 2, "frequency": 5})
+        body = self.client.get("/api/pets/1/dashboard").json()
+
+        # Assert
+        self.assertEqual(len(body["activities"]), 2)
+
+    def test_dashboard_pet_without_data(self):
+        """Test a pet with no measures, routines or history"""
+        # Act
+        body = self.client.get("/api/pets/2/dashboard").json()
+
+        # Assert
+        self.assertEqual((body["species"], body["status"]), ("Unknown", "Unknown"))
+        self.assertEqual(body["activities"], [])
+        self.assertIsNone(body["latest_health"])
+
+    def test_dashboard_latest_metric_null(self):
+        """Test that a latest record without a body metric is returned, not a 500"""
+        # Arrange
+        db = self.SessionTest()
+        ReportRepository.create_pet_history(db, Pet_history(pet_id=2, date=date(2024, 3, 1), body_metric=None))
+        db.close()
+
+        # Act
+        response = self.client.get("/api/pets/2/dashboard")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        latest = response.json()["latest_health"]
+        self.assertEqual(latest["date"], "2024-03-01")
+        self.assertIsNone(latest["health_metric"])
+        self.assertIsNone(latest["delta"])
+
+    def test_dashboard_unknown_pet(self):
+        """Test 404 for a pet that does not exist"""
+        # Act
+        response = self.client.get("/api/pets/99/dashboard")
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from sqlalchemy import insert
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import User, Pet, Species, Breed, Pet_history
+from backend.routers import reports
+from backend.services.report_service import ReportService
+
+
+class TestExportRouter(SQLiteTestCase):
+    """Test cases for GET /api/reports/{user_id}/export"""
+
+    session_options = {"expire_on_commit": False}
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        db = self.SessionTest()
+        db.add_all([
+            User(user_id=1, name="ana", email="ana@example.com", phone_number="555"),
+            User(user_id=2, name="bob", email="bob@example.com", phone_number="556"),
+            Species(species_id=1, name="Dog"),
+            Breed(breed_id=1, species_id=1, name="Labrador"),
+            Pet(pet_id=1, name="Buddy", species_id=1, breed_id=1, user_id=1),
+            Pet(pet_id=2, name="Stray", species_id=9, breed_id=9, user_id=1),
+            Pet(pet_id=3, name="Other", species_id=1, breed_id=1, user_id=2),
+        ])
+        db.flush()
+        start = date(2020, 1, 1)
+        db.execute(insert(Pet_history), [
+            {"pet_id": pet_id, "date": start + timedelta(days=i), "body_metric": 2.5}
+            for pet_id in (2, 1, 3) for i in range(600)
+        ])
+        db.commit()
+        db.close()
+
+        self.client = self.make_client(reports.router)
+
+    def test_export_csv(self):
+        """Test the CSV export has a header and every row of the user's pets in order"""
+        # Act
+        response = self.client.get("/api/reports/1/export")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/csv"))
+        self.assertIn("health-history-1.csv", response.headers["content-disposition"])
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        self.assertEqual(len(rows), 1200)
+        self.assertEqual(rows[0]["pet_name"], "Buddy")
+        self.assertEqual(rows[0]["date"], "2020-01-01")
+        self.assertEqual(rows[0]["species"], "Dog")
+        self.assertEqual(rows[-1]["pet_name"], "Stray")
+        self.assertEqual(rows[-1]["breed"], "Unknown")
+
+    def test_export_ndjson(self):
+        """Test the NDJSON export emits one JSON object per history row"""
+        # Act
+        response = self.client.get("/api/reports/2/export?format=ndjson")
+
+        # Assert
+        lines = response.text.splitlines()
+        self.assertEqual(len(lines), 600)
+        self.assertEqual(json.loads(lines[0]), {
+            "pet_id": 3, "pet_name": "Other", "species": "Dog", "breed": "Labrador",
+            "report_id": json.loads(lines[0])["report_id"], "date": "2020-01-01", "body_metric": 2.5
+        })
+
+    def test_export_is_chunked(self):
+        """Test that the export is produced in chunks rather than one document"""
+        # Act
+        db = self.SessionTest()
+        chunks = list(ReportService.export_history(db, 1, "ndjson", chunk_rows=100))
+        db.close()
+
+        # Assert
+        self.assertEqual(len(chunks), 12)
+        self.assertTrue(all(chunk.count("\n") == 100 for chunk in chunks))
+
+    def test_export_invalid_format(self):
+        """Test 422 for an unsupported format"""
+        # Act
+        response = self.client.get("/api/reports/1/export?format=xml")
+
+        # Assert
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == '__main__':
+    unittest.main()
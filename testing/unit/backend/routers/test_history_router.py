@@ -0,0 +1,99 @@
+import unittest
+from datetime import date, timedelta
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from sqlalchemy import insert
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import Pet
+from backend.models.relationships import Pet_history
+from backend.routers import pets
+
+
+class TestHistoryRouter(SQLiteTestCase):
+    """Test cases for GET /api/pets/{pet_id}/history"""
+    
+    session_options = {"expire_on_commit": False}
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        db = self.SessionTest()
+        db.add(Pet(pet_id=1, name="Buddy", weight=10, height=0.5, species_id=1, breed_id=1, user_id=1))
+        db.flush()
+        start = date(2023, 1, 1)
+        db.execute(insert(Pet_history), [
+            {"pet_id": 1, "date": start + timedelta(days=i), "body_metric": (i % 30) / 10}
+            for i in range(365)
+        ])
+        db.commit()
+        db.close()
+        
+        self.client = self.make_client(pets.router)
+        
+    def test_history_within_points_not_downsampled(self):
+        """Test that a short range returns every point in date order"""
+        # Act
+        response = self.client.get("/api/pets/1/history?from=2023-01-01&to=2023-01-10&points=50")
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertFalse(body["downsampled"])
+        self.assertEqual(body["total"], 10)
+        self.assertEqual(body["points"][0], {"date": "2023-01-01", "value": 0.0})
+        self.assertEqual([p["date"] for p in body["points"]], sorted(p["date"] for p in body["points"]))
+        
+    def test_history_downsampled_to_points(self):
+        """Test that a long series is reduced to the requested number of points"""
+        # Act
+        response = self.client.get("/api/pets/1/history?points=60")
+        
+        # Assert
+        body = response.json()
+        self.assertTrue(body["downsampled"])
+        self.assertEqual(body["total"], 365)
+        self.assertEqual(len(body["points"]), 60)
+        self.assertEqual(body["points"][0]["date"], "2023-01-01")
+        self.assertEqual(body["points"][-1]["date"], "2023-12-31")
+        
+    def test_rollups_pick_coarsest_granularity(self):
+        """Test that a year at 6 points uses months and a quarter at 12 points uses weeks"""
+        # Arrange
+        from backend.repositories.rollup_repository import RollupRepository
+        db = self.SessionTest()
+        RollupRepository.rebuild(db)
+        db.close()
+        
+        # Act
+        yearly = self.client.get("/api/pets/1/rollups?from=2023-01-01&to=2023-12-31&points=6").json()
+        quarterly = self.client.get("/api/pets/1/rollups?from=2023-01-01&to=2023-03-31&points=12").json()
+        
+        # Assert
+        self.assertEqual(yearly["granularity"], "month")
+        self.assertEqual(len(yearly["buckets"]), 12)
+        self.assertEqual(sum(b["count"] for b in yearly["buckets"]), 365)
+        self.assertEqual(quarterly["granularity"], "week")
+        
+    def test_history_unknown_pet(self):
+        """Test 404 for a pet that does not exist"""
+        # Act
+        response = self.client.get("/api/pets/99/history")
+        
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        
+    def test_history_inverted_range(self):
+        """Test 400 when 'from' is after 'to'"""
+        # Act
+        response = self.client.get("/api/pets/1/history?from=2023-02-01&to=2023-01-01")
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+from datetime import date
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import User, Pet, Activity, Feeding, Medical_condition, Vaccine, Pet_history, Pet_activity, Pet_feeding
+from backend.repositories.user_repository import UserRepository
+from backend.repositories.report_repository import ReportRepository
+from backend.routers import pets, reports, activities
+from backend.utils.reference_cache import reference_cache
+
+
+class TestWriteStatements(SQLiteTestCase):
+    """Each write endpoint inserts with one statement and never reads the row back"""
+
+    # Same options as SessionLocal
+    session_options = {"autocommit": False, "autoflush": False, "expire_on_commit": False}
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        db = self.SessionTest()
+        db.add_all([
+            User(user_id=1, name="ana", email="ana@example.com", phone_number="555", password_hash="x"),
+            Pet(pet_id=1, name="Buddy", weight=10, height=0.5, species_id=1, breed_id=1, user_id=1),
+            Activity(activity_id=1, name="Walk", description="Daily walk"),
+            Feeding(feeding_id=1, name="Kibble", description="Dry food", calories=350),
+            Medical_condition(mc_id=1, name="Allergy", description="d", recommendations="r"),
+            Vaccine(vaccine_id=1, name="Rabies", recommended_age=0.5),
+        ])
+        db.commit()
+        ReportRepository.create_pet_history(db, Pet_history(pet_id=1, date=date(2024, 1, 1), body_metric=2.0))
+        db.close()
+
+        self.count_statements()
+        reference_cache.invalidate()
+
+        self.client = self.make_client(pets.router, reports.router, activities.router)
+
+    def tearDown(self):
+        reference_cache.invalidate()
+
+    def _count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement.lstrip().split()[0].upper())
+
+    def _post(self, url, payload):
+        self.statements.clear()
+        response = self.client.post(url, json=payload)
+        self.assertEqual(response.status_code, 201, response.text)
+        return response
+
+    def _assert_single_insert_tail(self, inserts=1):
+        """The write is the last statement(s) and nothing is selected afterwards"""
+        first_insert = self.statements.index("INSERT")
+        self.assertEqual(self.statements[first_insert:], ["INSERT"] * inserts)
+
+    def test_create_report_statements(self):
+        """Test POST /api/reports is one lookup, the INSERT, the summary read and UPDATE and the rollup upsert"""
+        # Act
+        response = self._post("/api/reports", {"petId": 1, "bmiStatus": 2.5, "date": "2024-01-01"})
+
+        # Assert
+        self.assertIsNotNone(response.json()["report_id"])
+        self.assertEqual(self.statements, ["SELECT", "INSERT", "SELECT", "UPDATE", "INSERT"])
+
+    def test_create_activity_statements(self):
+        """Test POST /api/activities is one EXISTS check plus one INSERT"""
+        # Act
+        self._post("/api/activities", {"pet_id": 1, "activity_id": 1, "frequency": 3})
+
+        # Assert
+        self.assertEqual(self.statements, ["SELECT", "INSERT"])
+
+    def test_create_feeding_statements(self):
+        """Test POST /api/foods is one EXISTS check plus one INSERT"""
+        # Act
+        self._post("/api/foods", {"pet_id": 1, "feeding_id": 1, "frequency": 2})
+
+        # Assert
+        self.assertEqual(self.statements, ["SELECT", "INSERT"])
+
+    def test_resubmitted_activity_updates_frequency(self):
+        """Test that posting the same pet/activity again is one upsert, not a 400"""
+        # Arrange
+        self._post("/api/activities", {"pet_id": 1, "activity_id": 1, "frequency": 3})
+
+        # Act
+        self._post("/api/activities", {"pet_id": 1, "activity_id": 1, "frequency": 5})
+
+        # Assert
+        self.assertEqual(self.statements, ["SELECT", "INSERT"])
+        db = self.SessionTest()
+        rows = db.query(Pet_activity.weekly_frequency_activity).filter_by(pet_id=1, activity_id=1).all()
+        db.close()
+        self.assertEqual([tuple(row) for row in rows], [(5,)])
+
+    def test_resubmitted_feeding_updates_frequency(self):
+        """Test that posting the same pet/feeding again keeps one row with the new frequency"""
+        # Arrange
+        self._post("/api/foods", {"pet_id": 1, "feeding_id": 1, "frequency": 2})
+
+        # Act
+        self._post("/api/foods", {"pet_id": 1, "feeding_id": 1, "frequency": 4})
+
+        # Assert
+        db = self.SessionTest()
+        rows = db.query(Pet_feeding.daily_meal_frequency).filter_by(pet_id=1, feeding_id=1).all()
+        db.close()
+        self.assertEqual([tuple(row) for row in rows], [(4,)])
+
+    def test_create_pet_statements(self):
+        """Test POST /api/pets returns the new id without re-reading the pet"""
+        # Act
+        response = self._post("/api/pets", {
+            "name": "Max", "user_id": 1, "species": 1, "breed": 1, "birthdate": "2020-01-01",
+            "height": 0.4, "weight": 8, "conditions": [1], "vaccines": [1],
+        })
+
+        # Assert
+        self.assertEqual(response.json()["pet_id"], 2)
+        self._assert_single_insert_tail(inserts=3)
+
+    def test_create_user_single_statement(self):
+        """Test registering a user is exactly one INSERT"""
+        # Arrange
+        db = self.SessionTest()
+        self.statements.clear()
+
+        # Act
+        user = UserRepository.create_user(
+            db, User(name="bob", email="bob@example.com", phone_number="556", password_hash="x")
+        )
+        user_id = user.user_id
+        db.close()
+
+        # Assert
+        self.assertEqual(user_id, 2)
+        self.assertEqual(self.statements, ["INSERT"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import Mock, patch
 from datetime import date
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 
 # Imports del código a testear
 import sys
@@ -77,6 +79,46 @@ class TestActivityService(unittest.TestCase):
         )
         self.assertTrue(result)
         
+    @patch('backend.services.activity_service.ActivityRepository')
+    def test_create_pet_activity_integrity_error(self, mock_activity_repo):
+        """Test that a constraint violation is a 400 without the driver message"""
+        # Arrange
+        mock_activity_repo.create_pet_activity.side_effect = IntegrityError("INSERT", {}, Exception("fk detail"))
+        mock_activity_repo.pet_and_activity_exist.return_value = (True, True)
+        
+        # Act
+        with self.assertRaises(HTTPException) as context:
+            ActivityService.create_pet_activity(self.mock_db, self.sample_activity_data)
+        
+        # Assert
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(context.exception.detail, "Invalid pet activity")
+        
+    @patch('backend.services.activity_service.ActivityRepository')
+    def test_create_pet_feeding_pet_deleted_during_insert(self, mock_activity_repo):
+        """Test that a pet deleted after the refs check is a 404"""
+        # Arrange
+        mock_activity_repo.create_pet_feeding.side_effect = IntegrityError("INSERT", {}, Exception("fk detail"))
+        mock_activity_repo.pet_and_feeding_exist.return_value = (False, True)
+        
+        # Act
+        with self.assertRaises(HTTPException) as context:
+            ActivityService.create_pet_feeding(self.mock_db, self.sample_feeding_data)
+        
+        # Assert
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertEqual(context.exception.detail, "Pet not found")
+        
+    @patch('backend.services.activity_service.ActivityRepository')
+    def test_create_pet_activity_other_errors_propagate(self, mock_activity_repo):
+        """Test that errors other than constraint violations are not turned into a 400"""
+        # Arrange
+        mock_activity_repo.create_pet_activity.side_effect = RuntimeError("connection lost")
+        
+        # Act & Assert
+        with self.assertRaises(RuntimeError):
+            ActivityService.create_pet_activity(self.mock_db, self.sample_activity_data)
+        
     @patch('backend.services.activity_service.ActivityRepository')
     def test_get_activities_by_pet(self, mock_activity_repo):
         """Test retrieving activities by pet"""
@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import patch
+import asyncio
+import signal
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from backend.services.catalog_service import CatalogService
+
+
+@unittest.skipUnless(hasattr(signal, "SIGUSR1"), "POSIX signals only")
+class TestCatalogReloadSignal(unittest.TestCase):
+    """Test cases for the per-process catalog reload hook"""
+    
+    @patch.object(CatalogService, 'invalidate_catalogs')
+    def test_sigusr1_invalidates_catalogs(self, mock_invalidate):
+        """Test that SIGUSR1 drops the catalogs from the event loop"""
+        # Act
+        async def scenario():
+            installed = CatalogService.reload_on_signal()
+            os.kill(os.getpid(), signal.SIGUSR1)
+            await asyncio.sleep(0.05)
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGUSR1)
+            return installed
+        
+        # Assert
+        self.assertTrue(asyncio.run(scenario()))
+        mock_invalidate.assert_called_once()
+        
+    def test_without_running_loop_is_skipped(self):
+        """Test that calling outside an event loop installs nothing"""
+        # Act & Assert
+        self.assertFalse(CatalogService.reload_on_signal())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import Mock, patch
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from backend.services.medical_service import MedicalService
+from backend.utils.reference_cache import CatalogEntry
+
+
+class TestMedicalService(unittest.TestCase):
+    """Test cases for MedicalService class"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.mock_db = Mock()
+        self.catalog = CatalogEntry(payload=b"[]", count=2, items=(Mock(mc_id=1), Mock(mc_id=2)))
+        
+    @patch('backend.services.medical_service.reference_cache')
+    @patch('backend.services.medical_service.MedicalRepository')
+    def test_find_unknown_condition_ids_all_cached(self, mock_repository, mock_cache):
+        """Test that ids in the cached catalog need no query"""
+        # Arrange
+        mock_cache.get.return_value = self.catalog
+        
+        # Act
+        result = MedicalService.find_unknown_condition_ids(self.mock_db, [1, 2])
+        
+        # Assert
+        self.assertEqual(result, [])
+        mock_repository.existing_condition_ids.assert_not_called()
+        
+    @patch('backend.services.medical_service.reference_cache')
+    @patch('backend.services.medical_service.MedicalRepository')
+    def test_find_unknown_condition_ids_checks_misses_without_reload(self, mock_repository, mock_cache):
+        """Test that ids missing from the cache are checked in one query and the cache is kept"""
+        # Arrange
+        mock_cache.get.return_value = self.catalog
+        mock_repository.existing_condition_ids.return_value = {3}
+        
+        # Act
+        result = MedicalService.find_unknown_condition_ids(self.mock_db, [1, 3, 4])
+        
+        # Assert
+        self.assertEqual(result, [4])
+        mock_repository.existing_condition_ids.assert_called_once_with(self.mock_db, {3, 4})
+        mock_cache.invalidate.assert_not_called()
+        self.assertEqual(mock_cache.get.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
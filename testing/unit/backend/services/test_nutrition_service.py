@@ -0,0 +1,69 @@
+import unittest
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import Pet, Feeding, Pet_feeding
+from backend.services.nutrition_service import NutritionService
+
+
+class TestNutritionService(SQLiteTestCase):
+    """Test cases for NutritionService against in-memory SQLite"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.db = self.session()
+        self.db.add_all([
+            Feeding(feeding_id=1, name="Kibble", description="-", calories=200),
+            Feeding(feeding_id=2, name="Treats", description="-", calories=50),
+            Pet(pet_id=1, name="Buddy", weight=10, user_id=1),
+            Pet(pet_id=2, name="Max", weight=4, user_id=1),
+            Pet(pet_id=3, name="Nemo", user_id=1),
+            Pet(pet_id=4, name="Other", weight=20, user_id=2),
+            Pet_feeding(pet_id=1, feeding_id=1, daily_meal_frequency=2),
+            Pet_feeding(pet_id=1, feeding_id=2, daily_meal_frequency=3),
+            Pet_feeding(pet_id=4, feeding_id=1, daily_meal_frequency=1),
+        ])
+        self.db.commit()
+        self.count_statements()
+        
+    def test_get_user_nutrition(self):
+        """Test daily calories per pet from one aggregate query"""
+        # Act
+        nutrition = NutritionService.get_user_nutrition(self.db, 1)
+        
+        # Assert
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual([pet["id"] for pet in nutrition], [1, 2, 3])
+        self.assertEqual([pet["daily_calories"] for pet in nutrition], [550.0, 0.0, 0.0])
+        self.assertEqual(nutrition[0]["resting_energy"], 393.6)
+        self.assertEqual((nutrition[0]["intake_ratio"], nutrition[0]["status"]), (1.4, "Adequate"))
+        self.assertEqual(nutrition[1]["status"], "Insufficient")
+        self.assertEqual((nutrition[2]["intake_ratio"], nutrition[2]["status"]), (None, "Unknown"))
+        
+    def test_iter_nutrition_chunks_whole_table(self):
+        """Test that chunks cover every pet once with one query per chunk"""
+        # Act
+        chunks = list(NutritionService.iter_nutrition(self.db, chunk_size=3))
+        
+        # Assert
+        self.assertEqual([[pet["id"] for pet in chunk] for chunk in chunks], [[1, 2, 3], [4]])
+        self.assertEqual(len(self.statements), 2)
+        self.assertEqual(chunks[1][0]["daily_calories"], 200.0)
+        
+    def test_iter_nutrition_exact_multiple(self):
+        """Test that a table filling the last chunk exactly ends with an empty read"""
+        # Act
+        chunks = list(NutritionService.iter_nutrition(self.db, chunk_size=2))
+        
+        # Assert
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2])
+        self.assertEqual(len(self.statements), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
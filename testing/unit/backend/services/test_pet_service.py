@@ -9,7 +9,12 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models import Species, Breed, Medical_condition, Vaccine, User
+from backend.utils.reference_cache import reference_cache
+from backend.utils.pagination import PageParams, decode_cursor
 from backend.services.pet_service import PetService
+from backend.services.medical_service import MedicalService
 from backend.schemas.pet import PetCreate
 from backend.models.pet import Pet
 from backend.models.relationships import Pet_medical_condition, Pet_vaccine
@@ -21,6 +26,7 @@ class TestPetService(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.mock_db = Mock()
+        self.mock_db.info = {}
         self.sample_pet_data = PetCreate(
             name="Buddy",
             user_id=1,
@@ -33,18 +39,21 @@ class TestPetService(unittest.TestCase):
             vaccines=[1]
         )
         
+    @patch('backend.services.pet_service.MedicalService')
     @patch('backend.services.pet_service.PetRepository')
     @patch('backend.services.pet_service.Pet')
-    def test_create_pet_success(self, mock_pet_class, mock_pet_repo):
+    def test_create_pet_success(self, mock_pet_class, mock_pet_repo, mock_medical_service):
         """Test successful pet creation"""
         # Arrange
         mock_pet_repo.get_pet_by_name_user.return_value = None
         mock_pet_class.calculate_age.return_value = 4
+        mock_medical_service.find_unknown_condition_ids.return_value = []
+        mock_medical_service.find_unknown_vaccine_ids.return_value = []
         
         mock_pet_instance = Mock()
         mock_pet_instance.pet_id = 1
         mock_pet_class.return_value = mock_pet_instance
-        mock_pet_repo.create.return_value = mock_pet_instance
+        mock_pet_repo.create_with_links.return_value = mock_pet_instance
         
         # Act
         result = PetService.create_pet(self.mock_db, self.sample_pet_data)
@@ -54,11 +63,27 @@ class TestPetService(unittest.TestCase):
             self.mock_db, "Buddy", 1
         )
         mock_pet_class.calculate_age.assert_called_once_with(date(2020, 1, 1))
-        mock_pet_repo.create.assert_called_once()
-        self.mock_db.add.assert_called()
-        self.mock_db.commit.assert_called_once()
+        mock_pet_repo.create_with_links.assert_called_once_with(
+            self.mock_db, mock_pet_instance, [1, 2], [1]
+        )
         self.assertEqual(result, mock_pet_instance)
         
+    @patch('backend.services.pet_service.MedicalService')
+    @patch('backend.services.pet_service.PetRepository')
+    def test_create_pet_unknown_condition(self, mock_pet_repo, mock_medical_service):
+        """Test that unknown condition ids are rejected before any insert"""
+        # Arrange
+        mock_pet_repo.get_pet_by_name_user.return_value = None
+        mock_medical_service.find_unknown_condition_ids.return_value = [2]
+        
+        # Act & Assert
+        with self.assertRaises(HTTPException) as context:
+            PetService.create_pet(self.mock_db, self.sample_pet_data)
+        
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertEqual(context.exception.detail, "Medical condition not found: [2]")
+        mock_pet_repo.create_with_links.assert_not_called()
+        
     @patch('backend.services.pet_service.PetRepository')
     def test_create_pet_already_exists(self, mock_pet_repo):
         """Test pet creation when pet already exists"""
@@ -99,11 +124,9 @@ class TestPetService(unittest.TestCase):
         mock_vaccine = Mock()
         mock_vaccine.name = "Rabies"
         
-        mock_pet_repo.get_user_pets.return_value = [mock_pet]
-        mock_pet_repo.get_species_by_id.return_value = mock_species
-        mock_pet_repo.get_breed_by_id.return_value = mock_breed
-        mock_medical_repo.get_conditions_by_pet.return_value = [mock_condition]
-        mock_medical_repo.get_vaccines_by_pet.return_value = [mock_vaccine]
+        mock_pet_repo.get_user_pets_with_names.return_value = [(mock_pet, mock_species.name, mock_breed.name)]
+        mock_medical_repo.get_conditions_for_pets.return_value = {1: [mock_condition.name]}
+        mock_medical_repo.get_vaccines_for_pets.return_value = {1: [mock_vaccine.name]}
         
         # Act
         result = PetService.get_user_pets(self.mock_db, 1)
@@ -117,12 +140,14 @@ class TestPetService(unittest.TestCase):
         self.assertEqual(pet_data["breed"], "Golden Retriever")
         self.assertEqual(pet_data["conditions"], ["Allergy"])
         self.assertEqual(pet_data["vaccines"], ["Rabies"])
+        mock_medical_repo.get_conditions_for_pets.assert_called_once_with(self.mock_db, [1])
+        mock_medical_repo.get_vaccines_for_pets.assert_called_once_with(self.mock_db, [1])
         
     @patch('backend.services.pet_service.PetRepository')
     def test_get_user_pets_no_pets(self, mock_pet_repo):
         """Test retrieval when user has no pets"""
         # Arrange
-        mock_pet_repo.get_user_pets.return_value = []
+        mock_pet_repo.get_user_pets_with_names.return_value = []
         
         # Act
         result = PetService.get_user_pets(self.mock_db, 1)
@@ -144,11 +169,9 @@ class TestPetService(unittest.TestCase):
         mock_pet.height = 50.0
         mock_pet.weight = 25.0
         
-        mock_pet_repo.get_user_pets.return_value = [mock_pet]
-        mock_pet_repo.get_species_by_id.return_value = None  # No species found
-        mock_pet_repo.get_breed_by_id.return_value = None    # No breed found
-        mock_medical_repo.get_conditions_by_pet.return_value = []
-        mock_medical_repo.get_vaccines_by_pet.return_value = []
+        mock_pet_repo.get_user_pets_with_names.return_value = [(mock_pet, None, None)]  # No species/breed found
+        mock_medical_repo.get_conditions_for_pets.return_value = {}
+        mock_medical_repo.get_vaccines_for_pets.return_value = {}
         
         # Act
         result = PetService.get_user_pets(self.mock_db, 1)
@@ -162,5 +185,133 @@ class TestPetService(unittest.TestCase):
         self.assertEqual(pet_data["vaccines"], [])
 
 
+class TestPetServiceQueryCount(SQLiteTestCase):
+    """Query-count regression tests for PetService against in-memory SQLite"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.db = self.session()
+        self.count_statements()
+        
+        self.db.add_all([
+            Species(species_id=1, name="Dog"),
+            Breed(breed_id=1, species_id=1, name="Labrador"),
+            Medical_condition(mc_id=1, name="Allergy", description="-", recommendations="-"),
+            Vaccine(vaccine_id=1, name="Rabies", recommended_age=0.5),
+        ])
+        self.db.commit()
+        
+    def _add_pets(self, user_id, count, start_id):
+        for pet_id in range(start_id, start_id + count):
+            self.db.add(Pet(pet_id=pet_id, name=f"Pet {pet_id}", weight=10, height=0.5,
+                            date_of_birth=date(2020, 1, 1), species_id=1, breed_id=1, user_id=user_id))
+            self.db.add(Pet_medical_condition(pet_id=pet_id, mc_id=1))
+            self.db.add(Pet_vaccine(pet_id=pet_id, vaccine_id=1))
+        self.db.commit()
+        
+    def _count_listing_queries(self, user_id):
+        self.db.expire_all()
+        self.statements.clear()
+        pets = PetService.get_user_pets(self.db, user_id)
+        return pets, len(self.statements)
+        
+    def test_create_pet_single_transaction(self):
+        """Test that the pet and its links are inserted in one commit"""
+        # Arrange
+        self.db.add(User(user_id=1, name="Owner", email="owner@example.com", phone_number="1"))
+        self.db.add(Vaccine(vaccine_id=2, name="DHPP", recommended_age=0.5))
+        self.db.commit()
+        reference_cache.invalidate()
+        pet_data = PetCreate(name="Buddy", user_id=1, species=1, breed=1, birthdate=date(2020, 1, 1),
+                             height=0.5, weight=10, conditions=[1, 1], vaccines=[1, 2])
+        self.statements.clear()
+        
+        # Act
+        pet = PetService.create_pet(self.db, pet_data)
+        
+        # Assert
+        inserts = [s for s in self.statements if s.startswith("INSERT")]
+        self.assertEqual(len(inserts), 3)  # pet, condition links, vaccine links
+        self.assertEqual(self.db.query(Pet_medical_condition).filter_by(pet_id=pet.pet_id).count(), 1)
+        self.assertEqual(self.db.query(Pet_vaccine).filter_by(pet_id=pet.pet_id).count(), 2)
+        
+    def test_create_pet_unknown_vaccine_inserts_nothing(self):
+        """Test that an unknown vaccine id leaves the database untouched"""
+        # Arrange
+        self.db.add(User(user_id=1, name="Owner", email="owner@example.com", phone_number="1"))
+        self.db.commit()
+        reference_cache.invalidate()
+        pet_data = PetCreate(name="Buddy", user_id=1, species=1, breed=1, birthdate=date(2020, 1, 1),
+                             height=0.5, weight=10, conditions=[1], vaccines=[99])
+        
+        # Act & Assert
+        with self.assertRaises(HTTPException) as context:
+            PetService.create_pet(self.db, pet_data)
+        self.assertEqual(context.exception.detail, "Vaccine not found: [99]")
+        self.assertEqual(self.db.query(Pet).count(), 0)
+        
+    def test_get_user_pets_query_count_is_constant(self):
+        """Test that listing pets costs the same queries for 1 or 40 pets"""
+        # Arrange
+        self._add_pets(user_id=1, count=1, start_id=1)
+        self._add_pets(user_id=2, count=40, start_id=100)
+        
+        # Act
+        small, small_queries = self._count_listing_queries(1)
+        large, large_queries = self._count_listing_queries(2)
+        
+        # Assert
+        self.assertEqual(len(small), 1)
+        self.assertEqual(len(large), 40)
+        self.assertEqual(large[0]["species"], "Dog")
+        self.assertEqual(large[0]["conditions"], ["Allergy"])
+        self.assertEqual(large[0]["vaccines"], ["Rabies"])
+        self.assertEqual(small_queries, large_queries)
+        self.assertLessEqual(large_queries, 3)
+        
+    def test_get_user_pets_page_walks_all_pets(self):
+        """Test that following cursors returns every pet once, at constant cost"""
+        # Arrange
+        self._add_pets(user_id=1, count=7, start_id=1)
+        page = PageParams(limit=3, after_id=None)
+        seen, query_counts = [], []
+        
+        # Act
+        while True:
+            self.statements.clear()
+            pets, next_cursor = PetService.get_user_pets_page(self.db, 1, page)
+            query_counts.append(len(self.statements))
+            seen.extend(pet["id"] for pet in pets)
+            if next_cursor is None:
+                break
+            page = PageParams(limit=3, after_id=decode_cursor(next_cursor))
+        
+        # Assert
+        self.assertEqual(seen, list(range(1, 8)))
+        self.assertEqual(len(query_counts), 3)
+        self.assertEqual(len(set(query_counts)), 1)
+
+        
+    def test_get_user_pet_metrics(self):
+        """Test that metrics for all of a user's pets come from one pet query"""
+        # Arrange
+        self._add_pets(user_id=1, count=3, start_id=1)
+        self.db.add(Pet(pet_id=9, name="Nemo", weight=1, height=0.1, species_id=7, user_id=1))
+        self.db.commit()
+        reference_cache.invalidate()
+        MedicalService.get_species_catalog(self.db)
+        self.statements.clear()
+        
+        # Act
+        metrics = PetService.get_user_pet_metrics(self.db, 1)
+        
+        # Assert
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual([m["id"] for m in metrics], [1, 2, 3, 9])
+        self.assertEqual((metrics[0]["bmi"], metrics[0]["status"]), (40.0, "Obese"))
+        self.assertEqual(metrics[-1]["status"], "Unknown")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import patch
+from fastapi import HTTPException
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from testing.unit.backend.sqlite_case import SQLiteTestCase
+from backend.models.user import User
+from backend.repositories.user_repository import UserRepository
+from backend.schemas.user import UserCreate
+from backend.services.user_service import UserService
+
+
+class TestUserServiceRegistration(SQLiteTestCase):
+    """Test cases for user registration against in-memory SQLite"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.db = self.session()
+        self.db.add(User(name="taken", email="taken@example.com", phone_number="111"))
+        self.db.commit()
+        self.count_statements()
+        
+    def _user_data(self, name="new", email="new@example.com", phone="222"):
+        return UserCreate(name=name, email=email, phone=phone, password="pw", confirmPassword="pw")
+        
+    def test_find_conflicts_reports_every_field(self):
+        """Test that one query reports all colliding fields"""
+        # Act
+        conflicts = UserRepository.find_conflicts(self.db, "taken@example.com", "111", "taken")
+        
+        # Assert
+        self.assertEqual(conflicts, {"email", "phone", "name"})
+        self.assertEqual(len(self.statements), 1)
+        
+    def test_find_conflicts_none(self):
+        """Test that free values report no conflicts"""
+        # Act
+        conflicts = UserRepository.find_conflicts(self.db, "free@example.com", "999", "free")
+        
+        # Assert
+        self.assertEqual(conflicts, set())
+        
+    def test_conflict_message_priority(self):
+        """Test that email collisions are reported before phone and name"""
+        # Act & Assert
+        with self.assertRaises(HTTPException) as context:
+            UserService.check_user_available(self.db, self._user_data(name="taken", phone="111", email="taken@example.com"))
+        self.assertEqual(context.exception.status_code, 409)
+        self.assertEqual(context.exception.detail, "A user with this email already exists")
+        
+        with self.assertRaises(HTTPException) as context:
+            UserService.check_user_available(self.db, self._user_data(name="taken"))
+        self.assertEqual(context.exception.detail, "A user with this name already exists")
+        
+    @patch('backend.models.user.bcrypt')
+    def test_create_user_two_round_trips(self, mock_bcrypt):
+        """Test that registration costs one lookup and one insert"""
+        # Arrange
+        mock_bcrypt.hashpw.return_value = b"hashed"
+        
+        # Act
+        user = UserService.create_user(self.db, self._user_data())
+        
+        # Assert
+        selects_and_inserts = [s for s in self.statements if s.split()[0] in ("SELECT", "INSERT")]
+        self.assertEqual(len(selects_and_inserts), 2)
+        self.assertIsNotNone(user.user_id)
+        self.assertEqual(user.email, "new@example.com")
+        
+    def test_insert_race_becomes_conflict(self):
+        """Test that a unique violation on insert is reported as a 409"""
+        # Arrange
+        duplicate = User(name="other", email="taken@example.com", phone_number="333", password_hash="x")
+        
+        # Act & Assert
+        with self.assertRaises(HTTPException) as context:
+            UserService._insert_user(self.db, duplicate, self._user_data(name="other", email="taken@example.com", phone="333"))
+        self.assertEqual(context.exception.status_code, 409)
+        self.assertEqual(context.exception.detail, "A user with this email already exists")
+
+        
+    def test_ensure_user_exists_trusts_matching_token(self):
+        """Test that a token for the same user skips the lookup"""
+        # Act
+        UserService.ensure_user_exists(self.db, 999, token_user_id=999)
+        
+        # Assert
+        self.assertEqual(self.statements, [])
+        
+    def test_ensure_user_exists_rejects_other_user_token(self):
+        """Test that a token cannot read another user's data"""
+        # Act & Assert
+        with self.assertRaises(HTTPException) as context:
+            UserService.ensure_user_exists(self.db, 1, token_user_id=2)
+        self.assertEqual(context.exception.status_code, 403)
+        
+    def test_ensure_user_exists_without_token_queries(self):
+        """Test that requests without a token still check the database"""
+        # Act & Assert
+        with self.assertRaises(HTTPException) as context:
+            UserService.ensure_user_exists(self.db, 999)
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertEqual(len(self.statements), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from backend.config.database import Base, get_db
+
+
+class SQLiteTestCase(unittest.TestCase):
+    """Base for tests against an in-memory SQLite database with every table.
+
+    One connection is shared (StaticPool) so the TestClient's worker thread
+    sees the same data. ``self.statements`` collects what runs after
+    ``count_statements()``; override ``_count_statement`` to record less.
+    """
+
+    session_options: dict = {}  # extra sessionmaker() arguments
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.addCleanup(self.engine.dispose)
+        Base.metadata.create_all(self.engine)
+        self.SessionTest = sessionmaker(bind=self.engine, **self.session_options)
+        self.statements = []
+
+    def session(self):
+        """A session closed when the test ends"""
+        db = self.SessionTest()
+        self.addCleanup(db.close)
+        return db
+
+    def seed(self, *rows):
+        """Commit ``rows`` from a throwaway session"""
+        db = self.SessionTest()
+        try:
+            db.add_all(rows)
+            db.commit()
+        finally:
+            db.close()
+
+    def count_statements(self):
+        event.listen(self.engine, "before_cursor_execute", self._count_statement)
+
+    def _count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _get_test_db(self):
+        db = self.SessionTest()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def make_client(self, *routers) -> TestClient:
+        """A client for an app with ``routers`` whose get_db uses this database"""
+        app = FastAPI()
+        for router in routers:
+            app.include_router(router)
+        app.dependency_overrides[get_db] = self._get_test_db
+        return TestClient(app)
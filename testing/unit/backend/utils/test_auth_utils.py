@@ -6,7 +6,7 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 
-from backend.utils.auth_utils import hash_password, verify_password
+from backend.utils.auth_utils import hash_password, verify_password, create_access_token, decode_access_token
 
 
 class TestAuthUtils(unittest.TestCase):
@@ -124,6 +124,47 @@ class TestAuthUtils(unittest.TestCase):
         
         # Assert
         self.assertFalse(is_valid)
+        
+    def test_access_token_roundtrip(self):
+        """Test that a fresh token decodes to its user id"""
+        # Act
+        token = create_access_token(42)
+        
+        # Assert
+        self.assertEqual(decode_access_token(token), 42)
+        
+    def test_access_token_expired(self):
+        """Test that expired tokens are rejected"""
+        # Arrange
+        token = create_access_token(42, expires_in=-1)
+        
+        # Act & Assert
+        self.assertIsNone(decode_access_token(token))
+        
+    def test_access_token_tampered(self):
+        """Test that a token with a modified payload is rejected"""
+        # Arrange
+        token = create_access_token(42)
+        forged = create_access_token(1).split(".")[0] + "." + token.split(".")[1]
+        
+        # Act & Assert
+        self.assertIsNone(decode_access_token(forged))
+        
+    def test_access_token_other_secret(self):
+        """Test that tokens signed with another secret are rejected"""
+        # Arrange
+        with patch('backend.utils.auth_utils.settings') as mock_settings:
+            mock_settings.SECRET_KEY = "another-secret"
+            mock_settings.ACCESS_TOKEN_EXPIRE_MINUTES = 5
+            token = create_access_token(42)
+        
+        # Act & Assert
+        self.assertIsNone(decode_access_token(token))
+        
+    def test_access_token_garbage(self):
+        """Test that malformed tokens are rejected without raising"""
+        for token in ["", "undefined", "null", "a.b.c", "not-base64!.sig", "ñ.ñ"]:
+            self.assertIsNone(decode_access_token(token))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,83 @@
+import unittest
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from backend.utils.downsampling import lttb, lttb_stream
+
+
+class TestLttb(unittest.TestCase):
+    """Test cases for Largest-Triangle-Three-Buckets downsampling"""
+    
+    def test_short_series_untouched(self):
+        """Test that a series already under the threshold keeps every point"""
+        # Arrange
+        points = [(x, x * 2.0) for x in range(10)]
+        
+        # Act
+        result = lttb(points, 20)
+        
+        # Assert
+        self.assertEqual(result, list(range(10)))
+        
+    def test_threshold_respected(self):
+        """Test that exactly threshold sorted indexes come back, ends included"""
+        # Arrange
+        points = [(x, (x % 7) * 1.0) for x in range(1000)]
+        
+        # Act
+        result = lttb(points, 50)
+        
+        # Assert
+        self.assertEqual(len(result), 50)
+        self.assertEqual(result[0], 0)
+        self.assertEqual(result[-1], 999)
+        self.assertEqual(result, sorted(set(result)))
+        
+    def test_spike_is_kept(self):
+        """Test that an isolated peak survives downsampling"""
+        # Arrange
+        points = [(x, 1.0) for x in range(500)]
+        points[250] = (250, 100.0)
+        
+        # Act
+        result = lttb(points, 10)
+        
+        # Assert
+        self.assertIn(250, result)
+
+        
+    def test_stream_matches_lttb(self):
+        """Test that the streaming variant selects the same points as lttb"""
+        # Arrange
+        points = [(x, ((x * 37) % 101) / 10.0) for x in range(2003)]
+        
+        for threshold in (3, 4, 50, 999, 2002, 5000):
+            # Act
+            streamed = list(lttb_stream(iter(points), len(points), threshold, lambda p: p))
+            
+            # Assert
+            self.assertEqual(streamed, [points[i] for i in lttb(points, threshold)])
+            
+    def test_stream_reads_two_buckets_ahead_at_most(self):
+        """Test that the source is consumed lazily, bucket by bucket"""
+        # Arrange
+        consumed = []
+        def source():
+            for x in range(10000):
+                consumed.append(x)
+                yield (x, float(x % 13))
+        selected = lttb_stream(source(), 10000, 102, lambda p: p)
+        
+        # Act
+        next(selected)
+        next(selected)
+        
+        # Assert
+        self.assertLessEqual(len(consumed), 1 + 2 * 100 + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
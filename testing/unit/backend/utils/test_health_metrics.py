@@ -10,8 +10,15 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from backend.utils.health_metrics import (
     calculate_age,
     calculate_bmi,
-    calculate_health_metrics
+    calculate_health_metrics,
+    calculate_health_metrics_batch,
+    species_thresholds,
+    thresholds_for,
+    calculate_rer,
+    calculate_energy_balance_batch,
+    BMI_THRESHOLDS
 )
+from backend.utils import health_metrics
 
 
 class TestHealthMetrics(unittest.TestCase):
@@ -269,6 +276,123 @@ class TestHealthMetrics(unittest.TestCase):
         self.assertEqual(metrics['height'], 0.0)
         self.assertEqual(metrics['age'], 0)
 
+        
+    def _batch_cases(self):
+        weights = [10, 14, 0, 30, 5, None, 4, 4.5, 20, 3]
+        heights = [0.7, 0.6, 0.5, 1.0, 0.4, 0.5, 0.0, 0.4, 0.8, None]
+        species_ids = [1, 1, 1, 1, 2, 2, 2, 2, 3, None]
+        names = {1: "Dog", 2: "Cat", 3: "Parrot"}  # as stored in species.name
+        return weights, heights, species_ids, names
+        
+    def _assert_batch_matches_scalar(self):
+        weights, heights, species_ids, names = self._batch_cases()
+        thresholds = species_thresholds([(1, "Dog"), (2, "Cat"), (3, "Parrot")])
+        
+        bmis, statuses = calculate_health_metrics_batch(weights, heights, species_ids, thresholds)
+        
+        for i, species_id in enumerate(species_ids):
+            expected = calculate_health_metrics({
+                'weight': weights[i] or 0, 'height': heights[i] or 0, 'species': names.get(species_id, '')
+            })
+            self.assertAlmostEqual(bmis[i], expected['bmi'], places=6)
+            self.assertEqual(statuses[i], expected['status'])
+        return statuses
+        
+    def test_thresholds_for_normalizes_name(self):
+        """Test that stored, typed and missing species names resolve the same way"""
+        # Act & Assert
+        self.assertEqual(thresholds_for("Dog"), BMI_THRESHOLDS["dog"])
+        self.assertEqual(thresholds_for(" cat "), BMI_THRESHOLDS["cat"])
+        self.assertIsNone(thresholds_for("Parrot"))
+        self.assertIsNone(thresholds_for(None))
+        
+    def test_calculate_health_metrics_matches_species_thresholds(self):
+        """Test that the scalar and dashboard paths grade a capitalized name alike"""
+        # Act
+        metrics = calculate_health_metrics({'weight': 10, 'height': 0.7, 'species': 'Dog '})
+        thresholds = species_thresholds([(1, "Dog ")])
+        
+        # Assert
+        self.assertEqual(metrics['status'], 'Healthy')
+        self.assertEqual(thresholds, {1: BMI_THRESHOLDS["dog"]})
+        
+    def test_calculate_health_metrics_species_none(self):
+        """Test that a pet without species is Unknown instead of failing"""
+        # Act
+        metrics = calculate_health_metrics({'weight': 10, 'height': 0.7, 'species': None})
+        
+        # Assert
+        self.assertEqual(metrics['status'], 'Unknown')
+        
+    def test_species_thresholds_by_name(self):
+        """Test that species ids are mapped to thresholds by case-insensitive name"""
+        # Act
+        thresholds = species_thresholds([(1, "Dog"), (2, "CAT"), (3, "Parrot")])
+        
+        # Assert
+        self.assertEqual(thresholds, {1: BMI_THRESHOLDS["dog"], 2: BMI_THRESHOLDS["cat"]})
+        
+    def test_calculate_health_metrics_batch_matches_scalar(self):
+        """Test that the vectorized batch gives the scalar results row by row"""
+        # Act
+        statuses = self._assert_batch_matches_scalar()
+        
+        # Assert
+        self.assertEqual(statuses[:4], ['Healthy', 'Obese', 'Underweight', 'Overweight'])
+        self.assertEqual(statuses[-2:], ['Unknown', 'Unknown'])
+        
+    def test_calculate_health_metrics_batch_without_numpy(self):
+        """Test that the pure-Python fallback gives the same results"""
+        # Act & Assert
+        with patch.object(health_metrics, 'np', None):
+            self._assert_batch_matches_scalar()
+            
+    def test_calculate_health_metrics_batch_boundaries(self):
+        """Test that threshold edges fall in the same band as the scalar function"""
+        # Arrange
+        bmis = [14.99, 15.0, 25.0, 25.01, 30.0, 30.01]
+        
+        # Act
+        _, statuses = calculate_health_metrics_batch(bmis, [1.0] * 6, [1] * 6, {1: BMI_THRESHOLDS["dog"]})
+        
+        # Assert
+        self.assertEqual(statuses, ['Underweight', 'Healthy', 'Healthy', 'Overweight', 'Overweight', 'Obese'])
+
+        
+    def test_calculate_rer(self):
+        """Test the resting energy requirement formula"""
+        # Act & Assert
+        self.assertAlmostEqual(calculate_rer(10), 70 * 10 ** 0.75)
+        self.assertEqual(calculate_rer(0), 0.0)
+        
+    def _energy_balance(self):
+        weights = [10, 10, 10, 4, None, 0]
+        calories = [300, 700, 1000, 0, 500, 200]
+        return calculate_energy_balance_batch(weights, calories)
+        
+    def test_calculate_energy_balance_batch(self):
+        """Test intake bands against RER and pets without a weight"""
+        # Act
+        rers, ratios, statuses = self._energy_balance()
+        
+        # Assert
+        self.assertEqual(rers[0], 393.6)
+        self.assertEqual(ratios[:4], [0.76, 1.78, 2.54, 0.0])
+        self.assertEqual(ratios[4:], [None, None])
+        self.assertEqual(statuses, ['Insufficient', 'Adequate', 'Excessive', 'Insufficient', 'Unknown', 'Unknown'])
+        
+    def test_calculate_energy_balance_batch_without_numpy(self):
+        """Test that the pure-Python fallback gives the same results"""
+        # Arrange
+        expected = self._energy_balance()
+        
+        # Act
+        with patch.object(health_metrics, 'np', None):
+            result = self._energy_balance()
+        
+        # Assert
+        self.assertEqual(result, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
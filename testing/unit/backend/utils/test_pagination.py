@@ -0,0 +1,68 @@
+import unittest
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from fastapi import HTTPException
+from backend.config.settings import settings
+from backend.utils.pagination import encode_cursor, decode_cursor, page_params, trim_page
+
+
+class TestPagination(unittest.TestCase):
+    """Test cases for keyset pagination helpers"""
+    
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes back to the id it was built from"""
+        # Act
+        cursor = encode_cursor(42)
+        
+        # Assert
+        self.assertNotIn("42", cursor)
+        self.assertEqual(decode_cursor(cursor), 42)
+        
+    def test_decode_cursor_invalid(self):
+        """Test that garbage cursors raise ValueError"""
+        # Act & Assert
+        for cursor in ["not-a-cursor", encode_cursor(1)[:-2], ""]:
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+                
+    def test_page_params_invalid_cursor(self):
+        """Test that the dependency answers 400 for a bad cursor"""
+        # Act & Assert
+        with self.assertRaises(HTTPException) as context:
+            page_params(limit=10, cursor="bogus")
+        self.assertEqual(context.exception.status_code, 400)
+        
+    def test_page_params_cursor_without_limit(self):
+        """Test that a cursor alone falls back to the largest page size"""
+        # Act
+        page = page_params(limit=None, cursor=encode_cursor(5))
+        
+        # Assert
+        self.assertEqual(page.limit, settings.PAGE_SIZE_MAX)
+        self.assertEqual(page.after_id, 5)
+        
+    def test_trim_page_with_more_rows(self):
+        """Test that the extra row is dropped and becomes the next cursor"""
+        # Act
+        rows, next_cursor = trim_page([1, 2, 3, 4], 3, key=lambda row: row)
+        
+        # Assert
+        self.assertEqual(rows, [1, 2, 3])
+        self.assertEqual(decode_cursor(next_cursor), 3)
+        
+    def test_trim_page_last_page(self):
+        """Test that the last page has no next cursor"""
+        # Act
+        rows, next_cursor = trim_page([1, 2], 3, key=lambda row: row)
+        
+        # Assert
+        self.assertEqual(rows, [1, 2])
+        self.assertIsNone(next_cursor)
+
+
+if __name__ == '__main__':
+    unittest.main()
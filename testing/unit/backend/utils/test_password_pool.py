@@ -0,0 +1,110 @@
+import unittest
+import asyncio
+import threading
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from backend.utils.password_pool import PasswordPool, PasswordPoolBusy
+
+
+class TestPasswordPool(unittest.TestCase):
+    """Test cases for the bounded password hashing pool"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pool = PasswordPool(max_workers=1, max_queue=0, retry_after=3)
+        
+    def tearDown(self):
+        self.pool.shutdown()
+        
+    def test_hash_and_verify_roundtrip(self):
+        """Test that hashing and verifying through the pool works"""
+        # Act
+        async def scenario():
+            hashed = await self.pool.hash("my_secure_password")
+            return (
+                await self.pool.verify("my_secure_password", hashed),
+                await self.pool.verify("wrong_password", hashed)
+            )
+        valid, invalid = asyncio.run(scenario())
+        
+        # Assert
+        self.assertTrue(valid)
+        self.assertFalse(invalid)
+        
+    def test_rejects_when_saturated(self):
+        """Test that jobs beyond workers + queue are rejected immediately"""
+        # Arrange
+        release = threading.Event()
+        
+        # Act
+        async def scenario():
+            blocking = asyncio.ensure_future(self.pool.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            try:
+                with self.assertRaises(PasswordPoolBusy) as context:
+                    await self.pool.hash("password")
+            finally:
+                release.set()
+                await blocking
+            return context.exception
+        busy = asyncio.run(scenario())
+        
+        # Assert
+        self.assertEqual(busy.retry_after, 3)
+        
+    def test_slot_released_after_job(self):
+        """Test that a finished job frees its slot for the next one"""
+        # Act
+        async def scenario():
+            await self.pool.run(lambda: None)
+            return await self.pool.run(lambda: "done")
+        
+        # Assert
+        self.assertEqual(asyncio.run(scenario()), "done")
+        
+    def test_slot_released_after_error(self):
+        """Test that a failing job still frees its slot"""
+        # Arrange
+        def failing():
+            raise ValueError("boom")
+        
+        # Act
+        async def scenario():
+            with self.assertRaises(ValueError):
+                await self.pool.run(failing)
+            return await self.pool.run(lambda: "done")
+        
+        # Assert
+        self.assertEqual(asyncio.run(scenario()), "done")
+
+        
+    def test_cancelled_request_keeps_slot_until_job_ends(self):
+        """Test that cancelling the await does not free the slot of a running job"""
+        # Arrange
+        started, release = threading.Event(), threading.Event()
+        def slow():
+            started.set()
+            release.wait(5)
+        
+        # Act
+        async def scenario():
+            waiting = asyncio.ensure_future(self.pool.run(slow))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            waiting.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiting
+            with self.assertRaises(PasswordPoolBusy):
+                await self.pool.run(lambda: None)
+            release.set()
+            await asyncio.sleep(0.05)
+            return await self.pool.run(lambda: "done")
+        
+        # Assert
+        self.assertEqual(asyncio.run(scenario()), "done")
+
+if __name__ == '__main__':
+    unittest.main()
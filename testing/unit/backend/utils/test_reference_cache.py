@@ -0,0 +1,228 @@
+import unittest
+from unittest.mock import Mock, patch
+from decimal import Decimal
+import json
+import threading
+import time
+
+# Imports del código a testear
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from backend.utils.reference_cache import ReferenceCache
+from backend.schemas.pet import Species
+from backend.schemas.medical import VaccineOut
+
+
+class TestReferenceCache(unittest.TestCase):
+    """Test cases for the in-process catalog cache"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.cache = ReferenceCache(ttl=60)
+        dog = Mock()
+        dog.species_id = 1
+        dog.name = "Dog"
+        self.loader = Mock(return_value=[dog])
+        
+    def test_get_serializes_rows(self):
+        """Test that rows are stored as a JSON payload"""
+        # Act
+        entry = self.cache.get("species", self.loader, Species)
+        
+        # Assert
+        self.assertEqual(json.loads(entry.payload), [{"species_id": 1, "name": "Dog"}])
+        self.assertEqual(entry.count, 1)
+        
+    def test_get_hit_skips_loader(self):
+        """Test that a cached entry does not reload from the database"""
+        # Act
+        first = self.cache.get("species", self.loader, Species)
+        second = self.cache.get("species", self.loader, Species)
+        
+        # Assert
+        self.loader.assert_called_once()
+        self.assertIs(first, second)
+        
+    def test_get_reloads_after_ttl(self):
+        """Test that expired entries are loaded again"""
+        # Arrange
+        with patch('backend.utils.reference_cache.time') as mock_time:
+            mock_time.monotonic.return_value = 0
+            self.cache.get("species", self.loader, Species)
+            
+            # Act
+            mock_time.monotonic.return_value = 61
+            self.cache.get("species", self.loader, Species)
+        
+        # Assert
+        self.assertEqual(self.loader.call_count, 2)
+        
+    def test_invalidate_prefix(self):
+        """Test that invalidating a prefix drops every keyed entry under it"""
+        # Arrange
+        self.cache.get("breeds:1", self.loader, Species)
+        self.cache.get("breeds:2", self.loader, Species)
+        self.cache.get("species", self.loader, Species)
+        
+        # Act
+        self.cache.invalidate("breeds")
+        self.cache.get("breeds:1", self.loader, Species)
+        self.cache.get("species", self.loader, Species)
+        
+        # Assert
+        self.assertEqual(self.loader.call_count, 4)
+        
+    def test_empty_catalog(self):
+        """Test that an empty table is cached with a zero count"""
+        # Act
+        entry = self.cache.get("species", lambda: [], Species)
+        
+        # Assert
+        self.assertEqual(entry.payload, b"[]")
+        self.assertEqual(entry.count, 0)
+        
+    def test_decimal_columns_serialize_as_numbers(self):
+        """Test that Numeric columns come out as JSON numbers"""
+        # Arrange
+        vaccine = Mock()
+        vaccine.vaccine_id = 1
+        vaccine.name = "Rabies"
+        vaccine.recommended_age = Decimal("0.5")
+        
+        # Act
+        entry = self.cache.get("vaccines", lambda: [vaccine], VaccineOut)
+        
+        # Assert
+        self.assertEqual(json.loads(entry.payload)[0]["recommended_age"], 0.5)
+
+        
+    def test_get_document_single_object(self):
+        """Test that a single object is cached as a JSON object"""
+        # Arrange
+        loader = Mock(return_value={"species_id": 1, "name": "Dog"})
+        
+        # Act
+        first = self.cache.get_document("pet:1", loader, Species)
+        second = self.cache.get_document("pet:1", loader, Species)
+        
+        # Assert
+        self.assertEqual(json.loads(first), {"species_id": 1, "name": "Dog"})
+        self.assertIs(first, second)
+        loader.assert_called_once()
+        
+    def test_get_document_loader_error_is_not_cached(self):
+        """Test that a failing loader leaves no entry behind"""
+        # Arrange
+        loader = Mock(side_effect=[LookupError("missing"), {"species_id": 1, "name": "Dog"}])
+        
+        # Act
+        with self.assertRaises(LookupError):
+            self.cache.get_document("pet:1", loader, Species)
+        payload = self.cache.get_document("pet:1", loader, Species)
+        
+        # Assert
+        self.assertEqual(json.loads(payload)["name"], "Dog")
+
+        
+    def test_misses_on_different_keys_build_in_parallel(self):
+        """Test that a slow build does not block a miss on another key"""
+        # Arrange
+        release = threading.Event()
+        def slow_build():
+            release.wait(5)
+            return "slow"
+        slow = threading.Thread(target=self.cache.get_or_build, args=("pet:1", slow_build))
+        slow.start()
+        time.sleep(0.05)
+        
+        # Act
+        started = time.monotonic()
+        value = self.cache.get_or_build("pet:2", lambda: "fast")
+        elapsed = time.monotonic() - started
+        release.set()
+        slow.join()
+        
+        # Assert
+        self.assertEqual(value, "fast")
+        self.assertLess(elapsed, 1)
+        
+    def test_concurrent_misses_on_one_key_build_once(self):
+        """Test that callers missing the same key share one build"""
+        # Arrange
+        release = threading.Event()
+        build = Mock(side_effect=lambda: release.wait(5) and "dashboard")
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.get_or_build("pet:1", build)))
+            for _ in range(4)
+        ]
+        
+        # Act
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        # Assert
+        build.assert_called_once()
+        self.assertEqual(results, ["dashboard"] * 4)
+        
+    def test_invalidate_during_build_is_not_overwritten(self):
+        """Test that a build racing an invalidation is returned but not cached"""
+        # Arrange
+        def build():
+            self.cache.invalidate("pet:1")
+            return "stale"
+        
+        # Act
+        first = self.cache.get_or_build("pet:1", build)
+        second = self.cache.get_or_build("pet:1", lambda: "fresh")
+        
+        # Assert
+        self.assertEqual(first, "stale")
+        self.assertEqual(second, "fresh")
+        
+    def test_invalidate_other_key_during_build_is_stored(self):
+        """Test that invalidating one pet does not discard another pet's build"""
+        # Arrange
+        build = Mock(side_effect=lambda: self.cache.invalidate("pet:2") or "dashboard")
+        
+        # Act
+        self.cache.get_or_build("pet:1", build)
+        self.cache.get_or_build("pet:1", build)
+        
+        # Assert
+        build.assert_called_once()
+        
+    def test_invalidate_prefix_during_build_is_not_stored(self):
+        """Test that a prefix invalidation also discards a build under it"""
+        # Arrange
+        build = Mock(side_effect=lambda: self.cache.invalidate("pet") or "stale")
+        
+        # Act
+        self.cache.get_or_build("pet:1", build)
+        self.cache.get_or_build("pet:1", build)
+        
+        # Assert
+        self.assertEqual(build.call_count, 2)
+        
+    def test_expired_entries_pruned_on_write(self):
+        """Test that storing an entry drops the ones past their TTL"""
+        # Arrange
+        with patch('backend.utils.reference_cache.time') as mock_time:
+            mock_time.monotonic.return_value = 0
+            self.cache.get_or_build("pet:1", lambda: "old")
+            
+            # Act
+            mock_time.monotonic.return_value = 61
+            self.cache.get_or_build("pet:2", lambda: "new")
+        
+        # Assert
+        self.assertEqual(list(self.cache._entries), ["pet:2"])
+
+if __name__ == '__main__':
+    unittest.main()